@@ -1,3 +1,4 @@
 from .simulator import Simulator, decode_output, count_spikes
 from .predictive_simulator import PredSimulator
+from .engine import SimulationEngine, get_engine, register_engine
 from .helpers import Timing
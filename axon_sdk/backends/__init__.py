@@ -0,0 +1,29 @@
+import warnings
+
+from .numba_kernels import NUMBA_AVAILABLE
+
+# Implementations of the simulation loops, see `resolve_backend`
+BACKENDS = ("python", "numba")
+
+# The fallback to the Python backend is only reported once per process
+_fallback_warned = False
+
+
+def resolve_backend(backend: str) -> str:
+    """
+    Backend actually used for `backend`: "numba" falls back to "python"
+    when numba is not installed, with a `RuntimeWarning` the first time.
+    """
+    global _fallback_warned
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}', use one of {BACKENDS}")
+    if backend == "numba" and not NUMBA_AVAILABLE:
+        if not _fallback_warned:
+            _fallback_warned = True
+            warnings.warn(
+                "numba is not installed, simulating with the Python backend",
+                RuntimeWarning,
+                stacklevel=3,
+            )
+        return "python"
+    return backend
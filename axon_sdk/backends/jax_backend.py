@@ -0,0 +1,320 @@
+"""
+Batched simulation of one network with JAX.
+
+`BatchSimulator` runs many inputs through the same network at once: the
+fixed-dt update of `Simulator` is a `jax.lax.scan` over steps on array-backed
+state, the spikes of the last steps are kept in a ring buffer from which
+each synapse reads the spike of its source neuron its delay ago, and the
+scan is `vmap`ped over the batch. The
+jit-compiled function only depends on array shapes, so it is compiled once
+per network shape, batch size and number of steps.
+
+Results match `Simulator` within rounding: the events of a step are summed
+before being applied, and a delay is rounded to a whole number of steps
+(at least one), where `Simulator` compares the exact delivery times.
+"""
+
+from axon_sdk.primitives import (
+    DataEncoder,
+    ExplicitNeuron,
+    SpikingNetworkModule,
+    SynapseTable,
+)
+from axon_sdk.primitives.elements import SYNAPSE_TYPES
+from axon_sdk.compilation import ExecutionPlan
+from axon_sdk.compilation.compiler import OutputReader
+
+from functools import partial
+from typing import Self
+
+import numpy as np
+
+try:
+    import jax
+    import jax.numpy as jnp
+except ImportError as e:
+    raise ImportError(
+        "The JAX backend needs jax, install it with `pip install axon-sdk[jax]`"
+    ) from e
+
+# Spike times recorded per neuron and run, see `BatchResult`
+MAX_SPIKES = 4
+
+# Delays within this fraction of a step of a multiple of dt are rounded down
+DELAY_ROUNDING = 1e-9
+
+
+def _x64():
+    # Float64 for the duration of a run, like the Python engines
+    if hasattr(jax, "enable_x64"):
+        return jax.enable_x64(True)
+    from jax.experimental import enable_x64
+
+    return enable_x64()
+
+
+def _delivery_steps(times: np.ndarray, dt: float) -> np.ndarray:
+    """
+    Step delivering events at `times`: the first step i whose time (i+1)*dt
+    is not before them, as `Simulator` pops its queue.
+    """
+    steps = np.maximum(np.ceil(times / dt) - 1, 0)
+    steps += (steps + 1) * dt < times
+    steps -= (steps > 0) & (steps * dt >= times)
+    return steps.astype(np.int64)
+
+
+@partial(jax.jit, static_argnames=("num_steps", "ring_size"))
+def _simulate_batch(
+    dt, params, state, synapses, inputs, in_steps, times0, counts0, num_steps, ring_size
+):
+    """
+    Final state, spike times and spike counts of each run; the arguments
+    with a leading batch axis are `in_steps`, `times0` and `counts0`.
+    """
+    Vt, tm, tf, Vreset = params
+    pre, post, types, weights, delay_steps = synapses
+    in_post, in_types, in_weights = inputs
+    slots = jnp.arange(times0.shape[-1])
+
+    def run(in_steps, times0, counts0):
+        def step(carry, i):
+            V, ge, gf, gate, ring, times, counts = carry
+
+            # Events of the step: network spikes due now and input spikes
+            due = ring[(i - delay_steps) % ring_size, pre]
+            arriving = jnp.zeros((Vt.shape[0], len(SYNAPSE_TYPES)))
+            arriving = arriving.at[post, types].add(jnp.where(due, weights, 0.0))
+            inputs_due = jnp.where(in_steps == i, in_weights, 0.0)
+            arriving = arriving.at[in_post, in_types].add(inputs_due)
+            V = V + arriving[:, 0]
+            ge = ge + arriving[:, 1]
+            gf = gf + arriving[:, 2]
+            gate = gate + arriving[:, 3]
+
+            # Forward Euler step of `AbstractNeuron.update_and_spike`
+            V = V + dt * (ge + gate * gf) / tm
+            gf = jnp.where(gate != 0, gf - dt * (gf / tf), gf)
+            spike = V >= Vt
+
+            recorded = spike[:, None] & (slots[None, :] == counts[:, None])
+            times = jnp.where(recorded, (i + 1) * dt, times)
+            counts = counts + spike
+
+            V = jnp.where(spike, Vreset, V)
+            ge = jnp.where(spike, 0.0, ge)
+            gf = jnp.where(spike, 0.0, gf)
+            gate = jnp.where(spike, 0.0, gate)
+
+            ring = ring.at[i % ring_size].set(spike)
+            return (V, ge, gf, gate, ring, times, counts), None
+
+        ring = jnp.zeros((ring_size, Vt.shape[0]), dtype=bool)
+        carry = (*state, ring, times0, counts0)
+        carry, _ = jax.lax.scan(step, carry, jnp.arange(num_steps))
+        V, ge, gf, gate, _, times, counts = carry
+        return V, ge, gf, gate, times, counts
+
+    return jax.vmap(run)(in_steps, times0, counts0)
+
+
+class BatchResult:
+    """
+    Spikes and final state of each run of a batch, as NumPy arrays indexed
+    by run and neuron (in synapse table order).
+
+    Only the first `max_spikes` spike times of a neuron are kept (`inf`
+    pads the unused slots); `spike_counts` counts all of them.
+    """
+
+    def __init__(
+        self,
+        table: SynapseTable,
+        encoder: DataEncoder,
+        spike_times: np.ndarray,
+        spike_counts: np.ndarray,
+        state: dict[str, np.ndarray],
+    ):
+        self.synapse_table = table
+        self.encoder = encoder
+        self.spike_times = spike_times
+        self.spike_counts = spike_counts
+        self.state = state
+
+    def __len__(self) -> int:
+        return self.spike_times.shape[0]
+
+    def spikes_of(self, run: int, neuron: ExplicitNeuron) -> list[float]:
+        idx = self.synapse_table.index_of(neuron)
+        count = min(int(self.spike_counts[run, idx]), self.spike_times.shape[-1])
+        return self.spike_times[run, idx, :count].tolist()
+
+    def decode_output(self, reader: OutputReader) -> np.ndarray:
+        """
+        Signed decoded output of each run, like `decode_output`; nan for runs
+        whose output neurons did not fire exactly twice on one side.
+        """
+        plus = self.synapse_table.index_of(reader.read_neuron_plus)
+        minus = self.synapse_table.index_of(reader.read_neuron_minus)
+        values = np.full(len(self), np.nan)
+        for idx, sign in ((plus, 1.0), (minus, -1.0)):
+            other = minus if idx == plus else plus
+            valid = (self.spike_counts[:, idx] == 2) & (self.spike_counts[:, other] == 0)
+            # Unused slots are inf, their intervals are discarded
+            with np.errstate(invalid="ignore"):
+                interval = self.spike_times[:, idx, 1] - self.spike_times[:, idx, 0]
+            decoded = sign * reader.normalization * self.encoder.decode_interval(interval)
+            values = np.where(valid, decoded, values)
+        return values
+
+
+class BatchSimulator:
+    """
+    Runs batches of input values through one network with JAX (CPU or any
+    device JAX targets), see the module documentation.
+
+    Parameters:
+    net (SpikingNetworkModule): Network to simulate.
+    encoder (DataEncoder): Encoder of the input values and outputs.
+    inputs (list[ExplicitNeuron]): Neurons receiving the input values, in
+        the order of the columns of the values passed to `simulate`.
+    dt (float): Simulation step (ms).
+    max_spikes (int): Spike times recorded per neuron and run.
+    """
+
+    def __init__(
+        self,
+        net: SpikingNetworkModule,
+        encoder: DataEncoder,
+        inputs: list[ExplicitNeuron],
+        dt: float = 0.01,
+        max_spikes: int = MAX_SPIKES,
+    ) -> None:
+        if not inputs:
+            raise ValueError("A batch simulator needs at least one input neuron")
+        self.net = net
+        self.encoder = encoder
+        self.inputs = inputs
+        self.dt = dt
+        self.max_spikes = max_spikes
+        self.synapse_table = table = SynapseTable.from_network(net)
+
+        neurons = table.neurons
+        self._params = tuple(
+            np.array([getattr(n, name) for n in neurons], dtype=np.float64)
+            for name in ("Vt", "tm", "tf", "Vreset")
+        )
+        self._state = tuple(
+            np.array([getattr(n, name) for n in neurons], dtype=np.float64)
+            for name in ("V", "ge", "gf", "gate")
+        )
+
+        offsets = np.array(table.offsets, dtype=np.int64)
+        pre = np.repeat(np.arange(table.num_neurons), np.diff(offsets))
+        self._delays = delays = np.array(table.delays, dtype=np.float64)
+        delay_steps = np.maximum(np.ceil(delays / dt - DELAY_ROUNDING), 1).astype(np.int64)
+        self._synapses = (
+            pre,
+            np.array(table.post, dtype=np.int64),
+            np.array(table.types, dtype=np.int64),
+            np.array(table.weights, dtype=np.float64),
+            delay_steps,
+        )
+        self._ring_size = int(delay_steps.max(initial=0)) + 1
+
+        self._input_idx = [table.index_of(neuron) for neuron in inputs]
+
+    @classmethod
+    def init_with_plan(
+        cls,
+        plan: ExecutionPlan,
+        encoder: DataEncoder,
+        dt: float = 0.01,
+        max_spikes: int = MAX_SPIKES,
+    ) -> Self:
+        """
+        Batch simulator of an execution plan, whose input values are the
+        normalized magnitudes of its inputs (with the signs it was compiled
+        with).
+        """
+        inputs = [trigger.trigger_neuron for trigger in plan.input_triggers]
+        return cls(plan.net, encoder, inputs, dt=dt, max_spikes=max_spikes)
+
+    def _input_spikes(self, values: np.ndarray) -> list[tuple[int, np.ndarray]]:
+        """
+        Input spikes of each run, as `(neuron index, times of shape (batch,))`.
+        """
+        spikes = []
+        for column, idx in enumerate(self._input_idx):
+            intervals = [self.encoder.encode_value(v) for v in values[:, column]]
+            for k in range(2):
+                spikes.append((idx, np.array([interval[k] for interval in intervals])))
+        return spikes
+
+    def _input_events(self, spikes: list[tuple[int, np.ndarray]]):
+        """
+        Fanout of the input spikes, as `Simulator.apply_input_spike` queues it:
+        targets, types and weights, and their delivery step in each run.
+        """
+        offsets = self.synapse_table.offsets
+        _, post, types, weights, _ = self._synapses
+        synapses = [np.arange(offsets[idx], offsets[idx + 1]) for idx, _ in spikes]
+        event_times = np.concatenate(
+            [
+                times[:, None] + self._delays[fanout][None, :]
+                for (_, times), fanout in zip(spikes, synapses)
+            ],
+            axis=1,
+        )
+        synapses = np.concatenate(synapses)
+        inputs = (post[synapses], types[synapses], weights[synapses])
+        return inputs, _delivery_steps(event_times, self.dt)
+
+    def simulate(self, values, simulation_time: float) -> BatchResult:
+        """
+        Simulate each row of `values` for `simulation_time`, each value being
+        applied to its input neuron as a spike interval starting at t=0.
+
+        Parameters:
+        values (array-like): Normalized input values in [0, 1], of shape
+            (batch size, number of inputs).
+        simulation_time (float): Simulated time of each run (ms).
+        """
+        values = np.asarray(values, dtype=np.float64).reshape(-1, len(self.inputs))
+        if ((values < 0.0) | (values > 1.0)).any():
+            raise ValueError("Input value must be between 0.0 and 1.0")
+        batch = len(values)
+        num_neurons = self.synapse_table.num_neurons
+
+        # Input spikes are logged, as `Simulator.apply_input_spike` does
+        spikes = self._input_spikes(values)
+        times0 = np.full((batch, num_neurons, self.max_spikes), np.inf)
+        counts0 = np.zeros((batch, num_neurons), dtype=np.int64)
+        for idx, times in spikes:
+            for run, t in enumerate(times):
+                if counts0[run, idx] < self.max_spikes:
+                    times0[run, idx, counts0[run, idx]] = t
+                counts0[run, idx] += 1
+        inputs, in_steps = self._input_events(spikes)
+
+        with _x64():
+            V, ge, gf, gate, times, counts = _simulate_batch(
+                self.dt,
+                self._params,
+                self._state,
+                self._synapses,
+                inputs,
+                in_steps,
+                times0,
+                counts0,
+                num_steps=int(simulation_time / self.dt),
+                ring_size=self._ring_size,
+            )
+        state = {"V": V, "ge": ge, "gf": gf, "gate": gate}
+        return BatchResult(
+            self.synapse_table,
+            self.encoder,
+            np.asarray(times),
+            np.asarray(counts),
+            {name: np.asarray(array) for name, array in state.items()},
+        )
@@ -0,0 +1,153 @@
+from axon_sdk.primitives import PredictedSpikeEvent, SynapseTable
+from axon_sdk.primitives.elements import ExplicitNeuron
+
+from .numba_kernels import (
+    HIT,
+    PREDICTED_SPIKE,
+    euler_steps,
+    predictive_events,
+)
+
+import heapq
+
+import numpy as np
+
+
+class NetworkArrays:
+    """
+    Neuron state and parameters of a simulator's neurons as NumPy arrays,
+    in synapse table order, and the table itself.
+    """
+
+    def __init__(self, table: SynapseTable):
+        neurons = table.neurons
+        self.neurons = neurons
+        self.V = np.array([n.V for n in neurons], dtype=np.float64)
+        self.ge = np.array([n.ge for n in neurons], dtype=np.float64)
+        self.gf = np.array([n.gf for n in neurons], dtype=np.float64)
+        self.gate = np.array([n.gate for n in neurons], dtype=np.float64)
+        self.last_time = np.array(
+            [n._last_synapse_time for n in neurons], dtype=np.float64
+        )
+        self.Vt = np.array([n.Vt for n in neurons], dtype=np.float64)
+        self.tm = np.array([n.tm for n in neurons], dtype=np.float64)
+        self.tf = np.array([n.tf for n in neurons], dtype=np.float64)
+        self.Vreset = np.array([n.Vreset for n in neurons], dtype=np.float64)
+
+        self.offsets = np.array(table.offsets, dtype=np.int64)
+        self.post = np.array(table.post, dtype=np.int64)
+        self.types = np.array(table.types, dtype=np.int64)
+        self.weights = np.array(table.weights, dtype=np.float64)
+        self.delays = np.array(table.delays, dtype=np.float64)
+
+    def write_back(self) -> None:
+        """
+        Copy the state arrays back to the neuron objects.
+        """
+        for i, neuron in enumerate(self.neurons):
+            neuron.V = float(self.V[i])
+            neuron.ge = float(self.ge[i])
+            neuron.gf = float(self.gf[i])
+            neuron.gate = float(self.gate[i])
+            neuron._last_synapse_time = float(self.last_time[i])
+
+
+def supports_predictive(neurons: list[ExplicitNeuron]) -> bool:
+    # The per-neuron state logs are only kept by the Python loop
+    return all(neuron.log_V is None for neuron in neurons)
+
+
+def run_steps(sim, first_step: int) -> None:
+    """
+    `Simulator._run_steps` with the compiled kernel.
+    """
+    arrays = NetworkArrays(sim.synapse_table)
+    events = sim.event_queue.events
+    capacity = max(2 * len(events), 1024)
+    ht = np.empty(capacity, dtype=np.float64)
+    hp = np.empty(capacity, dtype=np.int64)
+    hy = np.empty(capacity, dtype=np.int64)
+    hw = np.empty(capacity, dtype=np.float64)
+    # A heapq list is a valid binary heap as is
+    for i, (t, post, type_code, weight) in enumerate(events):
+        ht[i], hp[i], hy[i], hw[i] = t, post, type_code, weight
+
+    (ht, hp, hy, hw, size, processed, spike_idx, spike_t, log_idx, log_step, log_V) = (
+        euler_steps(
+            first_step, len(sim.timesteps) - first_step, sim.dt,
+            arrays.V, arrays.ge, arrays.gf, arrays.gate,
+            arrays.Vt, arrays.tm, arrays.tf, arrays.Vreset,
+            arrays.offsets, arrays.post, arrays.types, arrays.weights, arrays.delays,
+            ht, hp, hy, hw, len(events),
+        )
+    )
+
+    arrays.write_back()
+    sim.event_queue.events = list(
+        zip(ht[:size].tolist(), hp[:size].tolist(), hy[:size].tolist(), hw[:size].tolist())
+    )
+    heapq.heapify(sim.event_queue.events)
+    for type_code, count in enumerate(processed.tolist()):
+        sim._processed_counts[type_code] += count
+    for idx, t in zip(spike_idx.tolist(), spike_t.tolist()):
+        sim._log_spike_occurrence(idx, t)
+    # Voltage records grouped by neuron, keeping their step order
+    order = np.argsort(log_idx, kind="stable")
+    neuron_ids, starts = np.unique(log_idx[order], return_index=True)
+    bounds = np.append(starts, len(order)).tolist()
+    steps, voltages = log_step[order].tolist(), log_V[order].tolist()
+    for k, idx in enumerate(neuron_ids.tolist()):
+        start, stop = bounds[k], bounds[k + 1]
+        sim._voltage_lists[idx].extend(zip(voltages[start:stop], steps[start:stop]))
+
+
+def run_events(sim) -> float:
+    """
+    `PredSimulator._run_events` with the compiled kernel.
+    """
+    arrays = NetworkArrays(sim.synapse_table)
+    queue = sim._event_queue
+    index = sim.synapse_table.index
+
+    # Records in the order the Python queue would process them
+    records = []
+    for t in sorted(queue._events_at_time):
+        for item in queue._events_at_time[t]:
+            if isinstance(item, PredictedSpikeEvent):
+                records.append((t, PREDICTED_SPIKE, index[item.neuron], 0, 0.0))
+            else:
+                post, type_code, weight = item
+                records.append((t, HIT, post, type_code, weight))
+    capacity = max(2 * len(records), 1024)
+    times = np.empty(capacity, dtype=np.float64)
+    kinds = np.empty(capacity, dtype=np.int64)
+    targets = np.empty(capacity, dtype=np.int64)
+    rtypes = np.empty(capacity, dtype=np.int64)
+    rweights = np.empty(capacity, dtype=np.float64)
+    for r, (t, kind, target, type_code, weight) in enumerate(records):
+        times[r], kinds[r], targets[r], rtypes[r], rweights[r] = (
+            t, kind, target, type_code, weight
+        )
+
+    processed, spike_idx, spike_t = predictive_events(
+        sim.dt, sim._max_steps,
+        arrays.V, arrays.ge, arrays.gf, arrays.gate, arrays.last_time,
+        arrays.Vt, arrays.tm, arrays.tf, arrays.Vreset,
+        arrays.offsets, arrays.post, arrays.types, arrays.weights, arrays.delays,
+        times, kinds, targets, rtypes, rweights, len(records),
+    )
+
+    arrays.write_back()
+    # The loop runs until the queue is empty
+    queue._time_heap.clear()
+    queue._events_at_time.clear()
+    queue._num_items = 0
+    sim._possible_spike_events_for = [None] * sim.synapse_table.num_neurons
+    for type_code, count in enumerate(processed.tolist()):
+        sim._processed_counts[type_code] += count
+    for idx, t in zip(spike_idx.tolist(), spike_t.tolist()):
+        sim._log_spike_occurrence(idx, t)
+    # The last event is a spike or a hit, which sets the time of its target
+    return max(
+        spike_t.max(initial=sim.time), arrays.last_time.max(initial=sim.time)
+    )
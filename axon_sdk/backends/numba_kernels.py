@@ -0,0 +1,425 @@
+"""
+Numba-compiled simulation loops over array-backed network state.
+
+The kernels reproduce the Python loops of `Simulator._run_steps` and
+`PredSimulator._run_events` operation for operation, so that their results
+are identical: same event order, same floating point expressions. Without
+numba, the kernels are plain Python functions (slow, but usable to check
+them).
+"""
+
+from axon_sdk.primitives.elements import SYNAPSE_TYPES
+
+import math
+
+import numpy as np
+
+try:
+    import numba
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    numba = None
+    NUMBA_AVAILABLE = False
+
+
+def _jit(fn):
+    if NUMBA_AVAILABLE:
+        return numba.njit(cache=True)(fn)
+    return fn
+
+
+# Initial capacity of the growing record and heap arrays
+INITIAL_CAPACITY = 1024
+
+# Codes of the records of the predictive queue
+HIT = 0
+PREDICTED_SPIKE = 1
+
+
+@_jit
+def _grow_float(values, size):
+    grown = np.empty(2 * len(values) + 1, dtype=np.float64)
+    grown[:size] = values[:size]
+    return grown
+
+
+@_jit
+def _grow_int(values, size):
+    grown = np.empty(2 * len(values) + 1, dtype=np.int64)
+    grown[:size] = values[:size]
+    return grown
+
+
+# Binary heap of the time-stepped queue, ordered like its Python tuples
+# `(time, post, type code, weight)`
+
+
+@_jit
+def _event_less(ht, hp, hy, hw, i, j):
+    if ht[i] != ht[j]:
+        return ht[i] < ht[j]
+    if hp[i] != hp[j]:
+        return hp[i] < hp[j]
+    if hy[i] != hy[j]:
+        return hy[i] < hy[j]
+    return hw[i] < hw[j]
+
+
+@_jit
+def _event_swap(ht, hp, hy, hw, i, j):
+    ht[i], ht[j] = ht[j], ht[i]
+    hp[i], hp[j] = hp[j], hp[i]
+    hy[i], hy[j] = hy[j], hy[i]
+    hw[i], hw[j] = hw[j], hw[i]
+
+
+@_jit
+def _event_sift_up(ht, hp, hy, hw, pos):
+    while pos > 0:
+        parent = (pos - 1) >> 1
+        if not _event_less(ht, hp, hy, hw, pos, parent):
+            break
+        _event_swap(ht, hp, hy, hw, pos, parent)
+        pos = parent
+
+
+@_jit
+def _event_sift_down(ht, hp, hy, hw, size, pos):
+    while True:
+        child = 2 * pos + 1
+        if child >= size:
+            break
+        if child + 1 < size and _event_less(ht, hp, hy, hw, child + 1, child):
+            child += 1
+        if not _event_less(ht, hp, hy, hw, child, pos):
+            break
+        _event_swap(ht, hp, hy, hw, pos, child)
+        pos = child
+
+
+@_jit
+def euler_steps(
+    first_step, num_steps, dt, V, ge, gf, gate, Vt, tm, tf, Vreset,
+    offsets, post, types, weights, delays,
+    ht, hp, hy, hw, size,
+):
+    """
+    Time-stepped forward Euler loop of `Simulator._run_steps`.
+
+    The state arrays are updated in place; the heap arrays may be replaced
+    when they grow, and are returned with the records of the run.
+    """
+    n = len(V)
+    processed = np.zeros(len(SYNAPSE_TYPES), dtype=np.int64)
+    spike_idx = np.empty(INITIAL_CAPACITY, dtype=np.int64)
+    spike_t = np.empty(INITIAL_CAPACITY, dtype=np.float64)
+    num_spikes = 0
+    log_idx = np.empty(INITIAL_CAPACITY, dtype=np.int64)
+    log_step = np.empty(INITIAL_CAPACITY, dtype=np.int64)
+    log_V = np.empty(INITIAL_CAPACITY, dtype=np.float64)
+    num_logs = 0
+
+    # Neurons to simulate at this step, and the active ones for the next
+    flagged = np.zeros(n, dtype=np.bool_)
+    selected = np.empty(n, dtype=np.int64)
+    active = np.empty(n, dtype=np.int64)
+    num_active = 0
+    # Conductances left by a previous run
+    for idx in range(n):
+        if ge[idx] != 0.0 or gf[idx] != 0.0 or gate[idx] != 0:
+            active[num_active] = idx
+            num_active += 1
+
+    for i in range(first_step, first_step + num_steps):
+        t = (i + 1) * dt
+        num_selected = 0
+        while size > 0 and ht[0] <= t:
+            p = hp[0]
+            type_code = hy[0]
+            w = hw[0]
+            size -= 1
+            _event_swap(ht, hp, hy, hw, 0, size)
+            _event_sift_down(ht, hp, hy, hw, size, 0)
+
+            if type_code == 0:
+                V[p] += w
+            elif type_code == 1:
+                ge[p] += w
+            elif type_code == 2:
+                gf[p] += w
+            else:
+                gate[p] += w
+            processed[type_code] += 1
+            if not flagged[p]:
+                flagged[p] = True
+                selected[num_selected] = p
+                num_selected += 1
+        for k in range(num_active):
+            idx = active[k]
+            if not flagged[idx]:
+                flagged[idx] = True
+                selected[num_selected] = idx
+                num_selected += 1
+
+        num_active = 0
+        for idx in np.sort(selected[:num_selected]):
+            flagged[idx] = False
+            V[idx] += dt * (ge[idx] + gate[idx] * gf[idx]) / tm[idx]
+            if gate[idx] != 0:
+                gf[idx] -= dt * (gf[idx] / tf[idx])
+            V_after_update = V[idx]
+
+            if V[idx] >= Vt[idx]:
+                if num_spikes == len(spike_idx):
+                    spike_idx = _grow_int(spike_idx, num_spikes)
+                    spike_t = _grow_float(spike_t, num_spikes)
+                spike_idx[num_spikes] = idx
+                spike_t[num_spikes] = t
+                num_spikes += 1
+
+                V[idx] = Vreset[idx]
+                ge[idx] = 0.0
+                gf[idx] = 0.0
+                gate[idx] = 0.0
+                V_after_update = Vreset[idx]
+
+                for s in range(offsets[idx], offsets[idx + 1]):
+                    if size == len(ht):
+                        ht = _grow_float(ht, size)
+                        hp = _grow_int(hp, size)
+                        hy = _grow_int(hy, size)
+                        hw = _grow_float(hw, size)
+                    ht[size] = t + delays[s]
+                    hp[size] = post[s]
+                    hy[size] = types[s]
+                    hw[size] = weights[s]
+                    _event_sift_up(ht, hp, hy, hw, size)
+                    size += 1
+
+            if num_logs == len(log_idx):
+                log_idx = _grow_int(log_idx, num_logs)
+                log_step = _grow_int(log_step, num_logs)
+                log_V = _grow_float(log_V, num_logs)
+            log_idx[num_logs] = idx
+            log_step[num_logs] = i
+            log_V[num_logs] = V_after_update
+            num_logs += 1
+
+            if ge[idx] != 0.0 or gf[idx] != 0.0 or gate[idx] != 0:
+                active[num_active] = idx
+                num_active += 1
+
+    return (
+        ht, hp, hy, hw, size, processed,
+        spike_idx[:num_spikes], spike_t[:num_spikes],
+        log_idx[:num_logs], log_step[:num_logs], log_V[:num_logs],
+    )
+
+
+# Heap of the predictive queue: record ids ordered by (time, id), ids being
+# given in insertion order like the buckets of `CancelableEventQueue`
+
+
+@_jit
+def _record_less(times, heap, i, j):
+    a, b = heap[i], heap[j]
+    if times[a] != times[b]:
+        return times[a] < times[b]
+    return a < b
+
+
+@_jit
+def _record_sift_up(times, heap, pos):
+    while pos > 0:
+        parent = (pos - 1) >> 1
+        if not _record_less(times, heap, pos, parent):
+            break
+        heap[pos], heap[parent] = heap[parent], heap[pos]
+        pos = parent
+
+
+@_jit
+def _record_sift_down(times, heap, size, pos):
+    while True:
+        child = 2 * pos + 1
+        if child >= size:
+            break
+        if child + 1 < size and _record_less(times, heap, child + 1, child):
+            child += 1
+        if not _record_less(times, heap, child, pos):
+            break
+        heap[pos], heap[child] = heap[child], heap[pos]
+        pos = child
+
+
+@_jit
+def _predict_spike_steps_fixed(V0, ge, gf, gate, tm, tf, Vt, max_steps, dt):
+    # Same bisection as `PredSimulator._predict_spike_steps_fixed`; -1 for None
+    lo, hi = 0, max_steps
+    for _ in range(64):
+        mid = (lo + hi) // 2
+        t = mid * dt
+        exp_decay = 1 - math.exp(-t / tf)
+        V = V0 + (ge / tm) * t + (gate * gf * tf / tm) * exp_decay
+        if V >= Vt:
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo * dt if lo < max_steps else -1.0
+
+
+@_jit
+def predictive_events(
+    dt, max_steps, V, ge, gf, gate, last_time, Vt, tm, tf, Vreset,
+    offsets, post, types, weights, delays,
+    times, kinds, targets, rtypes, rweights, num_records,
+):
+    """
+    Event loop of `PredSimulator._run_events`.
+
+    The queue is given as records `(time, kind, neuron, type code, weight)`
+    in insertion order; kind is `HIT` or `PREDICTED_SPIKE`. The state arrays
+    are updated in place.
+    """
+    n = len(V)
+    processed = np.zeros(len(SYNAPSE_TYPES), dtype=np.int64)
+    spike_idx = np.empty(INITIAL_CAPACITY, dtype=np.int64)
+    spike_t = np.empty(INITIAL_CAPACITY, dtype=np.float64)
+    num_spikes = 0
+
+    alive = np.ones(len(times), dtype=np.bool_)
+    heap = np.empty(len(times), dtype=np.int64)
+    size = 0
+    for r in range(num_records):
+        heap[size] = r
+        _record_sift_up(times, heap, size)
+        size += 1
+    num_alive = num_records
+    # Record of the pending predicted spike of each neuron, -1 for None
+    predicted = np.full(n, -1, dtype=np.int64)
+    group = np.empty(INITIAL_CAPACITY, dtype=np.int64)
+
+    while num_alive > 0:
+        # Earliest group of records sharing a time, skipping cancelled ones
+        num_group = 0
+        t = 0.0
+        while num_group == 0:
+            t = times[heap[0]]
+            while size > 0 and times[heap[0]] == t:
+                r = heap[0]
+                size -= 1
+                heap[0] = heap[size]
+                _record_sift_down(times, heap, size, 0)
+                if alive[r]:
+                    if num_group == len(group):
+                        group = _grow_int(group, num_group)
+                    group[num_group] = r
+                    num_group += 1
+        num_alive -= num_group
+
+        for g in range(num_group):
+            r = group[g]
+            if kinds[r] != PREDICTED_SPIKE:
+                continue
+            idx = targets[r]
+            V[idx] = Vreset[idx]
+            ge[idx] = 0.0
+            gf[idx] = 0.0
+            gate[idx] = 0.0
+            for s in range(offsets[idx], offsets[idx + 1]):
+                if num_records == len(times):
+                    times = _grow_float(times, num_records)
+                    kinds = _grow_int(kinds, num_records)
+                    targets = _grow_int(targets, num_records)
+                    rtypes = _grow_int(rtypes, num_records)
+                    rweights = _grow_float(rweights, num_records)
+                    alive = _grow_bool(alive, num_records)
+                    heap = _grow_int(heap, size)
+                times[num_records] = times[r] + delays[s]
+                kinds[num_records] = HIT
+                targets[num_records] = post[s]
+                rtypes[num_records] = types[s]
+                rweights[num_records] = weights[s]
+                alive[num_records] = True
+                heap[size] = num_records
+                _record_sift_up(times, heap, size)
+                size += 1
+                num_records += 1
+                num_alive += 1
+            predicted[idx] = -1
+            if num_spikes == len(spike_idx):
+                spike_idx = _grow_int(spike_idx, num_spikes)
+                spike_t = _grow_float(spike_t, num_spikes)
+            spike_idx[num_spikes] = idx
+            spike_t[num_spikes] = times[r]
+            num_spikes += 1
+
+        for g in range(num_group):
+            r = group[g]
+            if kinds[r] != HIT:
+                continue
+            p = targets[r]
+            type_code = rtypes[r]
+            w = rweights[r]
+            if predicted[p] >= 0 and alive[predicted[p]]:
+                alive[predicted[p]] = False
+                num_alive -= 1
+            predicted[p] = -1
+
+            # `ExplicitNeuron.receive_synaptic_event_pred`
+            if t != last_time[p]:
+                interval = t - last_time[p]
+                decay = math.exp(-interval / tf[p])
+                new_V = V[p] + (ge[p] / tm[p]) * interval
+                new_gf = gf[p] * decay
+                if gate[p] != 0:
+                    new_V += (gf[p] * tf[p] / tm[p]) * (1 - decay)
+                V[p] = new_V
+                gf[p] = new_gf
+                last_time[p] = t
+            if type_code == 0:
+                V[p] += w
+            elif type_code == 1:
+                ge[p] += w
+            elif type_code == 2:
+                gf[p] += w
+            else:
+                gate[p] += w
+
+            gated_gf = gf[p] if gate[p] != 0 else 0.0
+            new_spike_time = _predict_spike_steps_fixed(
+                V[p], ge[p], gated_gf, gate[p], tm[p], tf[p], Vt[p], max_steps, dt
+            )
+            processed[type_code] += 1
+
+            if new_spike_time >= 0:
+                if num_records == len(times):
+                    times = _grow_float(times, num_records)
+                    kinds = _grow_int(kinds, num_records)
+                    targets = _grow_int(targets, num_records)
+                    rtypes = _grow_int(rtypes, num_records)
+                    rweights = _grow_float(rweights, num_records)
+                    alive = _grow_bool(alive, num_records)
+                    heap = _grow_int(heap, size)
+                times[num_records] = t + new_spike_time
+                kinds[num_records] = PREDICTED_SPIKE
+                targets[num_records] = p
+                rtypes[num_records] = 0
+                rweights[num_records] = 0.0
+                alive[num_records] = True
+                heap[size] = num_records
+                _record_sift_up(times, heap, size)
+                predicted[p] = num_records
+                size += 1
+                num_records += 1
+                num_alive += 1
+
+    return processed, spike_idx[:num_spikes], spike_t[:num_spikes]
+
+
+@_jit
+def _grow_bool(values, size):
+    grown = np.empty(2 * len(values) + 1, dtype=np.bool_)
+    grown[:size] = values[:size]
+    return grown
@@ -0,0 +1,168 @@
+"""
+Snapshots of a simulation, to restore it or fork runs from a common prefix.
+
+`SimulationEngine.checkpoint()` captures the state of a run: neuron state
+and state logs, pending events, spikes, voltage log, processed event counts
+and simulated time. `restore()` puts an engine of the same kind, on the same
+network or on a copy of it, back in that state, so that scenarios sharing a
+prefix only simulate it once:
+
+    sim.simulate(100)  # e.g. loading memories
+    prefix = sim.checkpoint()
+    for t in recall_times:
+        sim.restore(prefix)
+        sim.apply_input_spike(recall, t)
+        sim.simulate(300)
+
+Neurons are identified by their synapse table index, so a checkpoint saved
+to a file can be restored on a network rebuilt or loaded with
+`axon_sdk.serialization`. Run statistics (`stats`) are not part of it.
+"""
+
+from axon_sdk.primitives import ExplicitNeuron
+from axon_sdk.primitives.sinks import SPIKE_RECORD_DTYPE
+
+import json
+
+import numpy as np
+
+# Pending events of the engine queues
+QUEUE_RECORD_DTYPE = np.dtype(
+    [
+        ("time", "<f8"),
+        ("kind", "<i1"),
+        ("target", "<i4"),
+        ("type", "<i1"),
+        ("weight", "<f8"),
+    ]
+)
+# Kinds of queue records: synaptic hits and predicted spikes (`PredSimulator`)
+HIT = 0
+PREDICTED_SPIKE = 1
+
+# `(V, step)` entries of the voltage log, by neuron
+VOLTAGE_RECORD_DTYPE = np.dtype([("neuron", "<i4"), ("V", "<f8"), ("step", "<i8")])
+
+# `(value, t)` entries of the per-neuron state logs
+STATE_LOG_DTYPE = np.dtype([("neuron", "<i4"), ("value", "<f8"), ("t", "<f8")])
+
+STATE_LOGS = ("log_V", "log_ge", "log_gf")
+
+# Columns of the neuron state array
+NEURON_STATE = ("V", "ge", "gf", "gate", "_last_synapse_time")
+
+
+class Checkpoint:
+    """
+    State of a simulation: a JSON-serializable `header` (engine, dt, time,
+    counts) and NumPy `arrays`, indexed by synapse table order.
+
+    Use `save()` / `Checkpoint.load()` to keep it in a file.
+    """
+
+    def __init__(self, header: dict, arrays: dict[str, np.ndarray]):
+        self.header = header
+        self.arrays = arrays
+
+    @property
+    def time(self) -> float:
+        return self.header["time"]
+
+    def save(self, path: str) -> None:
+        """
+        Write the checkpoint to `path`, a NumPy `.npz` archive.
+        """
+        with open(path, "wb") as f:
+            np.savez(
+                f,
+                allow_pickle=False,
+                header=np.array(json.dumps(self.header)),
+                **self.arrays,
+            )
+
+    @classmethod
+    def load(cls, path: str) -> "Checkpoint":
+        with np.load(path) as archive:
+            header = json.loads(str(archive["header"]))
+            arrays = {name: archive[name] for name in archive.files if name != "header"}
+        return cls(header, arrays)
+
+
+def neuron_state(neurons: list[ExplicitNeuron]) -> dict[str, np.ndarray]:
+    """
+    State and state logs of `neurons` as checkpoint arrays.
+    """
+    arrays: dict[str, np.ndarray] = {
+        "state": np.array(
+            [[getattr(n, name) for name in NEURON_STATE] for n in neurons],
+            dtype=np.float64,
+        ).reshape(len(neurons), len(NEURON_STATE)),
+        "logged": np.array(
+            [i for i, n in enumerate(neurons) if n.log_V is not None], dtype=np.int32
+        ),
+    }
+    for name in STATE_LOGS:
+        arrays[name] = np.array(
+            [
+                (i, value, t)
+                for i, n in enumerate(neurons)
+                for value, t in getattr(n, name) or ()
+            ],
+            dtype=STATE_LOG_DTYPE,
+        )
+    return arrays
+
+
+def restore_neuron_state(neurons: list[ExplicitNeuron], arrays: dict) -> None:
+    for n, row in zip(neurons, arrays["state"].tolist()):
+        for name, value in zip(NEURON_STATE, row):
+            setattr(n, name, value)
+    logged = set(arrays["logged"].tolist())
+    for i, n in enumerate(neurons):
+        for name in STATE_LOGS:
+            setattr(n, name, [] if i in logged else None)
+    for name in STATE_LOGS:
+        records = arrays[name]
+        for i, value, t in zip(
+            records["neuron"].tolist(), records["value"].tolist(), records["t"].tolist()
+        ):
+            getattr(neurons[i], name).append((value, t))
+
+
+def log_records(
+    spike_sink, sink_ids: list[int], voltage_lists: list[list[tuple]]
+) -> dict[str, np.ndarray]:
+    """
+    Spikes (in time order) and voltage log entries as checkpoint arrays.
+    """
+    uids = spike_sink.uids
+    spikes = [
+        (i, t)
+        for i, sink_id in enumerate(sink_ids)
+        for t in spike_sink.spikes_of(uids[sink_id])
+    ]
+    spikes.sort(key=lambda spike: spike[1])
+    return {
+        "spikes": np.array(spikes, dtype=SPIKE_RECORD_DTYPE),
+        "voltage": np.array(
+            [(i, V, step) for i, log in enumerate(voltage_lists) for V, step in log],
+            dtype=VOLTAGE_RECORD_DTYPE,
+        ),
+    }
+
+
+def restore_logs(
+    spike_sink, sink_ids: list[int], voltage_lists: list[list[tuple]], arrays: dict
+) -> None:
+    spike_sink.clear()
+    spikes = arrays["spikes"]
+    for i, t in zip(spikes["neuron"].tolist(), spikes["time"].tolist()):
+        spike_sink.record_id(sink_ids[i], t)
+    # In place, the engine's voltage_log dict holds the same lists
+    for log in voltage_lists:
+        log.clear()
+    voltage = arrays["voltage"]
+    for i, V, step in zip(
+        voltage["neuron"].tolist(), voltage["V"].tolist(), voltage["step"].tolist()
+    ):
+        voltage_lists[i].append((V, step))
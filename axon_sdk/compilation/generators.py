@@ -0,0 +1,217 @@
+from .scalar import Scalar, OpType, trace
+
+import math
+import random
+
+from typing import Optional
+
+# The values stay inside the compiler range, away from zero: the compiler
+# normalizes them by `max_range` and can't encode an exact zero. Products are
+# kept above `max_range * MIN_PRODUCT`, below which the multiplier module
+# loses its precision.
+MIN_PRODUCT = 0.01
+
+
+def _signed(rng: random.Random, low: float, high: float, sign: int = 0) -> float:
+    """
+    Uniform magnitude in [low, high], with the given sign or a random one.
+    """
+    magnitude = rng.uniform(low, high)
+    if sign == 0:
+        sign = 1 if rng.random() < 0.5 else -1
+    return sign * magnitude
+
+
+def check_range(root: Scalar, max_range: float = 100.0) -> None:
+    """
+    Raise ValueError if a value of the graph can't be compiled with `max_range`.
+    """
+    nodes, _ = trace(root)
+    for node in nodes:
+        if node.data == 0 or abs(node.data) > max_range:
+            raise ValueError(
+                f"Value {node.data} of the graph is outside the compiler range "
+                f"(0, {max_range}]; try another seed or a smaller size"
+            )
+        if node.op == OpType.Mul and abs(node.data) < max_range * MIN_PRODUCT:
+            raise ValueError(
+                f"Product {node.data} is below the multiplier precision; "
+                "try another seed or a smaller size"
+            )
+
+
+def balanced_sum(terms: list[Scalar]) -> Scalar:
+    """
+    Pairwise sum of `terms`, keeping the graph depth logarithmic.
+    """
+    if not terms:
+        raise ValueError("Cannot sum an empty list of terms")
+    while len(terms) > 1:
+        pairs = [terms[i] + terms[i + 1] for i in range(0, len(terms) - 1, 2)]
+        terms = pairs + terms[len(pairs) * 2 :]
+    return terms[0]
+
+
+def _operand_bounds(max_range: float) -> tuple[float, float]:
+    # Magnitudes whose products lie in [max_range * MIN_PRODUCT, 4x that]
+    low = math.sqrt(max_range * MIN_PRODUCT)
+    return low, 2 * low
+
+
+def dot_product(
+    n: int, seed: int = 0, max_range: float = 100.0
+) -> tuple[Scalar, float]:
+    """
+    Dot product of two random vectors of size `n`.
+
+    Consecutive products have opposite signs, so that partial sums grow like
+    a random walk. Returns the root of the expression and its exact value.
+    """
+    rng = random.Random(seed)
+    low, high = _operand_bounds(max_range)
+    x = [_signed(rng, low, high) for _ in range(n)]
+    w = [_signed(rng, low, high, sign=(1 if xi > 0 else -1) * (-1) ** i) for i, xi in enumerate(x)]
+
+    root = balanced_sum([Scalar(xi) * Scalar(wi) for xi, wi in zip(x, w)])
+    check_range(root, max_range)
+    return root, math.fsum(xi * wi for xi, wi in zip(x, w))
+
+
+def matmul(n: int, seed: int = 0, max_range: float = 100.0) -> tuple[Scalar, float]:
+    """
+    Sum of the entries of the product of two random NxN matrices.
+
+    Entries of A and B are loaded once and shared by all the products that
+    use them, so the graph has N^3 multiplications over 2 N^2 inputs.
+    """
+    rng = random.Random(seed)
+    low, high = _operand_bounds(max_range)
+    # Alternating signs along k make consecutive products cancel out
+    A = [[_signed(rng, low, high, sign=(-1) ** k) for k in range(n)] for _ in range(n)]
+    B = [[_signed(rng, low, high, sign=1) for _ in range(n)] for _ in range(n)]
+    A_nodes = [[Scalar(a) for a in row] for row in A]
+    B_nodes = [[Scalar(b) for b in row] for row in B]
+
+    products = [
+        A_nodes[i][k] * B_nodes[k][j]
+        for i in range(n)
+        for j in range(n)
+        for k in range(n)
+    ]
+    root = balanced_sum(products)
+    check_range(root, max_range)
+    expected = math.fsum(
+        A[i][k] * B[k][j] for i in range(n) for j in range(n) for k in range(n)
+    )
+    return root, expected
+
+
+def polynomial(
+    degree: int, x: Optional[float] = None, seed: int = 0, max_range: float = 100.0
+) -> tuple[Scalar, float]:
+    """
+    Random polynomial of the given degree evaluated at `x` with Horner's rule.
+
+    `x` defaults to a random value with magnitude in [0.5, 0.9]. Each
+    coefficient has the sign of the product it is added to, so the partial
+    results stay between the smallest coefficient and 10x the largest one.
+    """
+    rng = random.Random(seed)
+    if x is None:
+        x = _signed(rng, 0.5, 0.9)
+    if not 0.5 <= abs(x) <= 0.9:
+        raise ValueError(f"|x| must be inside [0.5, 0.9], got {x}")
+    low, high = 2 * max_range * MIN_PRODUCT, max_range / 20
+
+    x_node = Scalar(x)
+    expected = _signed(rng, low, high)
+    root = Scalar(expected)
+    for _ in range(degree):
+        product = expected * x
+        c = _signed(rng, low, high, sign=1 if product > 0 else -1)
+        root = root * x_node + Scalar(c)
+        expected = product + c
+    check_range(root, max_range)
+    return root, expected
+
+
+def fir_filter(
+    taps: int, outputs: int = 1, seed: int = 0, max_range: float = 100.0
+) -> tuple[Scalar, float]:
+    """
+    Sum of `outputs` consecutive samples of a random K-tap FIR filter.
+
+    The input samples are shared between the output samples, as in a
+    streaming filter: y[n] = sum_k h[k] * x[n - k].
+    """
+    rng = random.Random(seed)
+    low, high = _operand_bounds(max_range)
+    h = [_signed(rng, low, high, sign=(-1) ** k) for k in range(taps)]
+    x = [_signed(rng, low, high, sign=1) for _ in range(taps + outputs - 1)]
+    h_nodes = [Scalar(v) for v in h]
+    x_nodes = [Scalar(v) for v in x]
+
+    samples = []
+    expected = []
+    for n in range(taps - 1, taps - 1 + outputs):
+        samples.append(balanced_sum([h_nodes[k] * x_nodes[n - k] for k in range(taps)]))
+        expected.append(math.fsum(h[k] * x[n - k] for k in range(taps)))
+    root = balanced_sum(samples)
+    check_range(root, max_range)
+    return root, math.fsum(expected)
+
+
+def random_expression(
+    num_ops: int,
+    width: int = 8,
+    seed: int = 0,
+    mul_ratio: float = 0.3,
+    neg_ratio: float = 0.1,
+    max_range: float = 100.0,
+) -> tuple[Scalar, float]:
+    """
+    Random expression DAG of `num_ops` operations.
+
+    The expression grows `width` chains. Each operation extends a random
+    chain with its result, taking the second operand among the inputs and all
+    previous results, so the compiled network is a random composition of
+    adder, multiplier and sign flipper STICK modules with shared fan-out and a
+    depth of about `num_ops / width`. The chains are summed into the root.
+    """
+    rng = random.Random(seed)
+    # The chains are summed at the end, so each one stays below this bound
+    limit = max_range / (2 * width)
+    min_product = max_range * MIN_PRODUCT
+    low, high = _operand_bounds(max_range)
+
+    def fresh() -> tuple[Scalar, float]:
+        value = _signed(rng, low, min(high, limit))
+        return Scalar(value), value
+
+    chains = [fresh() for _ in range(width)]
+    operands = list(chains)
+
+    for _ in range(num_ops):
+        c = rng.randrange(width)
+        a, va = chains[c]
+        b, vb = rng.choice(operands) if rng.random() < 0.5 else fresh()
+
+        r = rng.random()
+        if r < neg_ratio:
+            result = (-a, -va)
+        elif r < neg_ratio + mul_ratio and min_product <= abs(va * vb) <= limit:
+            result = (a * b, va * vb)
+        elif 0 < abs(va + vb) <= limit:
+            result = (a + b, va + vb)
+        elif 0 < abs(va - vb) <= limit:
+            result = (a - b, va - vb)
+        else:
+            # Negation always stays in range
+            result = (-a, -va)
+
+        chains[c] = result
+        operands.append(result)
+
+    root = balanced_sum([node for node, _ in chains])
+    check_range(root, max_range)
+    return root, math.fsum(value for _, value in chains)
@@ -21,6 +21,8 @@ class OpType(Enum):
 
 
 class Scalar:
+    __slots__ = ("data", "prev", "op")
+
     def __init__(self, data, prev=(), op=OpType.Load):
         self.data = data
         self.prev = prev
@@ -118,17 +120,27 @@ class Scalar:
 
 def trace(root) -> tuple[list[Scalar], list[tuple[Scalar, Scalar]]]:
     # traces the full graph of nodes and edges starting from the root
+    # (depth-first, nodes in visiting order; iterative for deep graphs)
     nodes, edges = [], []
+    seen_nodes, seen_edges = set(), set()
+
+    seen_nodes.add(root)
+    nodes.append(root)
+    stack = [(root, iter(root.prev))]
+    while stack:
+        v, parents = stack[-1]
+        parent = next(parents, None)
+        if parent is None:
+            stack.pop()
+            continue
+        if (parent, v) not in seen_edges:
+            seen_edges.add((parent, v))
+            edges.append((parent, v))
+        if parent not in seen_nodes:
+            seen_nodes.add(parent)
+            nodes.append(parent)
+            stack.append((parent, iter(parent.prev)))
 
-    def build(v):
-        if v not in nodes:
-            nodes.append(v)
-            for parent in v.prev:
-                if (parent, v) not in edges:
-                    edges.append((parent, v))
-                build(parent)
-
-    build(root)
     return nodes, edges
 
 
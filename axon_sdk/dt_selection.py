@@ -0,0 +1,365 @@
+from axon_sdk.primitives import (
+    DataEncoder,
+    ExplicitNeuron,
+    SpikingNetworkModule,
+    standalone_copy,
+)
+from axon_sdk.compilation import ExecutionPlan
+from .simulator import Simulator
+from .predictive_simulator import PredSimulator
+from .usagereport.calibration import (
+    MIN_INPUT,
+    MAX_INPUT,
+    driver_for,
+    module_signature,
+)
+
+import json
+import math
+import os
+import random
+
+from typing import Optional, Union
+
+# Cache format version, bumped when entries change meaning
+DT_CACHE_VERSION = 2
+
+# Steps tried by `select_dt`, coarsest first (ms)
+DT_CANDIDATES = (1.0, 0.5, 0.2, 0.1, 0.05, 0.02, 0.01, 0.005, 0.002, 0.001)
+
+# Step of the reference runs, with the exact integration of `Simulator` (ms):
+# beyond rounding, its results don't depend on the step
+REFERENCE_DT = 0.01
+
+# Prediction grid of the PredSimulator runs that set the simulated time of
+# the references (ms)
+DURATION_DT = 1e-4
+
+# Time simulated after the last reference spike, relative to its time
+SIMULATION_MARGIN = 0.1
+
+# An output is a `(plus neuron, minus neuron or None, normalization)` triple
+Output = tuple[ExplicitNeuron, Optional[ExplicitNeuron], float]
+
+
+class DtSelection:
+    """
+    Outcome of `select_dt`: the coarsest step whose decoded outputs stay
+    within `tolerance` of the reference on every sample, and the worst error
+    of each candidate tried (`inf` when an output is missing or malformed).
+    """
+
+    def __init__(
+        self,
+        dt: Optional[float],
+        engine: str,
+        integration: Optional[str],
+        tolerance: float,
+        samples: int,
+        errors: dict[float, float],
+    ):
+        self.dt = dt
+        self.engine = engine
+        self.integration = integration
+        self.tolerance = tolerance
+        self.samples = samples
+        self.errors = errors
+
+    @property
+    def max_error(self) -> Optional[float]:
+        return None if self.dt is None else self.errors[self.dt]
+
+    def as_dict(self) -> dict:
+        return {
+            "dt": self.dt,
+            "engine": self.engine,
+            "integration": self.integration,
+            "tolerance": self.tolerance,
+            "samples": self.samples,
+            # JSON keys are strings
+            "errors": {repr(dt): error for dt, error in self.errors.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "DtSelection":
+        return cls(
+            dt=data["dt"],
+            engine=data["engine"],
+            integration=data["integration"],
+            tolerance=data["tolerance"],
+            samples=data["samples"],
+            errors={float(dt): error for dt, error in data["errors"].items()},
+        )
+
+    def print(self) -> None:
+        engine = self.engine + (f" ({self.integration})" if self.integration else "")
+        print(f"dt selection for {engine}, tolerance {self.tolerance:g}:")
+        for dt, error in self.errors.items():
+            mark = " <- selected" if dt == self.dt else ""
+            print(f"  dt={dt:<8g} max error {error:.3g}{mark}")
+        if self.dt is None:
+            print("  No candidate is accurate enough")
+
+
+def default_dt_cache_path() -> str:
+    cache_dir = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_dir, "axon_sdk", "dt.json")
+
+
+class DtCache:
+    """
+    `DtSelection`s keyed by network signature and search settings, cached
+    as JSON in `path` (None keeps them in memory only).
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        self.path = path
+        self.entries: dict[str, dict] = {}
+        if path is not None and os.path.exists(path):
+            with open(path) as f:
+                data = json.load(f)
+            if data.get("version") == DT_CACHE_VERSION:
+                self.entries = data["entries"]
+
+    @classmethod
+    def default(cls) -> "DtCache":
+        return cls(default_dt_cache_path())
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"version": DT_CACHE_VERSION, "entries": self.entries}, f)
+        os.replace(tmp_path, self.path)
+
+    def get(self, key: str) -> Optional[DtSelection]:
+        entry = self.entries.get(key)
+        return None if entry is None else DtSelection.from_dict(entry)
+
+    def put(self, key: str, selection: DtSelection) -> None:
+        self.entries[key] = selection.as_dict()
+        self.save()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+def output_neurons(mod: SpikingNetworkModule) -> list[ExplicitNeuron]:
+    """
+    Output neurons of a module, by the naming convention of the library:
+    neuron attributes (or lists of neurons) whose name starts with 'out'.
+    """
+    outputs: list[ExplicitNeuron] = []
+    for name, value in vars(mod).items():
+        if not name.startswith("out"):
+            continue
+        if isinstance(value, ExplicitNeuron):
+            outputs.append(value)
+        elif isinstance(value, (list, tuple)):
+            outputs.extend(v for v in value if isinstance(v, ExplicitNeuron))
+    return outputs
+
+
+def _decode(sim, output: Output, copies: dict, encoder: DataEncoder) -> Optional[float]:
+    """
+    Signed decoded value of an output, None if it did not spike and nan if
+    its spikes don't encode a value.
+    """
+    plus, minus, norm = output
+    spikes_plus = sim.spike_sink.spikes_of(copies[plus].uid)
+    spikes_minus = sim.spike_sink.spikes_of(copies[minus].uid) if minus else []
+    if not spikes_plus and not spikes_minus:
+        return None
+    if len(spikes_plus) == 2 and not spikes_minus:
+        return norm * encoder.decode_interval(spikes_plus[1] - spikes_plus[0])
+    if len(spikes_minus) == 2 and not spikes_plus:
+        return -norm * encoder.decode_interval(spikes_minus[1] - spikes_minus[0])
+    return math.nan
+
+
+def _error(value: Optional[float], reference: Optional[float]) -> float:
+    if value is None or reference is None:
+        return 0.0 if value is reference else math.inf
+    error = abs(value - reference)
+    # nan on either side: a malformed output
+    return error if error == error else math.inf
+
+
+def _samples(target, samples: int, seed: int) -> list[list[tuple]]:
+    """
+    Inputs of each sample, as `(neuron, value)` intervals at t=0 and
+    `(neuron, None, t)` single spikes.
+    """
+    rng = random.Random(seed)
+    if isinstance(target, ExecutionPlan):
+        # The inputs of the plan, then random magnitudes of the same signs
+        inputs = [
+            (trigger.trigger_neuron, trigger.normalized_value)
+            for trigger in target.input_triggers
+        ]
+        drawn = [
+            [(neuron, rng.uniform(MIN_INPUT, MAX_INPUT)) for neuron, _ in inputs]
+            for _ in range(samples - 1)
+        ]
+        return [inputs] + drawn
+
+    driver = driver_for(target)
+    if driver is None:
+        raise ValueError(
+            f"No input driver for module {target.uid} of class "
+            f"{type(target).__name__}; add one with register_input_driver()"
+        )
+    return [driver(target, rng) for _ in range(samples)]
+
+
+def _run(
+    net: SpikingNetworkModule,
+    inputs: list[tuple],
+    encoder: DataEncoder,
+    engine: type,
+    dt: float,
+    integration: Optional[str],
+    simulation_time: Optional[float],
+):
+    # Networks hold their state, so every run gets fresh neurons
+    copy, copies = standalone_copy(net)
+    if engine is PredSimulator:
+        sim = PredSimulator(copy, encoder, dt=dt)
+    else:
+        sim = engine(copy, encoder, dt=dt, integration=integration)
+    for neuron, value, *t in inputs:
+        if value is None:
+            sim.apply_input_spike(copies[neuron], t=t[0])
+        else:
+            sim.apply_input_value(value, copies[neuron], t0=0)
+    if engine is PredSimulator:
+        sim.simulate()
+    else:
+        sim.simulate(simulation_time)
+    return sim, copies
+
+
+def _last_spike(sim) -> float:
+    return max((t for times in sim.spike_log.values() for t in times), default=0.0)
+
+
+def select_dt(
+    target: Union[SpikingNetworkModule, ExecutionPlan],
+    tolerance: float = 1e-3,
+    engine: type = Simulator,
+    integration: Optional[str] = "euler",
+    candidates: tuple[float, ...] = DT_CANDIDATES,
+    samples: int = 8,
+    seed: int = 0,
+    encoder: Optional[DataEncoder] = None,
+    outputs: Optional[list[ExplicitNeuron]] = None,
+    cache: Optional[DtCache] = None,
+) -> DtSelection:
+    """
+    Find the coarsest step of `engine` that keeps the decoded outputs of
+    `target` within `tolerance` of a reference run.
+
+    Each sample applies inputs to a fresh copy of the network: for an
+    `ExecutionPlan`, its own inputs then random magnitudes with the same
+    signs; for a module, the inputs of its calibration driver. The reference
+    is a `Simulator` run with exact integration, until shortly after the last
+    spike of a `PredSimulator` run on a `DURATION_DT` grid. Candidates are
+    tried from the coarsest, and the first one within tolerance on every
+    sample is selected. Searches are cached in `cache` by network signature,
+    outputs, encoder and search settings.
+
+    Parameters:
+    target (SpikingNetworkModule | ExecutionPlan): Network to simulate.
+    tolerance (float): Largest absolute error of a decoded output (plans
+        decode in their own units, modules in normalized values).
+    engine (type): `Simulator` or `PredSimulator` (whose `dt` is the grid of
+        its spike predictions).
+    integration (Optional[str]): Integration mode of `Simulator`.
+    candidates (tuple[float, ...]): Steps to try (ms).
+    samples (int): Number of sampled inputs.
+    seed (int): Seed of the sampled inputs.
+    encoder (Optional[DataEncoder]): Encoder of the inputs and outputs, by
+        default the one of the module or a default `DataEncoder`.
+    outputs (Optional[list[ExplicitNeuron]]): Output neurons of a module, by
+        default those of `output_neurons`.
+    cache (Optional[DtCache]): Cache of the searches.
+    """
+    integration = integration if engine is not PredSimulator else None
+    if isinstance(target, ExecutionPlan):
+        net = target.net
+        reader = target.output_reader
+        checked: list[Output] = [
+            (reader.read_neuron_plus, reader.read_neuron_minus, reader.normalization)
+        ]
+    else:
+        net = target
+        neurons = outputs if outputs is not None else output_neurons(target)
+        if not neurons:
+            raise ValueError(f"Module {target.uid} has no output neurons, pass `outputs`")
+        checked = [(neuron, None, 1.0) for neuron in neurons]
+    encoder = encoder or getattr(target, "encoder", None) or DataEncoder()
+    candidates = tuple(sorted(candidates, reverse=True))
+
+    index = {neuron: i for i, neuron in enumerate(net.neurons)}
+    outputs_key = [
+        (index[plus], None if minus is None else index[minus], norm)
+        for plus, minus, norm in checked
+    ]
+    key = "/".join(
+        [
+            module_signature(net),
+            json.dumps(outputs_key),
+            json.dumps([encoder.Tmin, encoder.Tcod]),
+            engine.__name__,
+            str(integration),
+            repr(tolerance),
+            repr(candidates),
+            str(samples),
+            str(seed),
+        ]
+    )
+    if cache is not None and (cached := cache.get(key)) is not None:
+        return cached
+
+    references = []
+    for inputs in _samples(target, samples, seed):
+        sim, _ = _run(net, inputs, encoder, PredSimulator, DURATION_DT, None, None)
+        end = _last_spike(sim)
+        simulation_time = end * (1 + SIMULATION_MARGIN) + 10 * REFERENCE_DT
+        sim, copies = _run(
+            net, inputs, encoder, Simulator, REFERENCE_DT, "exact", simulation_time
+        )
+        values = [_decode(sim, output, copies, encoder) for output in checked]
+        references.append((inputs, values, _last_spike(sim)))
+
+    errors: dict[float, float] = {}
+    selected = None
+    for dt in candidates:
+        worst = 0.0
+        for inputs, values, end in references:
+            simulation_time = end * (1 + SIMULATION_MARGIN) + 10 * dt
+            sim, copies = _run(net, inputs, encoder, engine, dt, integration, simulation_time)
+            for output, reference in zip(checked, values):
+                worst = max(worst, _error(_decode(sim, output, copies, encoder), reference))
+            if worst > tolerance:
+                break
+        errors[dt] = worst
+        if worst <= tolerance:
+            selected = dt
+            break
+
+    selection = DtSelection(
+        dt=selected,
+        engine=engine.__name__,
+        integration=integration,
+        tolerance=tolerance,
+        samples=samples,
+        errors=errors,
+    )
+    if cache is not None:
+        cache.put(key, selection)
+    return selection
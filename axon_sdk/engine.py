@@ -0,0 +1,291 @@
+"""
+Common interface of the simulation engines, and a registry to pick an engine
+by name.
+"""
+
+from axon_sdk.primitives import (
+    DataEncoder,
+    ExplicitNeuron,
+    SpikeSink,
+    SpikingNetworkModule,
+    SynapseTable,
+    standalone_copy,
+)
+from axon_sdk.primitives.elements import SYNAPSE_TYPES
+from axon_sdk.compilation import ExecutionPlan
+from .checkpoint import (
+    QUEUE_RECORD_DTYPE,
+    Checkpoint,
+    log_records,
+    neuron_state,
+    restore_logs,
+    restore_neuron_state,
+)
+from .instrumentation import RunStats
+
+import numpy as np
+
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Optional, Self, TypeVar
+
+T = TypeVar("T", bound="SimulationEngine")
+
+
+class SimulationEngine(ABC):
+    """
+    Interface of the simulation engines (`Simulator`, `PredSimulator`).
+
+    An engine is created for a network and an encoder, receives inputs with
+    `apply_input_value` and `apply_input_spike`, runs with `simulate`, and
+    exposes its results through the same attributes: spikes in `spike_sink`
+    (and `spike_log`), processed synaptic events per type, `stats` when
+    created with `instrument=True`, and `finished` once it has run.
+    `simulate` can be called again to go on from `time`, and `checkpoint`,
+    `restore` and `fork` snapshot and branch runs (see `axon_sdk.checkpoint`).
+
+    Subclasses set the attributes below in their constructor, which takes
+    `(net, encoder, dt=..., spike_sink=None, instrument=False)` and their
+    own options as keyword arguments, and implement the abstract methods.
+    """
+
+    net: SpikingNetworkModule
+    encoder: DataEncoder
+    dt: float
+    synapse_table: SynapseTable
+    spike_sink: SpikeSink
+    voltage_log: dict[str, list[tuple]]
+    stats: Optional[RunStats]
+    finished: bool
+    # Simulated time (ms): the end of the last run
+    time: float
+    # Processed synaptic events, indexed by synapse type code
+    _processed_counts: list[int]
+    # Id in the spike sink and voltage log list of each neuron, by synapse table index
+    _sink_ids: list[int]
+    _voltage_lists: list[list[tuple]]
+
+    @classmethod
+    def init_with_plan(
+        cls,
+        plan: ExecutionPlan,
+        encoder: DataEncoder,
+        dt: Optional[float] = None,
+        spike_sink: Optional[SpikeSink] = None,
+        instrument: bool = False,
+        **options: Any,
+    ) -> Self:
+        """
+        Construct an engine using an execution plan, with its inputs applied.
+
+        Intended to be used with the compilation functionality. `dt` defaults
+        to the one of the engine, `options` are those of its constructor.
+        """
+        if dt is not None:
+            options["dt"] = dt
+        new_instance = _constructor(cls)(
+            plan.net,
+            encoder,
+            spike_sink=spike_sink,
+            instrument=instrument,
+            **options,
+        )
+
+        for trigger in plan.input_triggers:
+            new_instance.apply_input_value(
+                trigger.normalized_value, trigger.trigger_neuron
+            )
+
+        return new_instance
+
+    def apply_input_value(
+        self, value: float, neuron: ExplicitNeuron, t0: float = 0
+    ) -> None:
+        """
+        Apply a normalized value as spike interval input to a given neuron.
+        """
+        if not (0.0 <= value <= 1.0):
+            raise ValueError("Input value must be between 0.0 and 1.0")
+
+        spike_interval = self.encoder.encode_value(value)
+        for t_spike_in_interval in spike_interval:
+            self.apply_input_spike(neuron=neuron, t=t0 + t_spike_in_interval)
+
+    @abstractmethod
+    def apply_input_spike(self, neuron: ExplicitNeuron, t: float) -> None:
+        """
+        Apply a single spike input to a neuron at a specified time.
+        """
+
+    @abstractmethod
+    def simulate(self, simulation_time: Optional[float] = None) -> None:
+        """
+        Run the simulation, up to `simulation_time` (ms) if given.
+        """
+
+    @property
+    def spike_log(self) -> dict[str, list[float]]:
+        """
+        Spike times per neuron uid, rebuilt from the spike sink on demand.
+        """
+        return self.spike_sink.as_dict()
+
+    def spikes_of(self, neuron: ExplicitNeuron) -> list[float]:
+        return self.spike_sink.spikes_of(neuron.uid)
+
+    @property
+    def processed_syn_per_type(self) -> dict[str, int]:
+        return dict(zip(SYNAPSE_TYPES, self._processed_counts))
+
+    def checkpoint(self) -> Checkpoint:
+        """
+        Snapshot of the state of the simulation, see `axon_sdk.checkpoint`.
+        """
+        table = self.synapse_table
+        header = {
+            "engine": type(self).__name__,
+            "dt": self.dt,
+            "time": self.time,
+            "finished": self.finished,
+            "processed": list(self._processed_counts),
+            "num_neurons": table.num_neurons,
+            "num_synapses": table.num_synapses,
+        }
+        arrays = neuron_state(table.neurons)
+        arrays.update(log_records(self.spike_sink, self._sink_ids, self._voltage_lists))
+        arrays["queue"] = self._queue_records()
+        return Checkpoint(header, arrays)
+
+    def restore(self, checkpoint: Checkpoint) -> None:
+        """
+        Put the simulation back in the state of `checkpoint`, taken by an
+        engine of the same class and dt on this network or a copy of it.
+        """
+        header = checkpoint.header
+        table = self.synapse_table
+        if header["engine"] != type(self).__name__:
+            raise ValueError(
+                f"Checkpoint of a {header['engine']}, not of a {type(self).__name__}"
+            )
+        if (header["num_neurons"], header["num_synapses"]) != (
+            table.num_neurons,
+            table.num_synapses,
+        ):
+            raise ValueError(
+                f"Checkpoint of a network with {header['num_neurons']} neurons and "
+                f"{header['num_synapses']} synapses, not {table.num_neurons} and "
+                f"{table.num_synapses}"
+            )
+        if header["dt"] != self.dt:
+            raise ValueError(f"Checkpoint taken with dt={header['dt']}, not {self.dt}")
+
+        arrays = checkpoint.arrays
+        restore_neuron_state(table.neurons, arrays)
+        restore_logs(self.spike_sink, self._sink_ids, self._voltage_lists, arrays)
+        self._restore_queue(arrays["queue"])
+        self._processed_counts[:] = header["processed"]
+        self.time = header["time"]
+        self.finished = header["finished"]
+
+    def reset(self) -> None:
+        """
+        Back to the state of a new engine, network included, to run it again
+        without rebuilding the network, its synapse table or the engine: the
+        neurons, queue, spike sink, voltage log, counts, time and `stats`.
+        """
+        neurons = self.synapse_table.neurons
+        for neuron in neurons:
+            neuron.reset_state()
+        self._restore_queue(np.zeros(0, dtype=QUEUE_RECORD_DTYPE))
+        self.spike_sink.clear()
+        for log in self._voltage_lists:
+            log.clear()
+        self._processed_counts[:] = [0] * len(SYNAPSE_TYPES)
+        self.time = 0.0
+        self.finished = False
+        if self.stats is not None:
+            self.stats = RunStats(neurons, self.stats.module_uids)
+
+    def fork(self) -> tuple[Self, dict[ExplicitNeuron, ExplicitNeuron]]:
+        """
+        Independent engine on a copy of the network, in the current state of
+        this one, and the map from the neurons of the network to their copies.
+        """
+        net, copies = standalone_copy(self.net)
+        fork = _constructor(type(self))(
+            net, self.encoder, instrument=self.stats is not None, **self._options()
+        )
+        fork.restore(self.checkpoint())
+        return fork, copies
+
+    def _options(self) -> dict[str, Any]:
+        """
+        Constructor options of the engine, to create a fork.
+        """
+        return {"dt": self.dt}
+
+    @abstractmethod
+    def _queue_records(self) -> np.ndarray:
+        """
+        Pending events, as `QUEUE_RECORD_DTYPE` records.
+        """
+
+    @abstractmethod
+    def _restore_queue(self, records: np.ndarray) -> None:
+        """
+        Replace the pending events by `records`.
+        """
+
+    def _log_spike_occurrence(self, idx: int, t: float) -> None:
+        self.spike_sink.record_id(self._sink_ids[idx], t)
+
+
+def _constructor(cls: type[T]) -> Callable[..., T]:
+    """
+    `cls` typed as the constructor of an engine, which `SimulationEngine`
+    describes but does not declare.
+    """
+    return cls
+
+
+class EngineSpec:
+    """
+    A registered engine: its class and the constructor options of its name.
+    Calling it creates an engine like the class does.
+    """
+
+    def __init__(
+        self, name: str, cls: type[SimulationEngine], options: dict[str, Any]
+    ) -> None:
+        self.name = name
+        self.cls = cls
+        self.options = options
+
+    def __call__(
+        self, net: SpikingNetworkModule, encoder: DataEncoder, **kwargs: Any
+    ) -> SimulationEngine:
+        return _constructor(self.cls)(net, encoder, **{**self.options, **kwargs})
+
+    def init_with_plan(
+        self, plan: ExecutionPlan, encoder: DataEncoder, **kwargs: Any
+    ) -> SimulationEngine:
+        return self.cls.init_with_plan(plan, encoder, **{**self.options, **kwargs})
+
+
+# Registered engines by name, see `register_engine`
+ENGINES: dict[str, EngineSpec] = {}
+
+
+def register_engine(name: str, cls: type[SimulationEngine], **options: Any) -> None:
+    """
+    Make `cls`, created with `options`, available as `get_engine(name)`.
+    """
+    ENGINES[name] = EngineSpec(name, cls, options)
+
+
+def get_engine(name: str) -> EngineSpec:
+    """
+    Engine registered as `name`, e.g. `get_engine("predictive").init_with_plan(plan, encoder)`.
+    """
+    if name not in ENGINES:
+        raise ValueError(f"Unknown engine '{name}', use one of {sorted(ENGINES)}")
+    return ENGINES[name]
@@ -0,0 +1,154 @@
+from axon_sdk.primitives import SpikingNetworkModule, ExplicitNeuron
+
+import array
+import json
+
+from typing import Optional
+
+import numpy as np
+
+
+class EventTrace:
+    """
+    Timeline of the synaptic events delivered during a run.
+
+    Event `i` hit neuron index `neurons[i]` (index in the simulator's synapse
+    table) with a synapse of type code `types[i]` at simulation time `times[i]`.
+    Events are stored in processing order, so times are non-decreasing.
+    """
+
+    def __init__(self):
+        self.times = array.array("d")
+        self.neurons = array.array("i")
+        self.types = array.array("b")
+
+    def record(self, t: float, neuron: int, type_code: int) -> None:
+        self.times.append(t)
+        self.neurons.append(neuron)
+        self.types.append(type_code)
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def as_numpy(self) -> dict[str, np.ndarray]:
+        """
+        Zero-copy NumPy views of the trace arrays.
+        """
+        return {
+            "times": np.frombuffer(self.times, dtype=np.float64),
+            "neurons": np.frombuffer(self.neurons, dtype=np.int32),
+            "types": np.frombuffer(self.types, dtype=np.int8),
+        }
+
+
+class RunStats:
+    """
+    Structured statistics of a simulation run.
+
+    Collected by `Simulator` and `PredSimulator` when created with
+    `instrument=True`, and left as `None` otherwise, so that a plain run pays
+    no instrumentation cost.
+
+    Wall time is split in the phases of the simulation loop:
+    - pop: taking the next events out of the queue
+    - apply: delivering synaptic events to neurons
+    - update: integrating neurons (Simulator) or predicting spikes (PredSimulator)
+    - propagate: emitting spikes and enqueuing their fan-out
+
+    `trace` holds the timestamped `EventTrace` of the run, used by the
+    hardware models of `axon_sdk.usagereport`.
+    """
+
+    PHASES = ("pop", "apply", "update", "propagate")
+
+    def __init__(self, neurons: list[ExplicitNeuron], module_uids: list[str]):
+        self._neurons = neurons
+        self._module_uids = module_uids
+        # Delivered synaptic events per neuron index
+        self.events_per_neuron = [0] * len(neurons)
+        self.events_processed = 0
+        self.spikes_emitted = 0
+        self.prediction_calls = 0
+        self.cancellations = 0
+        self.queue_high_water = 0
+        # Neurons updated at each step (Simulator) or event time (PredSimulator)
+        self.active_set_sizes = array.array("i")
+        self.phase_time = {phase: 0.0 for phase in RunStats.PHASES}
+        self.wall_time = 0.0
+        self.trace = EventTrace()
+
+    @classmethod
+    def for_network(
+        cls, net: SpikingNetworkModule, neurons: list[ExplicitNeuron]
+    ) -> "RunStats":
+        return cls(neurons, module_uids_of(net, neurons))
+
+    @property
+    def module_uids(self) -> list[str]:
+        """
+        Uid of the module owning each neuron index.
+        """
+        return self._module_uids
+
+    @property
+    def steps(self) -> int:
+        return len(self.active_set_sizes)
+
+    def events_per_module(self) -> dict[str, int]:
+        """
+        Delivered events summed over the neurons owned by each module.
+        """
+        per_module: dict[str, int] = {}
+        for module_uid, count in zip(self._module_uids, self.events_per_neuron):
+            per_module[module_uid] = per_module.get(module_uid, 0) + count
+        return per_module
+
+    def as_dict(self) -> dict:
+        sizes = self.active_set_sizes
+        return {
+            "wall_time": self.wall_time,
+            "phase_time": dict(self.phase_time),
+            "steps": self.steps,
+            "events_processed": self.events_processed,
+            "spikes_emitted": self.spikes_emitted,
+            "prediction_calls": self.prediction_calls,
+            "cancellations": self.cancellations,
+            "queue_high_water": self.queue_high_water,
+            "active_set": {
+                "max": max(sizes) if sizes else 0,
+                "mean": sum(sizes) / len(sizes) if sizes else 0.0,
+            },
+            "events_per_module": self.events_per_module(),
+        }
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.as_dict(), **kwargs)
+
+    def __repr__(self) -> str:
+        return (
+            f"<RunStats: {self.events_processed} events, {self.spikes_emitted} spikes, "
+            f"{self.wall_time * 1e3:.2f} ms>"
+        )
+
+
+def module_uids_of(
+    net: SpikingNetworkModule,
+    neurons: list[ExplicitNeuron],
+    max_depth: Optional[int] = None,
+) -> list[str]:
+    """
+    Uid of the module owning each neuron, in the order of `neurons`.
+
+    Neurons of modules nested deeper than `max_depth` (`net` is at depth 0)
+    are attributed to their ancestor at `max_depth`.
+    """
+    owner: dict[ExplicitNeuron, str] = {}
+    stack = [(net, 0, net.uid)]
+    while stack:
+        mod, depth, owner_uid = stack.pop()
+        if max_depth is None or depth <= max_depth:
+            owner_uid = mod.uid
+        for neuron in mod.top_module_neurons:
+            owner[neuron] = owner_uid
+        stack.extend((sub, depth + 1, owner_uid) for sub in mod.subnetworks)
+    return [owner.get(neuron, net.uid) for neuron in neurons]
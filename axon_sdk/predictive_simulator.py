@@ -3,67 +3,103 @@ from axon_sdk.primitives import (
     ExplicitNeuron,
     SpikingNetworkModule,
     CancelableEventQueue,
-    SpikeHitEvent,
     PredictedSpikeEvent,
+    SpikeSink,
+    DictSpikeSink,
+    SynapseTable,
 )
-
-from axon_sdk.networks import InvertingMemoryNetwork
-from .visualization.chronogram import plot_chronogram
-from .visualization.topovis import vis_topology
+from axon_sdk.primitives.elements import SYNAPSE_TYPES, SynapseType
+from .checkpoint import HIT, PREDICTED_SPIKE, QUEUE_RECORD_DTYPE
+from .engine import SimulationEngine, register_engine
+from .instrumentation import RunStats
 
 import math
 import os
+import time
+
+import numpy as np
+
+from typing import Any, Optional
 
-from typing import Optional
 
+class PredSimulator(SimulationEngine):
+    """
+    Event-driven simulation of a network: each synaptic event predicts the
+    next spike of the neuron it hits, and predictions are cancelled by later
+    events.
+
+    With `backend="numba"`, uninstrumented runs use a compiled event loop
+    with identical results (see `axon_sdk.backends`), unless neurons keep
+    state logs; without numba installed, the Python loop is used.
+    """
 
-class PredSimulator:
     def __init__(
-        self, net: SpikingNetworkModule, encoder: DataEncoder, dt: float = 0.01
+        self,
+        net: SpikingNetworkModule,
+        encoder: DataEncoder,
+        dt: float = 0.01,
+        spike_sink: Optional[SpikeSink] = None,
+        instrument: bool = False,
+        backend: str = "python",
     ) -> None:
+        if backend != "python":
+            # Imported here so that numba is only loaded when asked for
+            from .backends import resolve_backend
+
+            backend = resolve_backend(backend)
         self.net = net
+        self.backend = backend
         self.encoder = encoder
         self.dt = dt
         self.finished = False
+        self.time = 0.0
 
         # Predictive simulation engine
+        # The queue holds `PredictedSpikeEvent`s (cancelable) and synaptic hits,
+        # stored as `(post neuron index, synapse type code, weight)` tuples
+        self.synapse_table = SynapseTable.from_network(net)
         self._event_queue = CancelableEventQueue()
-        self._possible_spike_events_for: dict[str, Optional[PredictedSpikeEvent]] = {}
+        self._possible_spike_events_for: list[Optional[PredictedSpikeEvent]] = [
+            None
+        ] * self.synapse_table.num_neurons
 
-        self.spike_log: dict[str, list[float]] = {}
+        self.spike_sink = spike_sink if spike_sink is not None else DictSpikeSink()
         self.voltage_log: dict[str, list[tuple]] = {}
 
         self._max_steps = int(500 / dt)  # Heuristic: in 500 timesteps, primitives spike
 
-        for neuron in self.net.neurons:
-            self.spike_log[neuron.uid] = []
+        self._sink_ids: list[int] = []
+        self._voltage_lists: list[list[tuple]] = []
+        for neuron in self.synapse_table.neurons:
+            self._sink_ids.append(self.spike_sink.register(neuron.uid))
             self.voltage_log[neuron.uid] = []
-            self._possible_spike_events_for[neuron.uid] = None
+            self._voltage_lists.append(self.voltage_log[neuron.uid])
 
-        self._processed_synapses_log: dict[str, int]
-        self._processed_synapses_log = {"V": 0, "ge": 0, "gf": 0, "gm": 0, "gate": 0}
+        # Runs of the prediction routine, indexed by synapse type code
+        self._processed_counts = [0] * len(SYNAPSE_TYPES)
 
-    def apply_input_value(
-        self, value: float, neuron: ExplicitNeuron, t0: float = 0
-    ) -> None:
-        if not (0.0 <= value <= 1.0):
-            raise ValueError("Input value must be between 0.0 and 1.0")
+        # Opt-in run statistics, see `RunStats`
+        self.stats: Optional[RunStats] = None
+        if instrument:
+            self.stats = RunStats.for_network(net, self.synapse_table.neurons)
 
-        spike_interval = self.encoder.encode_value(value)
-        for t_spike_in_interval in spike_interval:
-            self.apply_input_spike(neuron=neuron, t=t_spike_in_interval)
+    @property
+    def _processed_synapses_log(self) -> dict[str, int]:
+        log = self.processed_syn_per_type
+        log["gm"] = 0
+        return log
 
     def apply_input_spike(self, neuron: ExplicitNeuron, t: float) -> None:
+        if t < self.time:
+            raise ValueError(
+                f"Input spike at t={t} is before the simulated time {self.time}"
+            )
         # Forcing a spike is done by simulating the arrival of a V-type spike
-        Vt = neuron.Vt
-        spike_event = SpikeHitEvent(t=t, hitNeuron=neuron, synapse_type="V", weight=Vt)
-        self._event_queue.add_event(spike_event)
+        idx = self.synapse_table.index_of(neuron)
+        self._event_queue.add_at(t, (idx, int(SynapseType.V), neuron.Vt))
 
-    def _log_spike_occurrence(self, neuron: ExplicitNeuron, t: float) -> None:
-        self.spike_log[neuron.uid].append(t)
-
-    def _log_predicition_routine_run(self, syn_type: str) -> None:
-        self._processed_synapses_log[syn_type] += 1
+    def _log_predicition_routine_run(self, type_code: int) -> None:
+        self._processed_counts[type_code] += 1
 
     def _enqueue_possible_spike_event(
         self, t0: float, neuron: ExplicitNeuron
@@ -72,21 +108,18 @@ class PredSimulator:
         self._event_queue.add_event(possible_spike)
         return possible_spike
 
-    def _dequeue_possible_spike_event_for(self, neuron: ExplicitNeuron) -> None:
-        possible_event = self._possible_spike_events_for[neuron.uid]
-        if possible_event is not None:
-            assert isinstance(possible_event, PredictedSpikeEvent)
-            self._event_queue.remove(possible_event)
-
-    def _propagate_spikes_from(self, t0: float, neuron: ExplicitNeuron):
-        for syn in neuron.out_synapses:
-            spike_event = SpikeHitEvent(
-                t=t0 + syn.delay,
-                hitNeuron=syn.post_neuron,
-                synapse_type=syn.type,
-                weight=syn.weight,
-            )
-            self._event_queue.add_event(spike_event)
+    def _dequeue_possible_spike_event_for(self, idx: int) -> bool:
+        """
+        Cancel the predicted spike of neuron `idx`; returns whether one was pending.
+        """
+        possible_event = self._possible_spike_events_for[idx]
+        if possible_event is None:
+            return False
+        assert isinstance(possible_event, PredictedSpikeEvent)
+        return self._event_queue.remove(possible_event)
+
+    def _propagate_spikes_from(self, t0: float, idx: int):
+        self._event_queue.add_fanout(t0, self.synapse_table, idx)
 
     def _predict_spike_steps_fixed(self, neuron: ExplicitNeuron, dt) -> Optional[float]:
         V0 = neuron.V
@@ -107,57 +140,182 @@ class PredSimulator:
                 lo = mid + 1
         return lo * dt if lo < self._max_steps else None
 
-    def simulate(self) -> None:
-        if self.finished is True:
-            raise ValueError("Trying to rerun already executed simulation")
+    def simulate(self, simulation_time: Optional[float] = None) -> None:
+        """
+        Process events until none is left, or only events more than
+        `simulation_time` after the end of the previous run if given.
+
+        A run goes on from the previous one, so that inputs applied after a
+        run are processed by the next one.
+        """
+        end_time = None if simulation_time is None else self.time + simulation_time
+
+        stream = self._watch() if os.getenv("VIS", "0") == "live" else None
+        try:
+            # The compiled loop runs until no event is left
+            compiled = end_time is None and self._compiled_loop_applies()
+            if self.stats is None and compiled:
+                from .backends.numba_backend import run_events
+
+                last_time = run_events(self)
+            else:
+                last_time = self._run_events(end_time, self.stats)
+        finally:
+            if stream is not None:
+                stream.close()
+
+        self.time = max(self.time, last_time) if end_time is None else end_time
+        self.finished = True
+
+        if os.getenv("VIS", "0") == "1":
+            self.launch_visualization()
+
+    def _options(self) -> dict[str, Any]:
+        return {"dt": self.dt, "backend": self.backend}
+
+    def _queue_records(self) -> np.ndarray:
+        # In processing order, as the compiled loop reads the queue
+        index = self.synapse_table.index
+        records = []
+        for t in sorted(self._event_queue._events_at_time):
+            for item in self._event_queue._events_at_time[t]:
+                if isinstance(item, PredictedSpikeEvent):
+                    records.append((t, PREDICTED_SPIKE, index[item.neuron], 0, 0.0))
+                elif isinstance(item, tuple):
+                    records.append((t, HIT, *item))
+        return np.array(records, dtype=QUEUE_RECORD_DTYPE)
+
+    def _restore_queue(self, records: np.ndarray) -> None:
+        neurons = self.synapse_table.neurons
+        self._event_queue = CancelableEventQueue()
+        self._possible_spike_events_for = [None] * self.synapse_table.num_neurons
+        for t, kind, target, type_code, weight in records.tolist():
+            if kind == PREDICTED_SPIKE:
+                event = self._enqueue_possible_spike_event(t, neurons[target])
+                self._possible_spike_events_for[target] = event
+            else:
+                self._event_queue.add_at(t, (target, type_code, weight))
+
+    def _compiled_loop_applies(self) -> bool:
+        """
+        Whether the numba backend runs this simulation: uninstrumented and
+        without per-neuron state logs, which only the Python loop records.
+        """
+        if self.backend != "numba":
+            return False
+        from .backends.numba_backend import supports_predictive
+
+        return supports_predictive(self.synapse_table.neurons)
+
+    def _run_events(
+        self, end_time: Optional[float] = None, stats: Optional[RunStats] = None
+    ) -> float:
+        """
+        Process the events up to `end_time`, also filling `stats` if given;
+        returns the time of the last one.
+        """
+        clock = time.perf_counter
+        neurons = self.synapse_table.neurons
+        index = self.synapse_table.index
+        queue = self._event_queue
+        t = self.time
+        run_start = clock()
 
-        while len(self._event_queue) > 0:
-            next_evts = self._event_queue.pop()
+        while queue.num_items > 0:
+            next_time = queue.next_time()
+            if end_time is not None and next_time is not None and next_time > end_time:
+                break
+            if stats is not None:
+                stats.queue_high_water = max(stats.queue_high_water, queue.num_items)
+            t0 = clock() if stats is not None else 0.0
+            t, next_evts = queue.pop_with_time()
             spike_events = [e for e in next_evts if isinstance(e, PredictedSpikeEvent)]
-            spike_hit_events = [e for e in next_evts if isinstance(e, SpikeHitEvent)]
+            spike_hit_events = [e for e in next_evts if isinstance(e, tuple)]
+            t1 = clock() if stats is not None else 0.0
 
             for event in spike_events:
+                idx = index[event.neuron]
                 event.neuron.reset()
-                self._propagate_spikes_from(t0=event.time, neuron=event.neuron)
-                self._possible_spike_events_for[event.neuron.uid] = None
-                self._log_spike_occurrence(neuron=event.neuron, t=event.time)
-
-            for event in spike_hit_events:
-                self._dequeue_possible_spike_event_for(event.hitNeuron)
-                self._possible_spike_events_for[event.hitNeuron.uid] = None
-                event.hitNeuron.receive_synaptic_event_pred(
-                    synapse_type=event.synapse_type, weight=event.weight, t0=event.time
+                self._propagate_spikes_from(t0=event.time, idx=idx)
+                self._possible_spike_events_for[idx] = None
+                self._log_spike_occurrence(idx, event.time)
+            t2 = clock() if stats is not None else 0.0
+
+            update_time = 0.0
+            for post, type_code, weight in spike_hit_events:
+                neuron = neurons[post]
+                cancelled = self._dequeue_possible_spike_event_for(post)
+                self._possible_spike_events_for[post] = None
+                neuron.receive_synaptic_event_pred(
+                    synapse_type=type_code, weight=weight, t0=t
                 )
                 # Might repeatedly recalculate the new spike time if several spikes
                 # hit the neuron at the same timestep, but that's unlikely
                 # and event if it happens, not so computationally costly
+                u0 = clock() if stats is not None else 0.0
                 new_spike_time = self._predict_spike_steps_fixed(
-                    neuron=event.hitNeuron, dt=self.dt
+                    neuron=neuron, dt=self.dt
                 )
-                self._log_predicition_routine_run(event.synapse_type)
+                self._log_predicition_routine_run(type_code)
+                if stats is not None:
+                    update_time += clock() - u0
+                    stats.cancellations += cancelled
+                    stats.prediction_calls += 1
+                    stats.events_per_neuron[post] += 1
+                    stats.trace.record(t, post, type_code)
 
                 if new_spike_time is not None:
                     new_event = self._enqueue_possible_spike_event(
-                        t0=event.time + new_spike_time, neuron=event.hitNeuron
+                        t0=t + new_spike_time, neuron=neuron
                     )
-                    self._possible_spike_events_for[event.hitNeuron.uid] = new_event
+                    self._possible_spike_events_for[post] = new_event
 
-        self.finished = True
+            if stats is not None:
+                stats.spikes_emitted += len(spike_events)
+                stats.events_processed += len(spike_hit_events)
+                stats.active_set_sizes.append(len({hit[0] for hit in spike_hit_events}))
+                t3 = clock()
+                stats.phase_time["pop"] += t1 - t0
+                stats.phase_time["propagate"] += t2 - t1
+                stats.phase_time["apply"] += t3 - t2 - update_time
+                stats.phase_time["update"] += update_time
 
-        if os.getenv("VIS", "0") == "1":
-            self.launch_visualization()
+        if stats is not None:
+            stats.wall_time += clock() - run_start
+        return t
+
+    def _watch(self):
+        """
+        Stream the run to the live view, see `axon_sdk.visualization.stream`.
+
+        Requires `VIS=live` in environment variables.
+        """
+        from .visualization.stream import watch
+
+        return watch(self)
 
     def launch_visualization(self):
+        # Imported here so that matplotlib is only loaded when plotting
+        from .visualization.chronogram import plot_run
+        from .visualization.topovis import vis_topology
+
         vis_topology(self.net)
         timesteps = [(i + 1) * self.dt for i in range(self._max_steps)]
-        plot_chronogram(
+        plot_run(
+            self.net,
             timesteps=timesteps,
             voltage_log=self.voltage_log,
             spike_log=self.spike_log,
         )
 
 
+register_engine("predictive", PredSimulator)
+register_engine("predictive-numba", PredSimulator, backend="numba")
+
+
 if __name__ == "__main__":
+    from axon_sdk.networks import InvertingMemoryNetwork
+
     val = 0.6
     encoder = DataEncoder()
     imn = InvertingMemoryNetwork(encoder, module_name="invmem")
@@ -170,3 +328,4 @@ if __name__ == "__main__":
     out_val = encoder.decode_interval(output_spikes[1] - output_spikes[0])
     print(f"Input val: {val}")
     print(f"Inverted val (1-val): {out_val}")
+
@@ -1,4 +1,12 @@
-from .elements import ExplicitNeuron
+from .elements import ExplicitNeuron, SynapseType
 from .encoders import DataEncoder
-from .networks import SpikingNetworkModule
+from .networks import SpikingNetworkModule, standalone_copy
 from .events import SpikeHitEvent, CancelableEventQueue, PredictedSpikeEvent
+from .sinks import (
+    SpikeSink,
+    DictSpikeSink,
+    ArraySpikeSink,
+    RingBufferSpikeSink,
+    MemmapSpikeSink,
+)
+from .csr import SynapseTable
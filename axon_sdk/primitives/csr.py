@@ -0,0 +1,101 @@
+from .elements import ExplicitNeuron
+from .networks import SpikingNetworkModule
+
+import array
+
+import numpy as np
+
+
+class SynapseTable:
+    """
+    Compressed sparse row (CSR) fan-out table of a whole network.
+
+    Neuron `i` is the i-th neuron of `neurons`. Its out-going synapses are the
+    slice `offsets[i]:offsets[i + 1]` of the parallel arrays `post` (index of the
+    post-synaptic neuron), `types` (synapse type code), `weights`, `delays` and
+    `uids` (synapse uid numbers).
+
+    Built once per network; simulators propagate a spike by slicing it.
+    """
+
+    def __init__(
+        self,
+        neurons: list[ExplicitNeuron],
+        offsets: array.array,
+        post: array.array,
+        types: array.array,
+        weights: array.array,
+        delays: array.array,
+        uids: array.array,
+    ):
+        self.neurons = neurons
+        self.index = {neuron: i for i, neuron in enumerate(neurons)}
+        self.offsets = offsets
+        self.post = post
+        self.types = types
+        self.weights = weights
+        self.delays = delays
+        self.uids = uids
+
+    @classmethod
+    def from_neurons(cls, neurons: list[ExplicitNeuron]) -> "SynapseTable":
+        index = {neuron: i for i, neuron in enumerate(neurons)}
+        offsets = array.array("q", [0])
+        post = array.array("i")
+        types = array.array("b")
+        weights = array.array("d")
+        delays = array.array("d")
+        uids = array.array("q")
+
+        for neuron in neurons:
+            synapses = neuron.out_synapses
+            try:
+                post.extend(index[post_neuron] for post_neuron in synapses.post)
+            except KeyError as e:
+                raise ValueError(
+                    f"Neuron {neuron.uid} has a synapse to neuron {e.args[0].uid}, "
+                    "which is outside the network"
+                ) from None
+            types.extend(synapses.types)
+            weights.extend(synapses.weights)
+            delays.extend(synapses.delays)
+            uids.extend(synapses.uids)
+            offsets.append(len(post))
+
+        return cls(neurons, offsets, post, types, weights, delays, uids)
+
+    @classmethod
+    def from_network(cls, net: SpikingNetworkModule) -> "SynapseTable":
+        return cls.from_neurons(net.neurons)
+
+    @property
+    def num_neurons(self) -> int:
+        return len(self.neurons)
+
+    @property
+    def num_synapses(self) -> int:
+        return len(self.post)
+
+    def index_of(self, neuron: ExplicitNeuron) -> int:
+        if neuron not in self.index:
+            raise ValueError(f"Neuron {neuron.uid} does not belong to the network")
+        return self.index[neuron]
+
+    def fanout(self, i: int) -> tuple[int, int]:
+        """
+        Bounds of the synapse slice of neuron `i`.
+        """
+        return self.offsets[i], self.offsets[i + 1]
+
+    def as_numpy(self) -> dict[str, np.ndarray]:
+        """
+        Zero-copy NumPy views of the table arrays.
+        """
+        return {
+            "offsets": np.frombuffer(self.offsets, dtype=np.int64),
+            "post": np.frombuffer(self.post, dtype=np.int32),
+            "types": np.frombuffer(self.types, dtype=np.int8),
+            "weights": np.frombuffer(self.weights, dtype=np.float64),
+            "delays": np.frombuffer(self.delays, dtype=np.float64),
+            "uids": np.frombuffer(self.uids, dtype=np.int64),
+        }
@@ -1,10 +1,85 @@
 from .helpers import flatten_nested_list
-from typing import Optional
+from typing import Iterator, Optional, Union
 
+from enum import IntEnum
+
+import array
 import math
 
 
+class SynapseType(IntEnum):
+    """
+    Integer codes of the synapse types, used on the simulation hot paths.
+
+    The public API keeps accepting the names 'V', 'ge', 'gf' and 'gate'.
+    """
+
+    V = 0
+    ge = 1
+    gf = 2
+    gate = 3
+
+
+# Synapse type names, in the order of their integer codes
+SYNAPSE_TYPES = tuple(t.name for t in SynapseType)
+SYNAPSE_TYPE_CODES = {t.name: t for t in SynapseType}
+
+
+def synapse_type_code(synapse_type: Union[str, int]) -> SynapseType:
+    """
+    Convert a synapse type name (or code) to its `SynapseType` code.
+    """
+    if isinstance(synapse_type, str):
+        if synapse_type not in SYNAPSE_TYPE_CODES:
+            raise ValueError(f"Unknown synapse type '{synapse_type}'")
+        return SYNAPSE_TYPE_CODES[synapse_type]
+    try:
+        return SynapseType(synapse_type)
+    except ValueError:
+        raise ValueError(f"Unknown synapse type '{synapse_type}'") from None
+
+
+# Dispatch table: how a synaptic event of each type code changes the neuron state
+def _apply_V(neuron: "AbstractNeuron", weight: float) -> None:
+    neuron.V += weight
+
+
+def _apply_ge(neuron: "AbstractNeuron", weight: float) -> None:
+    neuron.ge += weight
+
+
+def _apply_gf(neuron: "AbstractNeuron", weight: float) -> None:
+    neuron.gf += weight
+
+
+def _apply_gate(neuron: "AbstractNeuron", weight: float) -> None:
+    neuron.gate += weight
+
+
+SYNAPSE_HANDLERS = (_apply_V, _apply_ge, _apply_gf, _apply_gate)
+
+# Bisection steps locating a threshold crossing within a step, see
+# `AbstractNeuron.update_exact` (2^-40 of the step)
+CROSSING_ITERATIONS = 40
+
+
 class AbstractNeuron:
+    __slots__ = (
+        "Vt",
+        "Vreset",
+        "tm",
+        "tf",
+        "V",
+        "ge",
+        "gf",
+        "gate",
+        "additional_info",
+        "_name",
+        "_parent_mod_id",
+        "_number",
+        "_uid",
+    )
+
     _instance_count = 0
 
     def __init__(
@@ -37,18 +112,22 @@ class AbstractNeuron:
         self.gf = 0.0
         self.gate = 0
 
-        if parent_mod_id is not None:
-            self._uid = (
-                f"(m{parent_mod_id},n{AbstractNeuron._instance_count})_{neuron_name}"
-            )
-        else:
-            self._uid = f"(n{AbstractNeuron._instance_count})_{neuron_name}"
+        # The uid string is only formatted when first requested
+        self._name = neuron_name
+        self._parent_mod_id = parent_mod_id
+        self._number = AbstractNeuron._instance_count
+        self._uid: Optional[str] = None
 
         self.additional_info = additional_info
         AbstractNeuron._instance_count += 1
 
     @property
     def uid(self) -> str:
+        if self._uid is None:
+            if self._parent_mod_id is not None:
+                self._uid = f"(m{self._parent_mod_id},n{self._number})_{self._name}"
+            else:
+                self._uid = f"(n{self._number})_{self._name}"
         return self._uid
 
     def update_and_spike(self, dt) -> tuple[float, bool]:
@@ -74,27 +153,73 @@ class AbstractNeuron:
             spike = True
         return (self.V, spike)
 
+    def update_exact(self, h: float) -> Optional[float]:
+        """
+        Advance the state by `h` with the exact solution of the equations
+        integrated by `update_and_spike`, for any `h`.
+
+        With ge and gate constant and gf decaying while gated, the potential
+        after `s` is V + (ge * s + gate * gf * tf * (1 - exp(-s / tf))) / tm.
+
+        Parameters:
+        h (float): Time to advance (ms).
+
+        Returns:
+        Optional[float]: Offset within `h` of the first threshold crossing,
+        or None if V stays below Vt. On a crossing, the state is left at the
+        crossing time.
+        """
+        if self.V >= self.Vt:
+            return 0.0
+        gated_gf = self.gate * self.gf
+
+        def potential(s: float) -> float:
+            drive = self.ge * s
+            if gated_gf:
+                drive += gated_gf * self.tf * (1 - math.exp(-s / self.tf))
+            return self.V + drive / self.tm
+
+        V = potential(h)
+        crossing = None
+        if V >= self.Vt:
+            # Bisection on the bracketing interval [0, h]
+            lo, hi = 0.0, h
+            for _ in range(CROSSING_ITERATIONS):
+                mid = 0.5 * (lo + hi)
+                if potential(mid) >= self.Vt:
+                    hi = mid
+                else:
+                    lo = mid
+            crossing = h = hi
+            V = potential(h)
+        if self.gate:
+            self.gf *= math.exp(-h / self.tf)
+        self.V = V
+        return crossing
+
     def receive_synaptic_event(self, synapse_type, weight):
         """
         Update neuron state based on incoming synaptic event.
 
         Parameters:
-        synapse_type (str): Type of synapse ('V', 'ge', 'gf', 'gate').
+        synapse_type (str | int): Type of synapse ('V', 'ge', 'gf', 'gate') or its code.
         weight (float): Synaptic weight to modify neuron state.
         """
-        if synapse_type == "V":
-            self.V += weight
-        elif synapse_type == "ge":
-            self.ge += weight
-        elif synapse_type == "gf":
-            self.gf += weight
-        elif synapse_type == "gate":
-            self.gate += weight
-        else:
-            raise ValueError("Unknown synapse type.")
+        if type(synapse_type) is not int:
+            synapse_type = synapse_type_code(synapse_type)
+        SYNAPSE_HANDLERS[synapse_type](self, weight)
 
 
 class ExplicitNeuron(AbstractNeuron):
+    __slots__ = (
+        "spike_times",
+        "out_synapses",
+        "_last_synapse_time",
+        "log_V",
+        "log_ge",
+        "log_gf",
+    )
+
     def __init__(
         self,
         Vt: float,
@@ -103,16 +228,30 @@ class ExplicitNeuron(AbstractNeuron):
         Vreset: float = 0.0,
         neuron_name: Optional[str] = None,
         parent_mod_id: Optional[str] = None,
-        additional_info: Optional[str] = None
+        additional_info: Optional[str] = None,
+        record_state: bool = False,
     ):
         super().__init__(Vt, tm, tf, Vreset, neuron_name, parent_mod_id, additional_info)
         self.spike_times: list[float] = []
-        self.out_synapses: list[Synapse] = []
+        self.out_synapses = SynapseList(self)
 
         self._last_synapse_time: float = 0
-        self.log_V = [(self.V, 0)]
-        self.log_ge = [(self.ge, 0)]
-        self.log_gf = [(self.ge, 0)]
+        # Per-neuron state logs of the predictive engine, see `enable_state_logs`
+        self.log_V: Optional[list[tuple]] = None
+        self.log_ge: Optional[list[tuple]] = None
+        self.log_gf: Optional[list[tuple]] = None
+        if record_state:
+            self.enable_state_logs()
+
+    def enable_state_logs(self) -> None:
+        """
+        Opt in to logging `(value, t)` pairs of V and ge at every synaptic event
+        processed by the predictive simulator.
+        """
+        t = self._last_synapse_time
+        self.log_V = [(self.V, t)]
+        self.log_ge = [(self.ge, t)]
+        self.log_gf = [(self.gf, t)]
 
     def reset(self):
         self.V = self.Vreset
@@ -120,6 +259,17 @@ class ExplicitNeuron(AbstractNeuron):
         self.gf = 0
         self.gate = 0
 
+    def reset_state(self) -> None:
+        """
+        Back to the state of a new neuron, keeping the state logs enabled
+        (restarted) if they were.
+        """
+        self.reset()
+        self._last_synapse_time = 0
+        self.spike_times.clear()
+        if self.log_V is not None:
+            self.enable_state_logs()
+
     def _fast_forward(self, interval: float) -> tuple[float, float]:
         decay = math.exp(-interval / self.tf)
         new_V = self.V + (self.ge / self.tm) * interval
@@ -132,23 +282,19 @@ class ExplicitNeuron(AbstractNeuron):
     def receive_synaptic_event_pred(self, synapse_type, weight, t0) -> None:
         if t0 != self._last_synapse_time:
             self.V, self.gf = self._fast_forward(t0 - self._last_synapse_time)
-            self.log_V.append((self.V, t0))
-            self.log_ge.append((self.ge, t0))
+            if self.log_V is not None:
+                self.log_V.append((self.V, t0))
+                self.log_ge.append((self.ge, t0))
             self._last_synapse_time = t0
 
-        if synapse_type == "V":
-            self.V += weight
-        elif synapse_type == "ge":
-            self.ge += weight
-        elif synapse_type == "gf":
-            self.gf += weight
-        elif synapse_type == "gate":
-            self.gate += weight
-        else:
-            raise ValueError("Unknown synapse type")
+        if type(synapse_type) is not int:
+            synapse_type = synapse_type_code(synapse_type)
+        SYNAPSE_HANDLERS[synapse_type](self, weight)
 
 
 class Synapse:
+    __slots__ = ("pre_neuron", "post_neuron", "type_code", "weight", "delay", "_index")
+
     _instance_count = 0
 
     def __init__(
@@ -161,13 +307,124 @@ class Synapse:
     ):
         self.pre_neuron = pre_neuron
         self.post_neuron = post_neuron
-        self.type = synapse_type
+        self.type_code = synapse_type_code(synapse_type)
         self.weight = weight
         self.delay = delay
 
-        self._uid = f"synapse_{Synapse._instance_count}"
+        self._index = Synapse._instance_count
         Synapse._instance_count += 1
 
+    @classmethod
+    def _view(
+        cls,
+        index: int,
+        pre_neuron: ExplicitNeuron,
+        post_neuron: ExplicitNeuron,
+        weight: float,
+        delay: float,
+        type_code: int,
+    ) -> "Synapse":
+        # Materialize an already existing synapse without allocating a new uid
+        synapse = cls.__new__(cls)
+        synapse.pre_neuron = pre_neuron
+        synapse.post_neuron = post_neuron
+        synapse.type_code = SynapseType(type_code)
+        synapse.weight = weight
+        synapse.delay = delay
+        synapse._index = index
+        return synapse
+
+    @property
+    def type(self) -> str:
+        return SYNAPSE_TYPES[self.type_code]
+
     @property
     def uid(self) -> str:
-        return self._uid
\ No newline at end of file
+        return f"synapse_{self._index}"
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Synapse) and self._index == other._index
+
+    def __hash__(self) -> int:
+        return hash(self._index)
+
+
+_NO_SYNAPSES: tuple = ()
+
+
+class SynapseList:
+    """
+    Out-going synapses of a neuron, stored as parallel typed arrays.
+
+    Costs a few dozen bytes per synapse instead of a full `Synapse` object.
+    `Synapse` objects are only materialized as views when iterating or indexing.
+    """
+
+    __slots__ = ("pre_neuron", "post", "types", "weights", "delays", "uids")
+
+    def __init__(self, pre_neuron: ExplicitNeuron):
+        self.pre_neuron = pre_neuron
+        # Most neurons have few or no synapses: arrays are allocated on first use
+        self.post: list[ExplicitNeuron] = _NO_SYNAPSES  # type: ignore
+        self.types = self.weights = self.delays = self.uids = _NO_SYNAPSES
+
+    def _allocate(self) -> None:
+        self.post = []
+        self.types = array.array("b")
+        self.weights = array.array("d")
+        self.delays = array.array("d")
+        self.uids = array.array("q")
+
+    def add(
+        self,
+        post_neuron: ExplicitNeuron,
+        synapse_type: Union[str, int],
+        weight: float,
+        delay: float,
+        uid: Optional[int] = None,
+    ) -> int:
+        """
+        Store a new synapse and return its uid number.
+
+        A fresh uid is allocated unless an existing one is given.
+        """
+        type_code = synapse_type_code(synapse_type)
+        if uid is None:
+            uid = Synapse._instance_count
+            Synapse._instance_count += 1
+
+        if self.post is _NO_SYNAPSES:
+            self._allocate()
+        self.post.append(post_neuron)
+        self.types.append(type_code)
+        self.weights.append(weight)
+        self.delays.append(delay)
+        self.uids.append(uid)
+        return uid
+
+    def append(self, synapse: Synapse) -> None:
+        assert synapse.pre_neuron is self.pre_neuron, "Synapse starts at another neuron"
+        self.add(
+            synapse.post_neuron,
+            synapse.type_code,
+            synapse.weight,
+            synapse.delay,
+            uid=synapse._index,
+        )
+
+    def __len__(self) -> int:
+        return len(self.post)
+
+    def __getitem__(self, i: int) -> Synapse:
+        return Synapse._view(
+            self.uids[i],
+            self.pre_neuron,
+            self.post[i],
+            self.weights[i],
+            self.delays[i],
+            self.types[i],
+        )
+
+    def __iter__(self) -> Iterator[Synapse]:
+        for i in range(len(self.post)):
+            yield self[i]
\ No newline at end of file
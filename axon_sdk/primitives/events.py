@@ -1,10 +1,15 @@
 import heapq
-from .elements import ExplicitNeuron
+from .elements import ExplicitNeuron, SYNAPSE_TYPES, synapse_type_code
+from .csr import SynapseTable
 
 import itertools
 
+from typing import Optional
+
 
 class SpikeEvent:
+    __slots__ = ("time", "affected_neuron", "type_code", "weight")
+
     def __init__(
         self,
         time: float,
@@ -14,9 +19,13 @@ class SpikeEvent:
     ):
         self.time = time
         self.affected_neuron = affected_neuron
-        self.synapse_type = synapse_type
+        self.type_code = synapse_type_code(synapse_type)
         self.weight = weight
 
+    @property
+    def synapse_type(self) -> str:
+        return SYNAPSE_TYPES[self.type_code]
+
     def __lt__(self, other):
         # Needed since spike events will be used in a heap
         return self.time < other.time
@@ -48,7 +57,57 @@ class SpikeEventQueue:
         return events
 
 
+class FanoutEventQueue:
+    """
+    Time-ordered queue of synaptic events stored as plain tuples
+    `(time, post neuron index, synapse type code, weight)`.
+
+    A spike is propagated with `add_fanout`, which slices the network's
+    `SynapseTable` and inserts the whole fan-out at once.
+    """
+
+    def __init__(self):
+        self.events: list[tuple[float, int, int, float]] = []
+
+    def add_event(self, time: float, post: int, synapse_type: int, weight: float):
+        heapq.heappush(self.events, (time, post, synapse_type, weight))
+
+    def add_fanout(self, t: float, table: SynapseTable, pre: int) -> None:
+        start, stop = table.offsets[pre], table.offsets[pre + 1]
+        if start == stop:
+            return
+        batch = [
+            (t + delay, post, synapse_type, weight)
+            for delay, post, synapse_type, weight in zip(
+                table.delays[start:stop],
+                table.post[start:stop],
+                table.types[start:stop],
+                table.weights[start:stop],
+            )
+        ]
+        self.add_events(batch)
+
+    def add_events(self, batch: list[tuple[float, int, int, float]]) -> None:
+        if len(batch) > len(self.events):
+            self.events.extend(batch)
+            heapq.heapify(self.events)
+        else:
+            for event in batch:
+                heapq.heappush(self.events, event)
+
+    def pop_events(self, current_time: float) -> list[tuple[float, int, int, float]]:
+        events = []
+        while self.events and self.events[0][0] <= current_time:
+            events.append(heapq.heappop(self.events))
+        return events
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+
 class UniqueEvent:
+    __slots__ = ("time", "id")
+
     _counter = itertools.count()
 
     def __init__(
@@ -64,6 +123,8 @@ class UniqueEvent:
 
 
 class SpikeHitEvent(UniqueEvent):
+    __slots__ = ("hitNeuron", "type_code", "weight")
+
     def __init__(
         self,
         t: float,
@@ -73,10 +134,16 @@ class SpikeHitEvent(UniqueEvent):
     ):
         super().__init__(time=t)
         self.hitNeuron = hitNeuron
-        self.synapse_type = synapse_type
+        self.type_code = synapse_type_code(synapse_type)
         self.weight = weight
 
+    @property
+    def synapse_type(self) -> str:
+        return SYNAPSE_TYPES[self.type_code]
+
 class PredictedSpikeEvent(UniqueEvent):
+    __slots__ = ("neuron",)
+
     def __init__(self, t: float, neuron: ExplicitNeuron):
         super().__init__(time=t)
         self.neuron = neuron
@@ -91,31 +158,95 @@ class CancelableEventQueue:
     def __init__(self):
         self._time_heap = []
         self._events_at_time: dict[float, list[UniqueEvent]] = {}
+        self._num_items = 0
+
+    @property
+    def num_items(self) -> int:
+        """
+        Number of pending items, maintained incrementally.
+        """
+        return self._num_items
 
-    def remove(self, event: UniqueEvent) -> None:
+    def remove(self, event: UniqueEvent) -> bool:
         if (
             event.time in self._events_at_time.keys()
             and event in self._events_at_time[event.time]
         ):
             # Note that removing an event does NOT remove that time from the heap (to avoid having to re-heapify)
             self._events_at_time[event.time].remove(event)
+            self._num_items -= 1
+            return True
+        return False
 
     def add_event(self, event: UniqueEvent) -> UniqueEvent:
-        if event.time not in self._events_at_time.keys():
-            self._events_at_time[event.time] = []
-            heapq.heappush(self._time_heap, event.time)
-        self._events_at_time[event.time].append(event)
+        self.add_at(event.time, event)
         return event
 
+    def add_at(self, time: float, item) -> None:
+        """
+        Enqueue any item at `time`. Items that are never cancelled (e.g. synaptic
+        hits) don't need to be `UniqueEvent`s.
+        """
+        if (bucket := self._events_at_time.get(time)) is None:
+            bucket = self._events_at_time[time] = []
+            heapq.heappush(self._time_heap, time)
+        bucket.append(item)
+        self._num_items += 1
+
+    def add_fanout(self, t: float, table: SynapseTable, pre: int) -> None:
+        """
+        Enqueue the synaptic hits `(post index, type code, weight)` caused by a
+        spike of neuron `pre` at time `t`.
+        """
+        start, stop = table.offsets[pre], table.offsets[pre + 1]
+        if start == stop:
+            return
+        # Group the slice by arrival time, then append each group in one step
+        groups: dict[float, list] = {}
+        hits = zip(
+            table.post[start:stop], table.types[start:stop], table.weights[start:stop]
+        )
+        for delay, hit in zip(table.delays[start:stop], hits):
+            if (group := groups.get(t + delay)) is None:
+                groups[t + delay] = [hit]
+            else:
+                group.append(hit)
+        events_at_time = self._events_at_time
+        for time, group in groups.items():
+            if (bucket := events_at_time.get(time)) is None:
+                events_at_time[time] = group
+                heapq.heappush(self._time_heap, time)
+            else:
+                bucket.extend(group)
+        self._num_items += stop - start
+
+    def next_time(self) -> Optional[float]:
+        """
+        Time of the earliest non-empty group of events, None if there is none.
+        """
+        heap = self._time_heap
+        # Times whose events were all removed are still in the heap
+        while heap and not self._events_at_time[heap[0]]:
+            del self._events_at_time[heapq.heappop(heap)]
+        return heap[0] if heap else None
+
     def pop(self) -> list[UniqueEvent]:
+        return self.pop_with_time()[1]
+
+    def pop_with_time(self) -> tuple[float, list]:
+        """
+        Pop the earliest non-empty group of events, together with their time.
+        """
         if not self._time_heap:
             raise IndexError("Pop from an empty priority queue")
         events = []
+        smallest_time = self._time_heap[0]
         while self._time_heap and len(events) == 0:
             smallest_time = heapq.heappop(self._time_heap)
             events = self._events_at_time[smallest_time]
             del self._events_at_time[smallest_time]
-        return events
+        self._num_items -= len(events)
+        return smallest_time, events
 
     def __len__(self) -> int:
         non_empty_times = [
@@ -1,4 +1,4 @@
-from .elements import Synapse, ExplicitNeuron
+from .elements import ExplicitNeuron
 
 from typing import Optional, Self
 
@@ -98,6 +98,22 @@ class SpikingNetworkModule:
         self._neurons.append(new_neuron)
         return new_neuron
 
+    def enable_state_logs(self) -> None:
+        """
+        Opt in to the per-neuron state logs (`log_V`, `log_ge`, `log_gf`) of
+        every neuron in the module and its submodules.
+        """
+        for neuron in self.neurons:
+            neuron.enable_state_logs()
+
+    def reset_state(self) -> None:
+        """
+        Put every neuron of the module and its submodules back in its initial
+        state, so that the network can be simulated again without being rebuilt.
+        """
+        for neuron in self.neurons:
+            neuron.reset_state()
+
     def add_subnetwork(self, subnet: "SpikingNetworkModule") -> None:
         self._subnetworks.append(subnet)
 
@@ -109,11 +125,35 @@ class SpikingNetworkModule:
         weight: float,
         delay: float,
     ):
-        synapse = Synapse(
-            pre_neuron=pre_neuron,
+        pre_neuron.out_synapses.add(
             post_neuron=post_neuron,
             synapse_type=synapse_type,
             weight=weight,
             delay=delay,
         )
-        pre_neuron.out_synapses.append(synapse)
+
+
+def standalone_copy(
+    mod: SpikingNetworkModule,
+) -> tuple[SpikingNetworkModule, dict[ExplicitNeuron, ExplicitNeuron]]:
+    """
+    Copy of the neurons and internal synapses of `mod`, detached from the
+    rest of its network, and the map from its neurons to their copies.
+    """
+    copy = SpikingNetworkModule(module_name=f"copy_{type(mod).__name__}")
+    copies: dict[ExplicitNeuron, ExplicitNeuron] = {}
+    for neuron in mod.neurons:
+        copies[neuron] = copy.add_neuron(
+            Vt=neuron.Vt, tm=neuron.tm, tf=neuron.tf, Vreset=neuron.Vreset
+        )
+    for neuron in mod.neurons:
+        for synapse in neuron.out_synapses:
+            if synapse.post_neuron in copies:
+                copy.connect_neurons(
+                    copies[neuron],
+                    copies[synapse.post_neuron],
+                    synapse.type,
+                    synapse.weight,
+                    synapse.delay,
+                )
+    return copy, copies
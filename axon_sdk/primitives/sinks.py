@@ -0,0 +1,303 @@
+import array
+import json
+import os
+
+import numpy as np
+
+from abc import ABC, abstractmethod
+
+
+SPIKE_RECORD_DTYPE = np.dtype([("neuron", "<i4"), ("time", "<f8")])
+
+
+class SpikeSink(ABC):
+    """
+    Storage backend for the spikes recorded during a simulation.
+
+    Neurons are registered once and given a consecutive integer id, so that
+    recording a spike does not need to carry the (long) neuron uid around.
+    `as_dict()` rebuilds the classic `{uid: [t0, t1, ...]}` spike log view.
+    """
+
+    def __init__(self) -> None:
+        self._uids: list[str] = []
+        self._ids: dict[str, int] = {}
+
+    @property
+    def uids(self) -> list[str]:
+        return self._uids
+
+    def register(self, uid: str) -> int:
+        """
+        Return the integer id of `uid`, registering it if it is new.
+        """
+        neuron_id = self._ids.get(uid)
+        if neuron_id is None:
+            neuron_id = len(self._uids)
+            self._ids[uid] = neuron_id
+            self._uids.append(uid)
+            self._on_register(neuron_id)
+        return neuron_id
+
+    def record(self, uid: str, t: float) -> None:
+        self.record_id(self.register(uid), t)
+
+    @abstractmethod
+    def record_id(self, neuron_id: int, t: float) -> None:
+        """
+        Record a spike of the neuron registered as `neuron_id` at time `t`.
+        """
+
+    def spikes_of(self, uid: str) -> list[float]:
+        return self.as_dict().get(uid, [])
+
+    @abstractmethod
+    def as_dict(self) -> dict[str, list[float]]:
+        """
+        Spike times of every registered neuron, by uid.
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """
+        Drop the recorded spikes, keeping the registered neurons.
+        """
+
+    def close(self) -> None:
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """
+        Number of recorded spikes.
+        """
+
+    def _on_register(self, neuron_id: int) -> None:
+        pass
+
+
+class DictSpikeSink(SpikeSink):
+    """
+    Dict of Python lists keyed by neuron uid (the historical spike log).
+
+    `as_dict()` returns the live dict without copying it.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._log: dict[str, list[float]] = {}
+        self._lists: list[list[float]] = []
+
+    def _on_register(self, neuron_id: int) -> None:
+        spikes: list[float] = []
+        self._log[self._uids[neuron_id]] = spikes
+        self._lists.append(spikes)
+
+    def record_id(self, neuron_id: int, t: float) -> None:
+        self._lists[neuron_id].append(t)
+
+    def spikes_of(self, uid: str) -> list[float]:
+        return self._log.get(uid, [])
+
+    def as_dict(self) -> dict[str, list[float]]:
+        return self._log
+
+    def clear(self) -> None:
+        # In place, views returned by `as_dict` stay live
+        for spikes in self._lists:
+            spikes.clear()
+
+    def __len__(self) -> int:
+        return sum(len(spikes) for spikes in self._lists)
+
+
+class ArraySpikeSink(SpikeSink):
+    """
+    Typed `array('d')` of spike times per neuron, indexed by neuron id.
+
+    Uses 8 bytes per spike instead of a boxed Python float per spike.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._times: list[array.array] = []
+        self._count = 0
+
+    def _on_register(self, neuron_id: int) -> None:
+        self._times.append(array.array("d"))
+
+    def record_id(self, neuron_id: int, t: float) -> None:
+        self._times[neuron_id].append(t)
+        self._count += 1
+
+    def spikes_of(self, uid: str) -> list[float]:
+        neuron_id = self._ids.get(uid)
+        return [] if neuron_id is None else self._times[neuron_id].tolist()
+
+    def as_dict(self) -> dict[str, list[float]]:
+        return {uid: times.tolist() for uid, times in zip(self._uids, self._times)}
+
+    def clear(self) -> None:
+        self._times = [array.array("d") for _ in self._times]
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+
+class RingBufferSpikeSink(SpikeSink):
+    """
+    Keeps only the most recent `capacity` spikes of the whole network.
+
+    Older spikes are overwritten; `dropped` tells how many were lost.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        super().__init__()
+        if capacity <= 0:
+            raise ValueError("Ring buffer capacity must be positive")
+        self.capacity = capacity
+        self._records = np.zeros(capacity, dtype=SPIKE_RECORD_DTYPE)
+        self._total = 0
+
+    def record_id(self, neuron_id: int, t: float) -> None:
+        self._records[self._total % self.capacity] = (neuron_id, t)
+        self._total += 1
+
+    @property
+    def dropped(self) -> int:
+        return max(0, self._total - self.capacity)
+
+    def records(self) -> np.ndarray:
+        """
+        Retained spike records in chronological (recording) order.
+        """
+        if self._total <= self.capacity:
+            return self._records[: self._total]
+        cursor = self._total % self.capacity
+        return np.concatenate((self._records[cursor:], self._records[:cursor]))
+
+    def as_dict(self) -> dict[str, list[float]]:
+        return _group_records(self._uids, self.records())
+
+    def clear(self) -> None:
+        self._total = 0
+
+    def __len__(self) -> int:
+        return min(self._total, self.capacity)
+
+
+class MemmapSpikeSink(SpikeSink):
+    """
+    Append-only binary file of `(neuron id, time)` records plus a uid index.
+
+    Records are staged in a fixed-size buffer and appended to `path` when it
+    fills up, so memory use is bounded regardless of the number of spikes.
+    The uid index is stored next to the data in `path + ".uids.json"` and
+    is only rewritten after new neurons were registered.
+    Reading goes through a read-only memory map of the file.
+
+    Parameters:
+    path (str): Location of the binary spike file.
+    mode (str): 'w' truncates an existing file, 'a' keeps appending to it.
+    buffer_size (int): Number of records staged in memory between writes.
+    """
+
+    def __init__(self, path: str, mode: str = "w", buffer_size: int = 65536) -> None:
+        super().__init__()
+        if mode not in ("w", "a"):
+            raise ValueError(f"Unsupported mode '{mode}', use 'w' or 'a'")
+        self.path = path
+        self.index_path = path + ".uids.json"
+        self._buffer = np.zeros(buffer_size, dtype=SPIKE_RECORD_DTYPE)
+        self._buffered = 0
+        self._flushed = 0
+        self._index_stale = True
+
+        if mode == "a" and os.path.exists(path):
+            if os.path.exists(self.index_path):
+                with open(self.index_path) as f:
+                    for uid in json.load(f):
+                        self.register(uid)
+                self._index_stale = False
+            self._flushed = os.path.getsize(path) // SPIKE_RECORD_DTYPE.itemsize
+        self._file = open(path, "ab" if mode == "a" else "wb")
+
+    def _on_register(self, neuron_id: int) -> None:
+        self._index_stale = True
+
+    def record_id(self, neuron_id: int, t: float) -> None:
+        self._buffer[self._buffered] = (neuron_id, t)
+        self._buffered += 1
+        if self._buffered == len(self._buffer):
+            self._flush_records()
+
+    def flush(self) -> None:
+        """
+        Write the staged records, and the uid index if neurons were added.
+        """
+        self._flush_records()
+        if self._index_stale:
+            with open(self.index_path, "w") as f:
+                json.dump(self._uids, f)
+            self._index_stale = False
+
+    def _flush_records(self) -> None:
+        if self._buffered:
+            self._file.write(self._buffer[: self._buffered].tobytes())
+            self._flushed += self._buffered
+            self._buffered = 0
+        self._file.flush()
+
+    def records(self) -> np.ndarray:
+        """
+        Read-only memory map over every record written so far.
+        """
+        self._flush_records()
+        if self._flushed == 0:
+            return np.zeros(0, dtype=SPIKE_RECORD_DTYPE)
+        return np.memmap(
+            self.path, dtype=SPIKE_RECORD_DTYPE, mode="r", shape=(self._flushed,)
+        )
+
+    def spikes_of(self, uid: str) -> list[float]:
+        neuron_id = self._ids.get(uid)
+        if neuron_id is None:
+            return []
+        records = self.records()
+        return records["time"][records["neuron"] == neuron_id].tolist()
+
+    def as_dict(self) -> dict[str, list[float]]:
+        return _group_records(self._uids, self.records())
+
+    def clear(self) -> None:
+        self._buffered = 0
+        self._flushed = 0
+        self._file.seek(0)
+        self._file.truncate()
+        self._file.flush()
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __len__(self) -> int:
+        return self._flushed + self._buffered
+
+
+def _group_records(uids: list[str], records: np.ndarray) -> dict[str, list[float]]:
+    """
+    Rebuild `{uid: [times]}` from `(neuron, time)` records, keeping record order.
+    """
+    spike_log: dict[str, list[float]] = {uid: [] for uid in uids}
+    if len(records) == 0:
+        return spike_log
+
+    order = np.argsort(records["neuron"], kind="stable")
+    neurons = records["neuron"][order]
+    times = records["time"][order]
+    ids, starts = np.unique(neurons, return_index=True)
+    for neuron_id, chunk in zip(ids, np.split(times, starts[1:])):
+        spike_log[uids[neuron_id]] = chunk.tolist()
+    return spike_log
@@ -0,0 +1,379 @@
+from axon_sdk.primitives import (
+    SpikingNetworkModule,
+    ExplicitNeuron,
+    DataEncoder,
+    SynapseTable,
+)
+from axon_sdk.primitives.elements import AbstractNeuron, Synapse, SYNAPSE_TYPES
+from axon_sdk.compilation.compiler import (
+    ExecutionPlan,
+    InputTrigger,
+    NeuronHeader,
+    OutputReader,
+)
+
+import importlib
+import json
+import mmap
+import struct
+
+import numpy as np
+
+from typing import Optional
+
+MAGIC = b"AXONNET1"
+ALIGNMENT = 64
+
+# Name and dtype of every array stored in a network file, in file order
+ARRAY_LAYOUT = (
+    ("Vt", "<f8"),
+    ("tm", "<f8"),
+    ("tf", "<f8"),
+    ("Vreset", "<f8"),
+    ("syn_offsets", "<i8"),
+    ("syn_post", "<i4"),
+    ("syn_type", "<i1"),
+    ("syn_weight", "<f8"),
+    ("syn_delay", "<f8"),
+    ("syn_uid", "<i8"),
+)
+
+
+class NetworkImage:
+    """
+    Array view of a serialized network, backed by a read-only memory map.
+
+    Neuron parameters are indexed by the position of the neuron in `net.neurons`.
+    Out-going synapses of neuron `i` are stored in CSR form, in the slice
+    `syn_offsets[i]:syn_offsets[i + 1]` of the `syn_*` arrays.
+
+    Use `to_module()` / `to_plan()` to rebuild the object model.
+    """
+
+    def __init__(self, header: dict, arrays: dict[str, np.ndarray]):
+        self.header = header
+        self.arrays = arrays
+
+    def __getattr__(self, name: str) -> np.ndarray:
+        arrays = self.__dict__.get("arrays", {})
+        if name in arrays:
+            return arrays[name]
+        raise AttributeError(name)
+
+    @property
+    def uids(self) -> list[str]:
+        return self.header["neurons"]
+
+    @property
+    def num_neurons(self) -> int:
+        return len(self.header["neurons"])
+
+    @property
+    def num_synapses(self) -> int:
+        return int(self.arrays["syn_offsets"][-1])
+
+    @property
+    def has_plan(self) -> bool:
+        return self.header.get("plan") is not None
+
+    def to_module(self) -> SpikingNetworkModule:
+        return self._build()[0]
+
+    def to_plan(self) -> ExecutionPlan:
+        if not self.has_plan:
+            raise ValueError("Network file does not contain an execution plan")
+        net, neurons = self._build()
+        plan_info = self.header["plan"]
+
+        triggers = []
+        for neuron_idx, normalized_value in plan_info["triggers"]:
+            trigger = InputTrigger.__new__(InputTrigger)
+            trigger.normalized_value = normalized_value
+            trigger.trigger_neuron = neurons[neuron_idx]
+            triggers.append(trigger)
+
+        reader_info = plan_info["reader"]
+        header = NeuronHeader(
+            plus=neurons[reader_info["plus"]], minus=neurons[reader_info["minus"]]
+        )
+        reader = OutputReader(header, reader_info["norm"])
+        return ExecutionPlan(net, triggers, reader)
+
+    def _build(self) -> tuple[SpikingNetworkModule, list[ExplicitNeuron]]:
+        header = self.header
+        Vt, tm, tf, Vreset = (
+            self.arrays[k].tolist() for k in ("Vt", "tm", "tf", "Vreset")
+        )
+
+        neurons = []
+        for i, uid in enumerate(header["neurons"]):
+            neuron = ExplicitNeuron(Vt=Vt[i], tm=tm[i], tf=tf[i], Vreset=Vreset[i])
+            neuron._uid = uid
+            neuron.additional_info = header["additional_info"][i]
+            neurons.append(neuron)
+
+        offsets = self.arrays["syn_offsets"].tolist()
+        post = self.arrays["syn_post"].tolist()
+        types = self.arrays["syn_type"].tolist()
+        weights = self.arrays["syn_weight"].tolist()
+        delays = self.arrays["syn_delay"].tolist()
+        syn_uids = self.arrays["syn_uid"].tolist()
+        for i, pre in enumerate(neurons):
+            for k in range(offsets[i], offsets[i + 1]):
+                pre.out_synapses.add(
+                    neurons[post[k]],
+                    SYNAPSE_TYPES[types[k]],
+                    weights[k],
+                    delays[k],
+                    uid=syn_uids[k],
+                )
+
+        modules = [_new_module(info) for info in header["modules"]]
+        for mod, info in zip(modules, header["modules"]):
+            start, stop = info["own"]
+            mod._neurons = neurons[start:stop]
+            mod._subnetworks = [modules[c] for c in info["children"]]
+            for attr, value in info["attrs"].items():
+                setattr(mod, attr, _decode_attr(value, neurons, modules))
+
+        _advance_counters(header["counters"])
+        return modules[0], neurons
+
+
+def save_network(net: SpikingNetworkModule, path: str) -> None:
+    """
+    Serialize a network (module hierarchy, neurons and synapses) to `path`.
+    """
+    _write(path, *_encode_network(net))
+
+
+def save_plan(plan: ExecutionPlan, path: str) -> None:
+    """
+    Serialize an execution plan: its network plus the input and output bindings.
+    """
+    header, arrays = _encode_network(plan.net)
+    index = {neuron: i for i, neuron in enumerate(plan.net.neurons)}
+    reader = plan.output_reader
+    header["plan"] = {
+        "triggers": [
+            [index[t.trigger_neuron], t.normalized_value] for t in plan.input_triggers
+        ],
+        "reader": {
+            "plus": index[reader.read_neuron_plus],
+            "minus": index[reader.read_neuron_minus],
+            "norm": reader.normalization,
+        },
+    }
+    _write(path, header, arrays)
+
+
+def load_image(path: str) -> NetworkImage:
+    """
+    Memory-map a network file without building any neuron or synapse object.
+
+    The mapping is read-only, so processes loading the same file share its pages.
+    """
+    with open(path, "rb") as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    if buffer[: len(MAGIC)] != MAGIC:
+        raise ValueError(f"{path} is not an axon network file")
+    (header_len,) = struct.unpack_from("<Q", buffer, len(MAGIC))
+    start = len(MAGIC) + 8
+    header = json.loads(bytes(buffer[start : start + header_len]))
+
+    arrays = {}
+    for name, dtype in ARRAY_LAYOUT:
+        offset, count = header["arrays"][name]
+        arrays[name] = np.frombuffer(buffer, dtype=dtype, count=count, offset=offset)
+    return NetworkImage(header, arrays)
+
+
+def load_network(path: str) -> SpikingNetworkModule:
+    return load_image(path).to_module()
+
+
+def load_plan(path: str) -> ExecutionPlan:
+    return load_image(path).to_plan()
+
+
+def _encode_network(net: SpikingNetworkModule) -> tuple[dict, dict[str, np.ndarray]]:
+    neurons = net.neurons
+    index = {neuron: i for i, neuron in enumerate(neurons)}
+    table = SynapseTable.from_neurons(neurons).as_numpy()
+
+    arrays = {
+        "Vt": [n.Vt for n in neurons],
+        "tm": [n.tm for n in neurons],
+        "tf": [n.tf for n in neurons],
+        "Vreset": [n.Vreset for n in neurons],
+        "syn_offsets": table["offsets"],
+        "syn_post": table["post"],
+        "syn_type": table["types"],
+        "syn_weight": table["weights"],
+        "syn_delay": table["delays"],
+        "syn_uid": table["uids"],
+    }
+    arrays = {
+        name: np.asarray(arrays[name], dtype=dtype) for name, dtype in ARRAY_LAYOUT
+    }
+
+    modules: list[SpikingNetworkModule] = []
+    _collect_modules(net, modules)
+    module_index = {id(mod): i for i, mod in enumerate(modules)}
+
+    module_infos = []
+    for mod in modules:
+        own = mod.top_module_neurons
+        start = index[own[0]] if own else 0
+        module_infos.append(
+            {
+                "class": f"{type(mod).__module__}:{type(mod).__qualname__}",
+                "uid": mod.uid,
+                "instance_count": mod.instance_count,
+                "own": [start, start + len(own)],
+                "children": [module_index[id(sub)] for sub in mod.subnetworks],
+                "attrs": _encode_attrs(mod, index, module_index),
+            }
+        )
+
+    header = {
+        "neurons": [n.uid for n in neurons],
+        "additional_info": [n.additional_info for n in neurons],
+        "modules": module_infos,
+        "counters": {
+            "neurons": AbstractNeuron._instance_count,
+            "synapses": Synapse._instance_count,
+            "modules": SpikingNetworkModule._global_instance_count,
+        },
+        "plan": None,
+    }
+    return header, arrays
+
+
+def _collect_modules(mod: SpikingNetworkModule, out: list[SpikingNetworkModule]) -> None:
+    out.append(mod)
+    for sub in mod.subnetworks:
+        _collect_modules(sub, out)
+
+
+_MODULE_INTERNALS = ("_neurons", "_subnetworks", "_instance_count", "_uid")
+
+
+def _encode_attrs(
+    mod: SpikingNetworkModule, index: dict, module_index: dict[int, int]
+) -> dict:
+    """
+    Keep the attributes needed to use a module after loading it: references to
+    its neurons (ports) and submodules, encoders and plain scalar parameters.
+    Any other attribute raises a ValueError rather than being lost.
+    """
+    encoded = {}
+    for attr, value in vars(mod).items():
+        if attr in _MODULE_INTERNALS:
+            continue
+        item = _encode_value(value, index, module_index)
+        if item is None:
+            raise ValueError(
+                f"Cannot serialize attribute '{attr}' of {type(mod).__name__}: "
+                f"unsupported {type(value).__name__} value, or a reference "
+                "outside of the network"
+            )
+        encoded[attr] = item
+    return encoded
+
+
+def _encode_value(value, index: dict, module_index: dict[int, int]) -> Optional[dict]:
+    if isinstance(value, ExplicitNeuron):
+        return {"neuron": index[value]} if value in index else None
+    if isinstance(value, SpikingNetworkModule):
+        return {"module": module_index[id(value)]} if id(value) in module_index else None
+    if isinstance(value, DataEncoder):
+        return {"encoder": [value.Tmin, value.Tcod]}
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return {"value": value}
+    if isinstance(value, (list, tuple)):
+        items = [_encode_value(v, index, module_index) for v in value]
+        if all(item is not None for item in items):
+            return {"list": items}
+    return None
+
+
+def _decode_attr(
+    item: dict, neurons: list[ExplicitNeuron], modules: list[SpikingNetworkModule]
+):
+    if "neuron" in item:
+        return neurons[item["neuron"]]
+    if "module" in item:
+        return modules[item["module"]]
+    if "encoder" in item:
+        Tmin, Tcod = item["encoder"]
+        return DataEncoder(Tmin=Tmin, Tcod=Tcod)
+    if "list" in item:
+        return [_decode_attr(v, neurons, modules) for v in item["list"]]
+    return item["value"]
+
+
+def _new_module(info: dict) -> SpikingNetworkModule:
+    """
+    Instantiate the module class without running its constructor.
+
+    Falls back to a plain `SpikingNetworkModule` if the class can't be imported
+    (e.g. it was defined inside a function).
+    """
+    cls: type = SpikingNetworkModule
+    module_name, qualname = info["class"].split(":")
+    try:
+        obj = importlib.import_module(module_name)
+        for part in qualname.split("."):
+            obj = getattr(obj, part)
+        if isinstance(obj, type) and issubclass(obj, SpikingNetworkModule):
+            cls = obj
+    except (ImportError, AttributeError):
+        pass
+
+    mod = cls.__new__(cls)
+    mod._instance_count = info["instance_count"]
+    mod._uid = info["uid"]
+    return mod
+
+
+def _advance_counters(counters: dict) -> None:
+    # Objects created after loading must not reuse uids of the loaded network
+    AbstractNeuron._instance_count = max(
+        AbstractNeuron._instance_count, counters["neurons"]
+    )
+    Synapse._instance_count = max(Synapse._instance_count, counters["synapses"])
+    SpikingNetworkModule._global_instance_count = max(
+        SpikingNetworkModule._global_instance_count, counters["modules"]
+    )
+
+
+def _write(path: str, header: dict, arrays: dict[str, np.ndarray]) -> None:
+    # Array offsets depend on the header length, which depends on the offsets:
+    # reserve room for them by measuring the header with placeholder offsets first
+    header["arrays"] = {name: [0, len(arrays[name])] for name in arrays}
+    header_len = len(json.dumps(header).encode()) + 32 * len(arrays)
+
+    offset = _align(len(MAGIC) + 8 + header_len)
+    for name, _ in ARRAY_LAYOUT:
+        header["arrays"][name] = [offset, len(arrays[name])]
+        offset = _align(offset + arrays[name].nbytes)
+
+    header_bytes = json.dumps(header).encode()
+    assert len(header_bytes) <= header_len
+    header_bytes = header_bytes.ljust(header_len)
+
+    with open(path, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<Q", header_len))
+        f.write(header_bytes)
+        for name, _ in ARRAY_LAYOUT:
+            f.seek(header["arrays"][name][0])
+            f.write(arrays[name].tobytes())
+        f.truncate(offset)
+
+
+def _align(offset: int) -> int:
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
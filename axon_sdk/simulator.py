@@ -1,148 +1,348 @@
 from axon_sdk.primitives import (
     SpikingNetworkModule,
     DataEncoder,
+    SpikeSink,
+    DictSpikeSink,
 )
-from axon_sdk.compilation import ExecutionPlan
 from axon_sdk.primitives import ExplicitNeuron
 
-from .visualization.chronogram import plot_chronogram
-from .visualization.topovis import vis_topology
+from .checkpoint import Checkpoint, QUEUE_RECORD_DTYPE
 from .compilation.compiler import OutputReader
-from .primitives.events import SpikeEventQueue
+from .engine import SimulationEngine, register_engine
+from .primitives.events import FanoutEventQueue
+from .primitives.elements import SYNAPSE_TYPES, SYNAPSE_HANDLERS
+from .primitives.csr import SynapseTable
+from .instrumentation import RunStats
 
+import heapq
 import os
+import time
 
-from typing import Self, Optional
+import numpy as np
 
+from typing import Any, Optional
+
+# Integration of the neuron equations over a step, see `Simulator`
+INTEGRATION_MODES = ("euler", "exact")
+
+
+class Simulator(SimulationEngine):
+    """
+    Time-stepped simulation of a network.
+
+    With `integration="euler"`, synaptic events arriving within a step are
+    applied at its start, neurons are advanced by one forward Euler step and
+    spikes are stamped at the end of the step. With `integration="exact"`,
+    each neuron is advanced with the exact solution of its equations from
+    event to event, and spikes are stamped at the threshold crossing within
+    the step, so that much coarser steps decode as accurately.
+
+    With `backend="numba"`, uninstrumented Euler runs use a compiled loop
+    over array-backed state with identical results (see `axon_sdk.backends`);
+    without numba installed, the Python loop is used.
+    """
 
-class Simulator:
     def __init__(
-        self, net: SpikingNetworkModule, encoder: DataEncoder, dt: float = 0.001
+        self,
+        net: SpikingNetworkModule,
+        encoder: DataEncoder,
+        dt: float = 0.001,
+        spike_sink: Optional[SpikeSink] = None,
+        instrument: bool = False,
+        integration: str = "euler",
+        backend: str = "python",
     ) -> None:
+        if integration not in INTEGRATION_MODES:
+            raise ValueError(
+                f"Unknown integration '{integration}', use one of {INTEGRATION_MODES}"
+            )
+        if backend != "python":
+            # Imported here so that numba is only loaded when asked for
+            from .backends import resolve_backend
+
+            backend = resolve_backend(backend)
         self.net = net
-        self.event_queue = SpikeEventQueue()
+        self.integration = integration
+        self.backend = backend
+        self.synapse_table = SynapseTable.from_network(net)
+        self.event_queue = FanoutEventQueue()
         self.encoder = encoder
         self.dt = dt
+        self.finished = False
+        self.time = 0.0
         self.timesteps: list[float] = []
-        self.spike_log: dict[str, list[float]] = {}
+        self.spike_sink = spike_sink if spike_sink is not None else DictSpikeSink()
         self.voltage_log: dict[str, list[tuple]] = {}
-        self.processed_syn_per_type = {"V": 0, "ge": 0, "gf": 0, "gate": 0}
-        for neuron in self.net.neurons:
-            self.spike_log[neuron.uid] = []
+        # Processed synaptic events, indexed by synapse type code
+        self._processed_counts = [0] * len(SYNAPSE_TYPES)
+
+        # Per neuron index: id in the spike sink and voltage log list
+        self._sink_ids: list[int] = []
+        self._voltage_lists: list[list[tuple]] = []
+        for neuron in self.synapse_table.neurons:
+            self._sink_ids.append(self.spike_sink.register(neuron.uid))
             self.voltage_log[neuron.uid] = []
+            self._voltage_lists.append(self.voltage_log[neuron.uid])
 
-    @classmethod
-    def init_with_plan(
-        cls, plan: ExecutionPlan, encoder: DataEncoder, dt: float = 0.001
-    ) -> Self:
-        """
-        Construct a simulator using an execution plan.
+        # Opt-in run statistics, see `RunStats`
+        self.stats: Optional[RunStats] = None
+        if instrument:
+            self.stats = RunStats.for_network(net, self.synapse_table.neurons)
 
-        Intended to be used with the compilation functionality.
+    def apply_input_spike(self, neuron: ExplicitNeuron, t: float):
         """
-        new_instance = cls(net=plan.net, encoder=encoder, dt=dt)
-
-        for trigger in plan.input_triggers:
-            new_instance.apply_input_value(
-                trigger.normalized_value, trigger.trigger_neuron
+        Apply a single spike input to a neuron at a specified time.
+        """
+        if t < self.time:
+            raise ValueError(
+                f"Input spike at t={t} is before the simulated time {self.time}"
             )
+        idx = self.synapse_table.index_of(neuron)
+        self._log_spike_occurrence(idx, t)
+        self.event_queue.add_fanout(t, self.synapse_table, idx)
 
-        return new_instance
-
-    def apply_input_value(self, value: float, neuron: ExplicitNeuron, t0: float = 0):
+    def simulate(self, simulation_time: Optional[float] = None):
         """
-        Apply a normalized value as spike interval input to a given neuron.
+        Run the network simulation for a given duration, from the end of the
+        previous run if any: `timesteps` and the step indices of the voltage
+        log go on from there.
         """
-        if not (0.0 <= value <= 1.0):
-            raise ValueError("Input value must be between 0.0 and 1.0")
-
-        spike_interval = self.encoder.encode_value(value)
-        for t_spike_in_interval in spike_interval:
-            event_time = t0 + t_spike_in_interval
-            self._log_spike_occurrence(neuron=neuron, t=event_time)
-            for synapse in neuron.out_synapses:
-                self.event_queue.add_event(
-                    time=event_time + synapse.delay,
-                    neuron=synapse.post_neuron,
-                    synapse_type=synapse.type,
-                    weight=synapse.weight,
-                )
+        if simulation_time is None:
+            raise ValueError("A time-stepped simulation needs a simulation_time")
+        first_step = len(self.timesteps)
+        num_steps = int(simulation_time / self.dt)
+        self.timesteps.extend(
+            (i + 1) * self.dt for i in range(first_step, first_step + num_steps)
+        )
 
-    def apply_input_spike(self, neuron: ExplicitNeuron, t: float):
-        """
-        Apply a single spike input to a neuron at a specified time.
-        """
-        self._log_spike_occurrence(neuron, t)
-        for synapse in neuron.out_synapses:
-            self.event_queue.add_event(
-                time=t + synapse.delay,
-                neuron=synapse.post_neuron,
-                synapse_type=synapse.type,
-                weight=synapse.weight,
+        stream = self._watch() if os.getenv("VIS", "0") == "live" else None
+        try:
+            if self.integration == "exact":
+                self._run_steps_exact(first_step, self.stats)
+            elif self.stats is None and self.backend == "numba":
+                from .backends.numba_backend import run_steps
+
+                run_steps(self, first_step)
+            else:
+                self._run_steps(first_step, self.stats)
+        finally:
+            if stream is not None:
+                stream.close()
+
+        if self.timesteps:
+            self.time = self.timesteps[-1]
+        self.finished = True
+
+        if os.getenv("VIS", "0") == "1":
+            self.launch_visualization()
+
+    def checkpoint(self) -> Checkpoint:
+        checkpoint = super().checkpoint()
+        checkpoint.header["steps"] = len(self.timesteps)
+        return checkpoint
+
+    def restore(self, checkpoint: Checkpoint) -> None:
+        super().restore(checkpoint)
+        # The voltage log refers to steps by index
+        self.timesteps = [(i + 1) * self.dt for i in range(checkpoint.header["steps"])]
+
+    def reset(self) -> None:
+        super().reset()
+        self.timesteps = []
+
+    def _options(self) -> dict[str, Any]:
+        return {"dt": self.dt, "integration": self.integration, "backend": self.backend}
+
+    def _queue_records(self) -> np.ndarray:
+        records = np.zeros(len(self.event_queue), dtype=QUEUE_RECORD_DTYPE)
+        if self.event_queue.events:
+            times, posts, types, weights = zip(*self.event_queue.events)
+            records["time"], records["target"] = times, posts
+            records["type"], records["weight"] = types, weights
+        return records
+
+    def _restore_queue(self, records: np.ndarray) -> None:
+        self.event_queue.events = list(
+            zip(
+                records["time"].tolist(),
+                records["target"].tolist(),
+                records["type"].tolist(),
+                records["weight"].tolist(),
             )
+        )
+        heapq.heapify(self.event_queue.events)
 
-    def simulate(self, simulation_time: float):
+    def _active_neurons(self) -> set[int]:
         """
-        Run the network simulation for a given total duration.
+        Neurons (by index) with non-zero ge, gf or gate, e.g. left by a previous run.
         """
-        num_steps = int(simulation_time / self.dt)
-        self.timesteps = [(i + 1) * self.dt for i in range(num_steps)]
-        # Set to track neurons with non-zero ge, gf, or gate at the end of a timestep
-        active_state_neurons: set[ExplicitNeuron] = set()
+        return {
+            idx
+            for idx, neuron in enumerate(self.synapse_table.neurons)
+            if neuron.ge != 0.0 or neuron.gf != 0.0 or neuron.gate != 0
+        }
 
-        for i, t in enumerate(self.timesteps):
+    def _run_steps(self, first_step: int, stats: Optional[RunStats] = None) -> None:
+        """
+        Step loop of `integration="euler"`, also filling `stats` if given.
+        """
+        clock = time.perf_counter
+        neurons = self.synapse_table.neurons
+        processed_counts = self._processed_counts
+        # Set to track neurons (by index) with non-zero ge, gf, or gate at the end of a timestep
+        active_state_neurons = self._active_neurons()
+        run_start = clock()
+
+        for i, t in enumerate(self.timesteps[first_step:], first_step):
+            t0 = clock() if stats is not None else 0.0
             events = self.event_queue.pop_events(t)
+            t1 = clock() if stats is not None else 0.0
 
             currently_affected_neurons = set()
-            for event in events:
+            for t_event, post, type_code, weight in events:
                 # Apply synaptic event, modifying the neuron's V, ge, gf, or gate
-                event.affected_neuron.receive_synaptic_event(
-                    event.synapse_type, event.weight
-                )
-                self.processed_syn_per_type[event.synapse_type] += 1
-                currently_affected_neurons.add(event.affected_neuron)
+                SYNAPSE_HANDLERS[type_code](neurons[post], weight)
+                processed_counts[type_code] += 1
+                currently_affected_neurons.add(post)
+                if stats is not None:
+                    stats.events_per_neuron[post] += 1
+                    stats.trace.record(t_event, post, type_code)
+            t2 = clock() if stats is not None else 0.0
 
             # Collect all neurons that should be simulated
             neurons_to_simulate = currently_affected_neurons.union(active_state_neurons)
             # Prepare a set to hold the neurons turning active after this `dt`
             newly_active_state_neurons = set()
+            propagate_time = 0.0
 
-            for neuron in neurons_to_simulate:
+            for idx in neurons_to_simulate:
+                neuron = neurons[idx]
                 (V_after_update, spike) = neuron.update_and_spike(self.dt)
 
                 if spike:
-                    self._log_spike_occurrence(neuron=neuron, t=t)
+                    p0 = clock() if stats is not None else 0.0
+                    self._log_spike_occurrence(idx, t)
                     neuron.reset()  # V becomes Vreset, ge=0, gf=0, gate=0
                     V_after_update = neuron.Vreset
-                    for synapse in neuron.out_synapses:
-                        self.event_queue.add_event(
-                            time=t + synapse.delay,
-                            neuron=synapse.post_neuron,
-                            synapse_type=synapse.type,
-                            weight=synapse.weight,
-                        )
+                    self.event_queue.add_fanout(t, self.synapse_table, idx)
+                    if stats is not None:
+                        stats.spikes_emitted += 1
+                        propagate_time += clock() - p0
 
-                self._log_voltage_value(neuron=neuron, V=V_after_update, timestep=i)
+                self._voltage_lists[idx].append((V_after_update, i))
 
                 # After update and potential reset, check if it remains internally active for the next step
                 if neuron.ge != 0.0 or neuron.gf != 0.0 or neuron.gate != 0:
-                    newly_active_state_neurons.add(neuron)
+                    newly_active_state_neurons.add(idx)
 
             active_state_neurons = newly_active_state_neurons
 
-        if os.getenv("VIS", "0") == "1":
-            self.launch_visualization()
+            if stats is not None:
+                stats.events_processed += len(events)
+                stats.active_set_sizes.append(len(neurons_to_simulate))
+                stats.queue_high_water = max(
+                    stats.queue_high_water, len(self.event_queue)
+                )
+                t3 = clock()
+                stats.phase_time["pop"] += t1 - t0
+                stats.phase_time["apply"] += t2 - t1
+                stats.phase_time["update"] += t3 - t2 - propagate_time
+                stats.phase_time["propagate"] += propagate_time
+
+        if stats is not None:
+            stats.wall_time += clock() - run_start
 
-    def _log_spike_occurrence(self, neuron: ExplicitNeuron, t: float) -> None:
-        if neuron.uid in self.spike_log:
-            self.spike_log[neuron.uid].append(t)
-        else:
-            self.spike_log[neuron.uid] = [t]
+    def _run_steps_exact(self, first_step: int, stats: Optional[RunStats]) -> None:
+        """
+        Step loop of `integration="exact"`.
+
+        The events of a step are applied at their own time: each neuron is
+        advanced exactly up to its next event, and spikes at the interpolated
+        threshold crossing, from which their fan-out is delayed. Events due
+        before the start of the step (fan-out with a delay shorter than the
+        rest of the step) are applied at its start.
 
-    def _log_voltage_value(
-        self, neuron: ExplicitNeuron, V: float, timestep: float
+        The per-event work dwarfs the instrumentation checks, so `stats` is
+        filled by the same loop; its phase times only split `pop` and `update`.
+        """
+        clock = time.perf_counter
+        dt = self.dt
+        neurons = self.synapse_table.neurons
+        processed_counts = self._processed_counts
+        active_state_neurons = self._active_neurons()
+        spikes_before = len(self.spike_sink) if stats is not None else 0
+        run_start = clock()
+
+        for i, t in enumerate(self.timesteps[first_step:], first_step):
+            t0 = clock() if stats is not None else 0.0
+            events = self.event_queue.pop_events(t)
+            t1 = clock() if stats is not None else 0.0
+
+            # Events of each neuron, in time order
+            events_of: dict[int, list[tuple[float, int, float]]] = {}
+            for t_event, post, type_code, weight in events:
+                events_of.setdefault(post, []).append((t_event, type_code, weight))
+                processed_counts[type_code] += 1
+                if stats is not None:
+                    stats.events_per_neuron[post] += 1
+                    stats.trace.record(t_event, post, type_code)
+
+            neurons_to_simulate = active_state_neurons.union(events_of)
+            newly_active_state_neurons = set()
+            step_start = t - dt
+
+            for idx in neurons_to_simulate:
+                neuron = neurons[idx]
+                t_now = step_start
+                for t_event, type_code, weight in events_of.get(idx, ()):
+                    if t_event > t_now:
+                        self._advance_exact(idx, neuron, t_now, t_event - t_now)
+                        t_now = t_event
+                    SYNAPSE_HANDLERS[type_code](neuron, weight)
+                    # Spikes on arrival, e.g. input spikes
+                    self._advance_exact(idx, neuron, t_now, 0.0)
+                self._advance_exact(idx, neuron, t_now, t - t_now)
+
+                self._voltage_lists[idx].append((neuron.V, i))
+
+                if neuron.ge != 0.0 or neuron.gf != 0.0 or neuron.gate != 0:
+                    newly_active_state_neurons.add(idx)
+
+            active_state_neurons = newly_active_state_neurons
+
+            if stats is not None:
+                stats.events_processed += len(events)
+                stats.active_set_sizes.append(len(neurons_to_simulate))
+                stats.queue_high_water = max(
+                    stats.queue_high_water, len(self.event_queue)
+                )
+                stats.phase_time["pop"] += t1 - t0
+                stats.phase_time["update"] += clock() - t1
+
+        if stats is not None:
+            stats.spikes_emitted += len(self.spike_sink) - spikes_before
+            stats.wall_time += clock() - run_start
+
+    def _advance_exact(
+        self, idx: int, neuron: ExplicitNeuron, t0: float, h: float
     ) -> None:
-        self.voltage_log[neuron.uid].append((V, timestep))
+        crossing = neuron.update_exact(h)
+        if crossing is not None:
+            t_spike = t0 + crossing
+            self._log_spike_occurrence(idx, t_spike)
+            neuron.reset()
+            self.event_queue.add_fanout(t_spike, self.synapse_table, idx)
+            # The reset state is at rest, nothing left to integrate
+
+    def _watch(self):
+        """
+        Stream the run to the live view, see `axon_sdk.visualization.stream`.
+
+        Requires `VIS=live` in environment variables.
+        """
+        from .visualization.stream import watch
+
+        return watch(self)
 
     def launch_visualization(self):
         """
@@ -150,22 +350,27 @@ class Simulator:
 
         Requires `VIS=1` in environment variables.
         """
+        # Imported here so that matplotlib is only loaded when plotting
+        from .visualization.chronogram import plot_run
+        from .visualization.topovis import vis_topology
+
         vis_topology(self.net)
-        plot_chronogram(
+        plot_run(
+            self.net,
             timesteps=self.timesteps,
             voltage_log=self.voltage_log,
             spike_log=self.spike_log,
         )
 
 
-def decode_output(sim: Simulator, reader: OutputReader) -> Optional[float]:
+def decode_output(sim: SimulationEngine, reader: OutputReader) -> Optional[float]:
     """
     Decode the final signed output value from two STICK neurons after simulation.
 
     Intended to be used together with the compilation functionality.
     """
-    spikes_plus = sim.spike_log.get(reader.read_neuron_plus.uid, [])
-    spikes_minus = sim.spike_log.get(reader.read_neuron_minus.uid, [])
+    spikes_plus = sim.spike_sink.spikes_of(reader.read_neuron_plus.uid)
+    spikes_minus = sim.spike_sink.spikes_of(reader.read_neuron_minus.uid)
 
     decoded_value = None
 
@@ -185,11 +390,13 @@ def decode_output(sim: Simulator, reader: OutputReader) -> Optional[float]:
     return decoded_value
 
 
-def count_spikes(sim: Simulator) -> int:
+def count_spikes(sim: SimulationEngine) -> int:
     """
     Count the total number of spikes emitted by all neurons in a simulation.
     """
-    count = 0
-    for neuron_spikes in sim.spike_log.values():
-        count += len(neuron_spikes)
-    return count
+    return len(sim.spike_sink)
+
+
+register_engine("timestep", Simulator)
+register_engine("timestep-exact", Simulator, integration="exact")
+register_engine("timestep-numba", Simulator, backend="numba")
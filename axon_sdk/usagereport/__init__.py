@@ -6,5 +6,26 @@ from .usagereport import (
     report_spike_usage_for_simulation,
     report_energy_and_latency_estimation_for_net,
     report_energy_and_latency_for_simulation,
-    report_spike_usage_for_simulation,
+    report_cycle_model_for_simulation,
+    report_critical_path,
+    simulation_report,
+    net_report,
+)
+from .results import (
+    NeuronUsage,
+    SpikeReport,
+    EnergyLatencyReport,
+    UsageReport,
+    aggregate_reports,
+    write_csv,
+    write_json,
+)
+from .cycle_model import HardwareConfig, CycleModelResult, simulate_cycles
+from .power_trace import PowerTrace, power_trace
+from .critical_path import CriticalPath, PathStep, critical_path
+from .calibration import (
+    CalibrationDB,
+    calibrate_module,
+    module_signature,
+    register_input_driver,
 )
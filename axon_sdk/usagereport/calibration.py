@@ -0,0 +1,333 @@
+from axon_sdk.primitives import (
+    DataEncoder,
+    ExplicitNeuron,
+    SpikingNetworkModule,
+    standalone_copy,
+)
+from axon_sdk.primitives.elements import SYNAPSE_TYPES
+from axon_sdk.predictive_simulator import PredSimulator
+from axon_sdk.networks import (
+    MemoryNetwork,
+    InvertingMemoryNetwork,
+    SignedMemoryNetwork,
+    ConstantNetwork,
+    SignedConstantNetwork,
+    SynchronizerNetwork,
+    SubtractorNetwork,
+    LinearCombinatorNetwork,
+    ExponentialNetwork,
+    LogNetwork,
+    MultiplierNetwork,
+    SignedMultiplierNetwork,
+    ScalarMultiplierNetwork,
+    DivNetwork,
+    SignFlipperNetwork,
+    SignedMultiplierNormNetwork,
+)
+from ..compilation.compiler import InjectorNetwork
+
+import hashlib
+import json
+import math
+import os
+import random
+
+from typing import Callable, Optional
+
+# Calibration format version, bumped when entries change meaning
+CALIBRATION_VERSION = 2
+
+# Time of the recall spike of memory-like modules (ms)
+RECALL_TIME = 200.0
+
+# Input magnitudes sampled by the drivers
+MIN_INPUT = 0.05
+MAX_INPUT = 1.0
+
+# A driver returns the inputs of one calibration sample: `(neuron, value)`
+# pairs applied as intervals at t=0, and `(neuron, None, t)` single spikes
+InputDriver = Callable[[SpikingNetworkModule, random.Random], list[tuple]]
+
+
+def _value(rng: random.Random) -> float:
+    return rng.uniform(MIN_INPUT, MAX_INPUT)
+
+
+def _signed(rng: random.Random, plus: ExplicitNeuron, minus: ExplicitNeuron) -> tuple:
+    # Signed values are carried by one of the two neurons of the pair
+    return (plus if rng.random() < 0.5 else minus, _value(rng))
+
+
+def _drive_input(mod, rng):
+    return [(mod.input, _value(rng))]
+
+
+def _drive_two_inputs(mod, rng):
+    return [(mod.input1, _value(rng)), (mod.input2, _value(rng))]
+
+
+def _drive_div(mod, rng):
+    # DivNetwork requires x1 <= x2
+    x1, x2 = sorted([_value(rng), _value(rng)])
+    return [(mod.input1, x1), (mod.input2, x2)]
+
+
+def _drive_memory(mod, rng):
+    return [(mod.input, _value(rng)), (mod.recall, None, RECALL_TIME)]
+
+
+def _drive_signed_memory(mod, rng):
+    return [_signed(rng, mod.input_pos, mod.input_neg), (mod.recall, None, RECALL_TIME)]
+
+
+def _drive_constant(mod, rng):
+    return [(mod.recall, None, 0.0)]
+
+
+def _drive_synchronizer(mod, rng):
+    return [(neuron, _value(rng)) for neuron in mod.input_neurons]
+
+
+def _drive_linear_combinator(mod, rng):
+    return [
+        _signed(rng, plus, minus) for plus, minus in zip(mod.input_plus, mod.input_minus)
+    ]
+
+
+def _drive_signed_two_inputs(mod, rng):
+    return [
+        _signed(rng, mod.input1_plus, mod.input1_minus),
+        _signed(rng, mod.input2_plus, mod.input2_minus),
+    ]
+
+
+def _drive_sign_flipper(mod, rng):
+    return [_signed(rng, mod.inp_plus, mod.inp_minus)]
+
+
+def _drive_injector(mod, rng):
+    return [_signed(rng, mod.inject_plus, mod.inject_minus)]
+
+
+# Input drivers by module class; subclasses use the driver of their closest
+# registered base class (e.g. AdderNetwork the one of LinearCombinatorNetwork)
+INPUT_DRIVERS: dict[type, InputDriver] = {
+    MemoryNetwork: _drive_memory,
+    InvertingMemoryNetwork: _drive_memory,
+    SignedMemoryNetwork: _drive_signed_memory,
+    ConstantNetwork: _drive_constant,
+    SignedConstantNetwork: _drive_constant,
+    SynchronizerNetwork: _drive_synchronizer,
+    SubtractorNetwork: _drive_two_inputs,
+    LinearCombinatorNetwork: _drive_linear_combinator,
+    ExponentialNetwork: _drive_input,
+    LogNetwork: _drive_input,
+    MultiplierNetwork: _drive_two_inputs,
+    SignedMultiplierNetwork: _drive_signed_two_inputs,
+    ScalarMultiplierNetwork: _drive_input,
+    DivNetwork: _drive_div,
+    SignFlipperNetwork: _drive_sign_flipper,
+    SignedMultiplierNormNetwork: _drive_signed_two_inputs,
+    InjectorNetwork: _drive_injector,
+}
+
+
+def register_input_driver(cls: type, driver: InputDriver) -> None:
+    """
+    Make modules of class `cls` (and its subclasses) calibratable.
+    """
+    INPUT_DRIVERS[cls] = driver
+
+
+def driver_for(mod: SpikingNetworkModule) -> Optional[InputDriver]:
+    for cls in type(mod).__mro__:
+        if cls in INPUT_DRIVERS:
+            return INPUT_DRIVERS[cls]
+    return None
+
+
+def module_signature(mod: SpikingNetworkModule) -> str:
+    """
+    Key of a module in the calibration database.
+
+    Made of the module class and a digest of its internal structure (neuron
+    parameters and synapses between its own neurons), which captures the
+    constructor parameters: two `LinearCombinatorNetwork`s with different
+    coefficients get different keys, two adders the same one.
+    """
+    neurons = mod.neurons
+    index = {neuron: i for i, neuron in enumerate(neurons)}
+    digest = hashlib.sha1()
+    for neuron in neurons:
+        digest.update(repr((neuron.Vt, neuron.tm, neuron.tf, neuron.Vreset)).encode())
+        synapses = neuron.out_synapses
+        for post, type_code, weight, delay in zip(
+            synapses.post, synapses.types, synapses.weights, synapses.delays
+        ):
+            if post in index:
+                digest.update(repr((index[post], type_code, weight, delay)).encode())
+    cls = type(mod)
+    return f"{cls.__module__}.{cls.__qualname__}/{digest.hexdigest()[:16]}"
+
+
+def _summary(samples: list[float]) -> dict[str, float]:
+    mean = math.fsum(samples) / len(samples)
+    variance = math.fsum((s - mean) ** 2 for s in samples) / len(samples)
+    return {
+        "mean": mean,
+        "std": math.sqrt(variance),
+        "min": min(samples),
+        "max": max(samples),
+    }
+
+
+def calibrate_module(
+    mod: SpikingNetworkModule, samples: int = 16, seed: int = 0, dt: float = 0.01
+) -> dict:
+    """
+    Simulate a module over sampled inputs and summarize its activity.
+
+    The entry holds, over the samples, the distribution (mean, std, min, max)
+    of the processed events of each synapse type, of the emitted spikes and of
+    the latency: time of the last spike after the first input.
+    """
+    driver = driver_for(mod)
+    if driver is None:
+        raise ValueError(
+            f"No input driver for module {mod.uid} of class {type(mod).__name__}; "
+            "add one with register_input_driver()"
+        )
+    encoder = getattr(mod, "encoder", None) or DataEncoder()
+    rng = random.Random(seed)
+    events: dict[str, list[float]] = {name: [] for name in SYNAPSE_TYPES}
+    spikes: list[float] = []
+    latencies: list[float] = []
+
+    for _ in range(samples):
+        copy, copies = standalone_copy(mod)
+        sim = PredSimulator(copy, encoder, dt=dt)
+        first_input = math.inf
+        for neuron, value, *t in driver(mod, rng):
+            if value is None:
+                sim.apply_input_spike(copies[neuron], t=t[0])
+                first_input = min(first_input, t[0])
+            else:
+                sim.apply_input_value(value, copies[neuron], t0=0)
+                first_input = min(first_input, 0.0)
+        sim.simulate()
+
+        counts = sim.processed_syn_per_type
+        for name in SYNAPSE_TYPES:
+            events[name].append(counts[name])
+        spike_times = [t for times in sim.spike_log.values() for t in times]
+        spikes.append(len(spike_times))
+        latencies.append(max(spike_times, default=first_input) - first_input)
+
+    return {
+        "class": f"{type(mod).__module__}.{type(mod).__qualname__}",
+        "neurons": len(mod.neurons),
+        "samples": samples,
+        "seed": seed,
+        "dt": dt,
+        "events": {name: _summary(values) for name, values in events.items()},
+        "spikes": _summary(spikes),
+        "latency": _summary(latencies),
+    }
+
+
+def default_calibration_path() -> str:
+    cache_dir = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_dir, "axon_sdk", "calibration.json")
+
+
+class CalibrationDB:
+    """
+    Calibration entries of module types, keyed by `module_signature` and the
+    calibration settings (`samples`, `seed` and `dt`, see `calibrate_module`).
+
+    Modules are calibrated on first lookup and the entries are cached as JSON
+    in `path` (None keeps them in memory only).
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        samples: int = 16,
+        seed: int = 0,
+        dt: float = 0.01,
+    ) -> None:
+        self.path = path
+        self.samples = samples
+        self.seed = seed
+        self.dt = dt
+        self.entries: dict[str, dict] = {}
+        if path is not None and os.path.exists(path):
+            with open(path) as f:
+                data = json.load(f)
+            if data.get("version") == CALIBRATION_VERSION:
+                self.entries = data["entries"]
+
+    @classmethod
+    def default(cls) -> "CalibrationDB":
+        return cls(default_calibration_path())
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"version": CALIBRATION_VERSION, "entries": self.entries}, f)
+        os.replace(tmp_path, self.path)
+
+    def __contains__(self, mod: SpikingNetworkModule) -> bool:
+        return self._key(mod) in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def lookup(self, mod: SpikingNetworkModule, save: bool = True) -> dict:
+        """
+        Calibration entry of `mod`, calibrating it if it is not cached yet.
+        """
+        key = self._key(mod)
+        if key not in self.entries:
+            self.entries[key] = calibrate_module(
+                mod, samples=self.samples, seed=self.seed, dt=self.dt
+            )
+            if save:
+                self.save()
+        return self.entries[key]
+
+    def _key(self, mod: SpikingNetworkModule) -> str:
+        return f"{module_signature(mod)}/{self.samples}/{self.seed}/{self.dt!r}"
+
+    def estimate(
+        self, net: SpikingNetworkModule
+    ) -> list[tuple[SpikingNetworkModule, dict]]:
+        """
+        Calibration entries covering `net`.
+
+        Calibratable modules are looked up as a whole; the others are split
+        into their subnetworks. Neurons of modules without a driver that are
+        not inside a calibratable subnetwork aren't covered.
+        """
+        covered: list[tuple[SpikingNetworkModule, dict]] = []
+        stack = [net]
+        num_entries = len(self.entries)
+        while stack:
+            mod = stack.pop()
+            if driver_for(mod) is not None:
+                covered.append((mod, self.lookup(mod, save=False)))
+            elif mod.subnetworks:
+                stack.extend(reversed(mod.subnetworks))
+            elif mod is net:
+                raise ValueError(
+                    f"No input driver for module {mod.uid} of class "
+                    f"{type(mod).__name__}; add one with register_input_driver()"
+                )
+        if len(self.entries) != num_entries:
+            self.save()
+        return covered
@@ -0,0 +1,217 @@
+from axon_sdk.primitives import ExplicitNeuron
+from axon_sdk.primitives.elements import SYNAPSE_TYPES
+from axon_sdk.instrumentation import module_uids_of
+from ..compilation.compiler import OutputReader
+
+import bisect
+
+from typing import Optional, Union
+
+
+class PathStep:
+    """
+    One spike of a critical path.
+
+    Parameters:
+        neuron_uid: uid of the spiking neuron
+        module_uid: module owning the neuron
+        t: spike time (ms)
+        arrival: arrival time of the event that triggered the spike, which
+            is `t` for the first step (an input spike)
+        synapse_type: type of the triggering synapse, None for the first step
+    """
+
+    def __init__(
+        self,
+        neuron_uid: str,
+        module_uid: str,
+        t: float,
+        arrival: float,
+        synapse_type: Optional[str],
+    ):
+        self.neuron_uid = neuron_uid
+        self.module_uid = module_uid
+        self.t = t
+        self.arrival = arrival
+        self.synapse_type = synapse_type
+
+    def as_dict(self) -> dict:
+        return {
+            "neuron": self.neuron_uid,
+            "module": self.module_uid,
+            "t": self.t,
+            "arrival": self.arrival,
+            "synapse_type": self.synapse_type,
+        }
+
+    def __repr__(self) -> str:
+        return f"<PathStep {self.neuron_uid} @ {self.t:.3f} ms in {self.module_uid}>"
+
+
+class CriticalPath:
+    """
+    Chain of spikes that determined the time of an output spike.
+
+    The time between two consecutive steps is spent in the module of the
+    later one: the synapse delay to reach it, then the integration up to its
+    spike. The time between the first input spike of the run (`start`) and
+    the first step is `input_wait`, so that
+    `input_wait + sum(residence().values()) == latency`.
+    """
+
+    def __init__(self, steps: list[PathStep], start: float):
+        self.steps = steps
+        self.start = start
+
+    @property
+    def end(self) -> float:
+        return self.steps[-1].t
+
+    @property
+    def latency(self) -> float:
+        return self.end - self.start
+
+    @property
+    def input_wait(self) -> float:
+        return self.steps[0].t - self.start
+
+    @property
+    def modules(self) -> list[str]:
+        """
+        Modules crossed by the path, in order; a module is repeated if the
+        path leaves it and comes back.
+        """
+        modules: list[str] = []
+        for step in self.steps:
+            if not modules or modules[-1] != step.module_uid:
+                modules.append(step.module_uid)
+        return modules
+
+    def residence(self) -> dict[str, float]:
+        """
+        Time the path spends in each module (ms), in path order.
+        """
+        residence: dict[str, float] = {self.steps[0].module_uid: 0.0}
+        for prev, step in zip(self.steps, self.steps[1:]):
+            residence[step.module_uid] = residence.get(step.module_uid, 0.0) + (
+                step.t - prev.t
+            )
+        return residence
+
+    def as_dict(self) -> dict:
+        return {
+            "start": self.start,
+            "end": self.end,
+            "latency": self.latency,
+            "input_wait": self.input_wait,
+            "modules": self.modules,
+            "residence": self.residence(),
+            "steps": [step.as_dict() for step in self.steps],
+        }
+
+    def print(self) -> None:
+        print("------------- CRITICAL PATH REPORT ---------------")
+        print(f"Latency:               {self.latency:.3f} ms")
+        print(f"  from first input at  {self.start:.3f} ms")
+        print(f"  to output spike at   {self.end:.3f} ms")
+        print(f"Input wait:            {self.input_wait:.3f} ms")
+        print("-------")
+        for uid, time in sorted(
+            self.residence().items(), key=lambda item: item[1], reverse=True
+        ):
+            share = time / self.latency if self.latency > 0 else 0.0
+            print(f"    {uid}: {time:.3f} ms ({share:.1%})")
+        print("-------")
+        print("Path: " + " -> ".join(self.modules))
+        print("\n")
+
+    def __repr__(self) -> str:
+        return (
+            f"<CriticalPath: {self.latency:.3f} ms through "
+            f"{len(self.modules)} modules, {len(self.steps)} spikes>"
+        )
+
+
+def critical_path(
+    sim,
+    target: Union[OutputReader, ExplicitNeuron],
+    spike: int = 1,
+    depth: Optional[int] = 1,
+    tolerance: float = 1e-6,
+) -> CriticalPath:
+    """
+    Trace back the spikes that determined an output spike of a finished run.
+
+    Starting from spike number `spike` of the target neuron (the second one
+    by default: the end of the output interval), each spike is attributed to
+    the excitatory event that arrived last before it, i.e. the one that
+    completed the conditions for the neuron to fire. The trace stops at a
+    spike without such an event: an input spike.
+
+    Parameters:
+        sim: finished simulation engine
+        target: an `OutputReader` (its neuron that spiked) or a neuron
+        spike: index of the spike of the target neuron
+        depth: modules are attributed at this depth of the module tree, 1
+            being the modules of the compiled operations; None for the
+            innermost modules
+        tolerance: slack (ms) on arrival times, for time-stepped runs
+    """
+    spike_log = sim.spike_log
+    if isinstance(target, OutputReader):
+        plus, minus = target.read_neuron_plus, target.read_neuron_minus
+        target = plus if len(spike_log.get(plus.uid, ())) > 0 else minus
+    target_spikes = spike_log.get(target.uid, [])
+    if not -len(target_spikes) <= spike < len(target_spikes):
+        raise ValueError(
+            f"Neuron {target.uid} spiked {len(target_spikes)} times, "
+            f"no spike number {spike}"
+        )
+
+    neurons = sim.net.neurons
+    owners = dict(zip(neurons, module_uids_of(sim.net, neurons, max_depth=depth)))
+    # Excitatory synapses arriving to each neuron
+    incoming: dict[ExplicitNeuron, list[tuple[ExplicitNeuron, float, int]]] = {}
+    for pre in neurons:
+        synapses = pre.out_synapses
+        for post, type_code, weight, delay in zip(
+            synapses.post, synapses.types, synapses.weights, synapses.delays
+        ):
+            if weight > 0:
+                incoming.setdefault(post, []).append((pre, delay, type_code))
+
+    neuron, t = target, target_spikes[spike]
+    steps: list[PathStep] = []
+    visited: set[tuple[ExplicitNeuron, float]] = set()
+    while True:
+        step = PathStep(neuron.uid, owners[neuron], t, t, None)
+        steps.append(step)
+        visited.add((neuron, t))
+        cause = _last_arrival(incoming.get(neuron, ()), spike_log, t + tolerance)
+        if cause is None or cause[:2] in visited:
+            break
+        neuron, t, step.arrival, type_code = cause
+        step.synapse_type = SYNAPSE_TYPES[type_code]
+    steps.reverse()
+
+    start = min(
+        (times[0] for times in spike_log.values() if len(times) > 0),
+        default=steps[0].t,
+    )
+    return CriticalPath(steps, min(start, steps[0].t))
+
+
+def _last_arrival(incoming, spike_log: dict[str, list[float]], t_max: float):
+    """
+    Latest excitatory event arriving at or before `t_max`, as
+    (pre neuron, pre spike time, arrival time, synapse type code).
+    """
+    best = None
+    for pre, delay, type_code in incoming:
+        times = spike_log.get(pre.uid, ())
+        i = bisect.bisect_right(times, t_max - delay)
+        if i > 0:
+            arrival = times[i - 1] + delay
+            if best is None or arrival > best[2]:
+                best = (pre, times[i - 1], arrival, type_code)
+    return best
@@ -0,0 +1,286 @@
+from axon_sdk.instrumentation import EventTrace
+from axon_sdk.primitives.elements import SynapseType
+from .power_metrics import delays_dict
+
+import heapq
+import math
+
+from typing import Optional
+
+import numpy as np
+
+SCHEDULERS = ("static", "dynamic")
+
+
+class HardwareConfig:
+    """
+    Parameters of the modelled STICK hardware.
+
+    Parameters:
+        num_cores: neuron cores processing events in parallel
+        clock_speed_mhz: clock frequency
+        scheduler: "static" maps neuron `i` to core `i % num_cores`, as when
+            neuron state lives in core-local SRAM; "dynamic" dispatches the
+            events of each timestamp to the least loaded core
+        sram_ports: concurrent accesses of a shared SRAM, or None for
+            core-local SRAMs without contention
+        predictive_search_timesteps: horizon of the spike time search that
+            follows ge, gf and gate events (binary search, log2 steps)
+        delays: cycles per pipeline stage, defaults to `delays_dict`
+    """
+
+    def __init__(
+        self,
+        num_cores: int = 1,
+        clock_speed_mhz: float = 200.0,
+        scheduler: str = "static",
+        sram_ports: Optional[int] = None,
+        predictive_search_timesteps: int = 5000,
+        delays: Optional[dict[str, int]] = None,
+    ):
+        if num_cores < 1:
+            raise ValueError(f"num_cores must be at least 1, got {num_cores}")
+        if scheduler not in SCHEDULERS:
+            raise ValueError(
+                f"Unknown scheduler '{scheduler}', expected one of {SCHEDULERS}"
+            )
+        if sram_ports is not None and sram_ports < 1:
+            raise ValueError(f"sram_ports must be at least 1, got {sram_ports}")
+        self.num_cores = num_cores
+        self.clock_speed_mhz = clock_speed_mhz
+        self.scheduler = scheduler
+        self.sram_ports = sram_ports
+        self.predictive_search_timesteps = predictive_search_timesteps
+        self.delays = dict(delays_dict if delays is None else delays)
+
+    @property
+    def search_updates(self) -> int:
+        return math.ceil(math.log2(self.predictive_search_timesteps))
+
+    @property
+    def cycles_per_update(self) -> int:
+        return (
+            self.delays["sram_access"]
+            + self.delays["computation"]
+            + self.delays["scheduling"]
+        )
+
+    @property
+    def pipeline_cycles(self) -> int:
+        return (
+            self.delays["encoding"]
+            + self.delays["decoding"]
+            + self.delays["scheduling"]
+        )
+
+
+class CycleModelResult:
+    """
+    Outcome of replaying an event trace on the modelled hardware.
+
+    Events sharing a timestamp form a slot: they may run in parallel, but a
+    slot starts only after the previous one finished. Per-slot arrays are in
+    timestamp order.
+    """
+
+    def __init__(
+        self,
+        config: HardwareConfig,
+        slot_times: np.ndarray,
+        slot_cycles: np.ndarray,
+        slot_events: np.ndarray,
+        slot_updates: np.ndarray,
+        core_busy_cycles: np.ndarray,
+        memory_stall_cycles: int,
+    ):
+        self.config = config
+        self.slot_times = slot_times
+        self.slot_cycles = slot_cycles
+        self.slot_events = slot_events
+        self.slot_updates = slot_updates
+        self.core_busy_cycles = core_busy_cycles
+        self.memory_stall_cycles = memory_stall_cycles
+
+    @property
+    def events(self) -> int:
+        return int(self.slot_events.sum())
+
+    @property
+    def updates(self) -> int:
+        return int(self.slot_updates.sum())
+
+    @property
+    def total_cycles(self) -> int:
+        return int(self.slot_cycles.sum()) + self.config.pipeline_cycles
+
+    @property
+    def latency_seconds(self) -> float:
+        return self.total_cycles / (self.config.clock_speed_mhz * 1e6)
+
+    @property
+    def slot_start_cycles(self) -> np.ndarray:
+        """
+        Hardware cycle at which each slot starts.
+        """
+        starts = np.zeros_like(self.slot_cycles)
+        np.cumsum(self.slot_cycles[:-1], out=starts[1:])
+        return starts + self.config.delays["encoding"]
+
+    @property
+    def core_utilization(self) -> np.ndarray:
+        """
+        Fraction of the total cycles each core spent processing events.
+        """
+        return self.core_busy_cycles / max(self.total_cycles, 1)
+
+    @property
+    def utilization(self) -> float:
+        return float(self.core_utilization.mean())
+
+    @property
+    def stall_cycles(self) -> int:
+        """
+        Core cycles spent waiting, summed over cores: on the slowest core of
+        each slot, on the shared SRAM, and in the pipeline stages.
+        """
+        return int(self.total_cycles * self.config.num_cores - self.core_busy_cycles.sum())
+
+    @property
+    def max_parallelism(self) -> int:
+        """
+        Most events sharing a timestamp.
+        """
+        return int(self.slot_events.max()) if len(self.slot_events) else 0
+
+    def as_dict(self) -> dict:
+        return {
+            "num_cores": self.config.num_cores,
+            "scheduler": self.config.scheduler,
+            "clock_speed_mhz": self.config.clock_speed_mhz,
+            "events": self.events,
+            "updates": self.updates,
+            "slots": len(self.slot_cycles),
+            "max_parallelism": self.max_parallelism,
+            "total_cycles": self.total_cycles,
+            "latency_seconds": self.latency_seconds,
+            "utilization": self.utilization,
+            "stall_cycles": self.stall_cycles,
+            "memory_stall_cycles": self.memory_stall_cycles,
+        }
+
+    def print(self) -> None:
+        config = self.config
+        print("--------------- CYCLE MODEL REPORT ---------------")
+        print(f"Cores:                 {config.num_cores} ({config.scheduler} scheduling)")
+        print(f"Events / updates:      {self.events} / {self.updates}")
+        print(f"Timestamps:            {len(self.slot_cycles)}")
+        print(f"Max. parallel events:  {self.max_parallelism}")
+        print("-------")
+        print(f"Total cycles:          {self.total_cycles}")
+        print(f"Latency per iteration: {self.latency_seconds} s")
+        print(f"Core utilization:      {self.utilization:.1%}")
+        print(f"Stall cycles:          {self.stall_cycles}")
+        if config.sram_ports is not None:
+            print(f"  waiting on SRAM:     {self.memory_stall_cycles}")
+        print("\n")
+
+    def __repr__(self) -> str:
+        return (
+            f"<CycleModelResult: {self.total_cycles} cycles on "
+            f"{self.config.num_cores} cores, utilization {self.utilization:.1%}>"
+        )
+
+
+def updates_per_event(types: np.ndarray, config: HardwareConfig) -> np.ndarray:
+    """
+    Neuron updates needed by each event: 1 for V events, a spike time search
+    for conductance (ge, gf) and gate events.
+    """
+    return np.where(types == int(SynapseType.V), 1, config.search_updates)
+
+
+def simulate_cycles(
+    trace: EventTrace, config: Optional[HardwareConfig] = None
+) -> CycleModelResult:
+    """
+    Replay an event trace through the neuron cores of `config`.
+
+    The trace comes from a simulator run with `instrument=True`
+    (`sim.stats.trace`). With one core and no SRAM contention, the total
+    matches `estimate_performance` for the same update counts.
+    """
+    config = config if config is not None else HardwareConfig()
+    arrays = trace.as_numpy()
+    times, neurons = arrays["times"], arrays["neurons"]
+    updates = updates_per_event(arrays["types"], config)
+    costs = updates * config.cycles_per_update
+    num_cores = config.num_cores
+
+    slot_times, slot_of_event = np.unique(times, return_inverse=True)
+    num_slots = len(slot_times)
+    slot_events = np.bincount(slot_of_event, minlength=num_slots)
+    slot_updates = np.bincount(slot_of_event, weights=updates, minlength=num_slots)
+
+    if config.scheduler == "static":
+        core_of_event = neurons % num_cores
+        busy = np.bincount(
+            slot_of_event * num_cores + core_of_event,
+            weights=costs,
+            minlength=num_slots * num_cores,
+        ).reshape(num_slots, num_cores)
+    else:
+        busy = _dynamic_schedule(slot_of_event, neurons, costs, num_slots, num_cores)
+
+    slot_cycles = busy.max(axis=1) if num_slots else np.zeros(0)
+    memory_stall_cycles = 0
+    if config.sram_ports is not None:
+        # A shared SRAM serves at most `sram_ports` accesses at a time
+        memory_cycles = np.ceil(
+            slot_updates * config.delays["sram_access"] / config.sram_ports
+        )
+        memory_stall_cycles = int(np.maximum(memory_cycles - slot_cycles, 0).sum())
+        slot_cycles = np.maximum(slot_cycles, memory_cycles)
+
+    return CycleModelResult(
+        config,
+        slot_times,
+        slot_cycles.astype(np.int64),
+        slot_events,
+        slot_updates.astype(np.int64),
+        busy.sum(axis=0).astype(np.int64),
+        memory_stall_cycles,
+    )
+
+
+def _dynamic_schedule(
+    slot_of_event: np.ndarray,
+    neurons: np.ndarray,
+    costs: np.ndarray,
+    num_slots: int,
+    num_cores: int,
+) -> np.ndarray:
+    """
+    Busy cycles per slot and core when each slot's work is dispatched to the
+    least loaded core, longest first. Events hitting the same neuron in a slot
+    update the same state, so they run back to back on one core.
+    """
+    busy = np.zeros((num_slots, num_cores))
+    # Work per (slot, neuron), in slot order
+    keys = slot_of_event.astype(np.int64) * (int(neurons.max(initial=0)) + 1) + neurons
+    unique_keys, key_of_event = np.unique(keys, return_inverse=True)
+    work = np.bincount(key_of_event, weights=costs)
+    work_slots = unique_keys // (int(neurons.max(initial=0)) + 1)
+    bounds = np.searchsorted(work_slots, np.arange(num_slots + 1))
+
+    for slot in range(num_slots):
+        jobs = work[bounds[slot] : bounds[slot + 1]]
+        if len(jobs) <= num_cores:
+            busy[slot, : len(jobs)] = jobs
+            continue
+        loads = [(0.0, core) for core in range(num_cores)]
+        for job in np.sort(jobs)[::-1]:
+            load, core = heapq.heappop(loads)
+            heapq.heappush(loads, (load + job, core))
+        for load, core in loads:
+            busy[slot, core] = load
+    return busy
@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Dict, Union
 import math
 
 # Delays per stage (in clock cycles)
@@ -10,6 +10,17 @@ delays_dict = {
     "computation": 1,
 }
 
+# Units of the values of `estimate_power_and_energy`
+UNITS = {
+    "P_leak": "W",
+    "P_idle": "W",
+    "P_dynamic": "W",
+    "P_total": "W",
+    "E_total": "J",
+    "I_total": "A",
+    "r_SOP": "SOP/s",
+}
+
 
 def human_readable(value: float, unit: str = "") -> str:
     prefixes = [
@@ -99,9 +110,13 @@ def estimate_power_and_energy(
     P_leak_uw: float = 27,
     P_idle_per_mhz_uw: float = 178,
     V_dd: float = 0.9,
-) -> Dict[str, str]:
+    formatted: bool = True,
+) -> Union[Dict[str, str], Dict[str, float]]:
     """
     Estimate power, energy and current draw of STICK hardware.
+
+    Values are human readable strings, or raw numbers in SI units (W, J, A,
+    SOP/s) with `formatted=False`.
     """
 
     total_updates = perf["total_updates"]
@@ -116,12 +131,15 @@ def estimate_power_and_energy(
     E_total = P_total * time_seconds
     I_total = P_total / V_dd
 
-    return {
-        "P_leak": human_readable(P_leak, "W"),
-        "P_idle": human_readable(P_idle, "W"),
-        "P_dynamic": human_readable(P_dyn, "W"),
-        "P_total": human_readable(P_total, "W"),
-        "E_total": human_readable(E_total, "J"),
-        "I_total": human_readable(I_total, "A"),
-        "r_SOP": human_readable(r_sop, "SOP/s"),
+    values = {
+        "P_leak": P_leak,
+        "P_idle": P_idle,
+        "P_dynamic": P_dyn,
+        "P_total": P_total,
+        "E_total": E_total,
+        "I_total": I_total,
+        "r_SOP": r_sop,
     }
+    if not formatted:
+        return values
+    return {key: human_readable(value, UNITS[key]) for key, value in values.items()}
@@ -0,0 +1,211 @@
+from axon_sdk.instrumentation import RunStats
+from .cycle_model import HardwareConfig, simulate_cycles, updates_per_event
+
+from typing import Optional
+
+import numpy as np
+
+TIMEBASES = ("hardware", "simulation")
+
+
+class PowerTrace:
+    """
+    Power and energy of a run, binned over time.
+
+    Bin `i` spans `[bin_edges[i], bin_edges[i + 1])` seconds. All arrays have
+    one entry per bin; `module_energy` has one row per entry of `module_uids`.
+
+    Parameters:
+        bin_edges: bin boundaries (s)
+        dynamic_energy: energy of the synaptic operations of each bin (J)
+        static_power: leakage plus idle power, constant over the run (W)
+        module_uids: uids of the modules owning the neurons hit by events
+        module_energy: dynamic energy of each module per bin (J)
+        V_dd: supply voltage (V)
+    """
+
+    def __init__(
+        self,
+        bin_edges: np.ndarray,
+        dynamic_energy: np.ndarray,
+        static_power: float,
+        module_uids: list[str],
+        module_energy: np.ndarray,
+        V_dd: float,
+    ):
+        self.bin_edges = bin_edges
+        self.dynamic_energy = dynamic_energy
+        self.static_power = static_power
+        self.module_uids = module_uids
+        self.module_energy = module_energy
+        self.V_dd = V_dd
+
+    @property
+    def bin_widths(self) -> np.ndarray:
+        return np.diff(self.bin_edges)
+
+    @property
+    def bin_centers(self) -> np.ndarray:
+        return (self.bin_edges[:-1] + self.bin_edges[1:]) / 2
+
+    @property
+    def duration(self) -> float:
+        return float(self.bin_edges[-1] - self.bin_edges[0])
+
+    @property
+    def energy(self) -> np.ndarray:
+        """
+        Total energy of each bin (J).
+        """
+        return self.dynamic_energy + self.static_power * self.bin_widths
+
+    @property
+    def cumulative_energy(self) -> np.ndarray:
+        return np.cumsum(self.energy)
+
+    @property
+    def dynamic_power(self) -> np.ndarray:
+        return self.dynamic_energy / self.bin_widths
+
+    @property
+    def power(self) -> np.ndarray:
+        """
+        Average total power over each bin (W).
+        """
+        return self.energy / self.bin_widths
+
+    @property
+    def current(self) -> np.ndarray:
+        return self.power / self.V_dd
+
+    @property
+    def total_energy(self) -> float:
+        return float(self.energy.sum())
+
+    @property
+    def peak_power(self) -> float:
+        return float(self.power.max())
+
+    @property
+    def average_power(self) -> float:
+        return self.total_energy / self.duration
+
+    def energy_per_module(self) -> dict[str, float]:
+        """
+        Dynamic energy of each module over the whole run (J).
+        """
+        totals = self.module_energy.sum(axis=1)
+        return {uid: float(e) for uid, e in zip(self.module_uids, totals)}
+
+    def as_dict(self) -> dict:
+        return {
+            "duration": self.duration,
+            "bins": len(self.dynamic_energy),
+            "total_energy": self.total_energy,
+            "dynamic_energy": float(self.dynamic_energy.sum()),
+            "static_power": self.static_power,
+            "peak_power": self.peak_power,
+            "average_power": self.average_power,
+            "peak_current": self.peak_power / self.V_dd,
+            "energy_per_module": self.energy_per_module(),
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"<PowerTrace: {len(self.dynamic_energy)} bins over {self.duration:.3g} s, "
+            f"peak {self.peak_power:.3g} W, average {self.average_power:.3g} W>"
+        )
+
+
+def power_trace(
+    stats: RunStats,
+    num_bins: int = 100,
+    bin_width: Optional[float] = None,
+    timebase: str = "hardware",
+    config: Optional[HardwareConfig] = None,
+    module_uids: Optional[list[str]] = None,
+    E_sop_pj: float = 12,
+    P_leak_uw: float = 27,
+    P_idle_per_mhz_uw: float = 178,
+    V_dd: float = 0.9,
+) -> PowerTrace:
+    """
+    Binned power and energy trace of an instrumented run.
+
+    Dynamic energy is `E_sop_pj` per neuron update, attributed to the module
+    owning the updated neuron; leakage and idle power are constant, with the
+    same model as `estimate_power_and_energy`.
+
+    Parameters:
+        stats: `sim.stats` of a simulator created with `instrument=True`
+        num_bins: number of bins, ignored if `bin_width` is given
+        bin_width: width of the bins (s)
+        timebase: "hardware" places events at the cycle where the modelled
+            hardware processes them (see `simulate_cycles`), "simulation" at
+            their simulated time, as for hardware paced in real time
+        config: modelled hardware; its clock sets the idle power
+        module_uids: module of each neuron index for the attribution,
+            defaults to the innermost module (`stats.module_uids`); see
+            `module_uids_of` to attribute to the modules at a given depth
+    """
+    if timebase not in TIMEBASES:
+        raise ValueError(f"Unknown timebase '{timebase}', expected one of {TIMEBASES}")
+    trace = stats.trace
+    if len(trace) == 0:
+        raise ValueError("Empty event trace: nothing was simulated")
+    config = config if config is not None else HardwareConfig()
+    clock_hz = config.clock_speed_mhz * 1e6
+
+    arrays = trace.as_numpy()
+    updates = updates_per_event(arrays["types"], config)
+
+    if timebase == "hardware":
+        cycles = simulate_cycles(trace, config)
+        _, slot_of_event = np.unique(arrays["times"], return_inverse=True)
+        event_times = cycles.slot_start_cycles[slot_of_event] / clock_hz
+        duration = cycles.latency_seconds
+    else:
+        # Simulated times are in ms
+        event_times = arrays["times"] * 1e-3
+        duration = float(event_times[-1])
+    if duration <= 0:
+        raise ValueError(f"The run has no duration in the '{timebase}' timebase")
+
+    if bin_width is not None:
+        # The last bin ends with the run, without leaving a sliver of a bin
+        starts = np.arange(0.0, duration, bin_width)
+        starts = starts[starts < duration - 1e-6 * bin_width]
+        bin_edges = np.append(starts, duration)
+        num_bins = len(bin_edges) - 1
+    else:
+        bin_edges = np.linspace(0.0, duration, num_bins + 1)
+    bin_of_event = np.clip(
+        np.searchsorted(bin_edges, event_times, side="right") - 1, 0, num_bins - 1
+    )
+
+    event_energy = updates * E_sop_pj * 1e-12
+    dynamic_energy = np.bincount(bin_of_event, weights=event_energy, minlength=num_bins)
+
+    # Attribution to the module owning each neuron
+    if module_uids is None:
+        module_uids = stats.module_uids
+    module_names, module_of_neuron = np.unique(
+        np.asarray(module_uids, dtype=object), return_inverse=True
+    )
+    module_of_event = module_of_neuron[arrays["neurons"]]
+    num_modules = len(module_names)
+    module_energy = np.bincount(
+        module_of_event * num_bins + bin_of_event,
+        weights=event_energy,
+        minlength=num_modules * num_bins,
+    ).reshape(num_modules, num_bins)
+
+    static_power = P_leak_uw * 1e-6 + P_idle_per_mhz_uw * config.clock_speed_mhz * 1e-6
+    return PowerTrace(
+        bin_edges,
+        dynamic_energy,
+        static_power,
+        [str(uid) for uid in module_names],
+        module_energy,
+        V_dd,
+    )
@@ -0,0 +1,321 @@
+from .power_metrics import human_readable, UNITS
+from .cycle_model import CycleModelResult
+
+import csv
+import json
+import math
+
+from typing import IO, Iterable, Optional, Union
+
+
+class NeuronUsage:
+    """
+    Neuron count of a module and, recursively, of its submodules.
+
+    Parameters:
+        uid: uid of the module
+        neurons: neurons of the module, submodules included
+        own_neurons: neurons of the module outside its submodules
+        submodules: usage of each submodule
+    """
+
+    def __init__(
+        self,
+        uid: str,
+        neurons: int,
+        own_neurons: int,
+        submodules: list["NeuronUsage"],
+    ):
+        self.uid = uid
+        self.neurons = neurons
+        self.own_neurons = own_neurons
+        self.submodules = submodules
+
+    def as_dict(self) -> dict:
+        return {
+            "uid": self.uid,
+            "neurons": self.neurons,
+            "own_neurons": self.own_neurons,
+            "submodules": [sub.as_dict() for sub in self.submodules],
+        }
+
+    def print(self, max_depth: int = 1) -> None:
+        print("--------------- NEURON USAGE REPORT --------------")
+        self._print_tree(max_depth, indent=0)
+        print(f"-> Total: {self.neurons} neurons")
+        print("\n")
+
+    def _print_tree(self, max_depth: int, indent: int) -> None:
+        print(" " * indent + f"{self.uid}: {self.neurons} neurons")
+        if max_depth > 0:
+            if self.submodules:
+                print(" " * (indent + 4) + f"own {self.own_neurons}")
+            for sub in self.submodules:
+                sub._print_tree(max_depth - 1, indent + 4)
+
+
+class SpikeReport:
+    """
+    Spike count of a run, or its estimation from calibrated modules.
+
+    Parameters:
+        total: number of spikes (mean over the calibration samples if
+            `estimated`)
+        per_module: spikes of each covered module, when known
+        estimated: whether the counts come from calibration entries
+    """
+
+    def __init__(
+        self,
+        total: float,
+        per_module: Optional[dict[str, float]] = None,
+        estimated: bool = False,
+    ):
+        self.total = total
+        self.per_module = per_module if per_module is not None else {}
+        self.estimated = estimated
+
+    def as_dict(self) -> dict:
+        return {
+            "total": self.total,
+            "per_module": dict(self.per_module),
+            "estimated": self.estimated,
+        }
+
+    def print(self) -> None:
+        if self.estimated:
+            print("--------- SPIKE COUNT REPORT (ESTIMATION) --------")
+        else:
+            print("--------------- SPIKE COUNT REPORT ---------------")
+        for uid, spikes in self.per_module.items():
+            print(" " * 4 + f"{uid}: {spikes:g} spikes")
+        print(f"-> Total: {self.total:g} spikes")
+        print("\n")
+
+
+class EnergyLatencyReport:
+    """
+    Latency, power and energy of one iteration on the modelled hardware.
+
+    All fields are raw numbers in SI units: seconds, watts, joules, amperes
+    and synaptic operations (SOP) per second.
+    """
+
+    # Fields of `as_dict`, in order
+    FIELDS = (
+        "v_updates",
+        "ge_updates",
+        "gf_updates",
+        "gm_updates",
+        "total_updates",
+        "total_cycles",
+        "latency_seconds",
+        "clock_speed_mhz",
+        "P_leak",
+        "P_idle",
+        "P_dynamic",
+        "P_total",
+        "E_total",
+        "I_total",
+        "r_SOP",
+    )
+
+    def __init__(
+        self,
+        v_updates: int,
+        ge_updates: int,
+        gf_updates: int,
+        gm_updates: int,
+        perf: dict[str, float],
+        energy: dict[str, float],
+        clock_speed_mhz: float,
+        estimated: bool = False,
+    ):
+        self.v_updates = v_updates
+        self.ge_updates = ge_updates
+        self.gf_updates = gf_updates
+        self.gm_updates = gm_updates
+        self.total_updates = perf["total_updates"]
+        self.total_cycles = perf["total_cycles"]
+        self.latency_seconds = perf["time_seconds"]
+        self.clock_speed_mhz = clock_speed_mhz
+        self.P_leak = energy["P_leak"]
+        self.P_idle = energy["P_idle"]
+        self.P_dynamic = energy["P_dynamic"]
+        self.P_total = energy["P_total"]
+        self.E_total = energy["E_total"]
+        self.I_total = energy["I_total"]
+        self.r_SOP = energy["r_SOP"]
+        self.estimated = estimated
+
+    def as_dict(self) -> dict:
+        row = {field: getattr(self, field) for field in self.FIELDS}
+        row["estimated"] = self.estimated
+        return row
+
+    def print(self) -> None:
+        if self.estimated:
+            print("------ ENERGY & LATENCY REPORT (ESTIMATION) ------")
+        else:
+            print("------------ ENERGY & LATENCY REPORT -------------")
+        print("-------")
+        print("Predictive logic report:")
+        print(f"V-type updates: {self.v_updates}")
+        print(f"ge-type updates: {self.ge_updates}")
+        print(f"gf-type updates: {self.gf_updates}")
+        print(f"gm-type updates: {self.gm_updates}")
+        print("-------")
+        print(f"Latency per iteration: {self.latency_seconds} s")
+        print(f"Energy per iteration:  {self._format('E_total')}")
+        print(f"Power:                 {self._format('P_total')}")
+        print("-------")
+        print(f"P_leak:                {self._format('P_leak')}")
+        print(f"P_idle:                {self._format('P_idle')}")
+        print(f"P_dynamic:             {self._format('P_dynamic')}")
+        print(f"I_total:               {self._format('I_total')}")
+        print(f"r_SOP:                 {self._format('r_SOP')}")
+        print("\n")
+
+    def _format(self, field: str) -> str:
+        return human_readable(getattr(self, field), UNITS[field])
+
+
+class UsageReport:
+    """
+    All the reports of one network or simulation.
+
+    `as_dict` nests the reports for JSON; `as_row` flattens their numeric
+    fields into one CSV row, and is what `aggregate_reports` summarizes.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        neuron_usage: NeuronUsage,
+        spikes: SpikeReport,
+        energy: EnergyLatencyReport,
+        cycles: Optional[CycleModelResult] = None,
+        meta: Optional[dict] = None,
+    ):
+        self.name = name
+        self.neuron_usage = neuron_usage
+        self.spikes = spikes
+        self.energy = energy
+        self.cycles = cycles
+        self.meta = meta if meta is not None else {}
+
+    @property
+    def estimated(self) -> bool:
+        return self.energy.estimated
+
+    def as_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "estimated": self.estimated,
+            "meta": dict(self.meta),
+            "neuron_usage": self.neuron_usage.as_dict(),
+            "spikes": self.spikes.as_dict(),
+            "energy": self.energy.as_dict(),
+            "cycles": self.cycles.as_dict() if self.cycles is not None else None,
+        }
+
+    def as_row(self) -> dict:
+        row = {"name": self.name, **self.meta, "estimated": self.estimated}
+        row["neurons"] = self.neuron_usage.neurons
+        row["spikes"] = self.spikes.total
+        energy = self.energy.as_dict()
+        del energy["estimated"]
+        row.update(energy)
+        if self.cycles is not None:
+            for key, value in self.cycles.as_dict().items():
+                row[f"cycles_{key}"] = value
+        return row
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        return json.dumps(self.as_dict(), indent=indent)
+
+    def print(self, print_depth: int = 0) -> None:
+        self.neuron_usage.print(max_depth=print_depth)
+        self.spikes.print()
+        self.energy.print()
+        if self.cycles is not None:
+            self.cycles.print()
+
+    def __repr__(self) -> str:
+        kind = "estimated" if self.estimated else "measured"
+        return (
+            f"<UsageReport {self.name} ({kind}): {self.neuron_usage.neurons} neurons, "
+            f"{self.spikes.total:g} spikes, {self.energy.E_total:.3g} J>"
+        )
+
+
+def write_csv(reports: Iterable[UsageReport], file: Union[str, IO[str]]) -> None:
+    """
+    Write one `as_row` row per report, with the union of their columns.
+    """
+    rows = [report.as_row() for report in reports]
+    columns: dict[str, None] = {}
+    for row in rows:
+        columns.update(dict.fromkeys(row))
+
+    def write(f: IO[str]) -> None:
+        writer = csv.DictWriter(f, fieldnames=list(columns))
+        writer.writeheader()
+        writer.writerows(rows)
+
+    if isinstance(file, str):
+        with open(file, "w", newline="") as f:
+            write(f)
+    else:
+        write(file)
+
+
+def write_json(reports: Iterable[UsageReport], file: Union[str, IO[str]]) -> None:
+    data = [report.as_dict() for report in reports]
+    if isinstance(file, str):
+        with open(file, "w") as f:
+            json.dump(data, f, indent=2)
+    else:
+        json.dump(data, file, indent=2)
+
+
+def aggregate_reports(
+    reports: Iterable[UsageReport], by: Optional[str] = None
+) -> dict:
+    """
+    Summary (count, sum, mean, std, min, max) of every numeric `as_row`
+    field over a batch of reports.
+
+    With `by`, the reports are grouped by the value of that row field (e.g.
+    a `meta` key of a sweep) and one summary is returned per group.
+    """
+    rows = [report.as_row() for report in reports]
+    if by is None:
+        return _summarize(rows)
+    groups: dict = {}
+    for row in rows:
+        groups.setdefault(row.get(by), []).append(row)
+    return {key: _summarize(group) for key, group in groups.items()}
+
+
+def _summarize(rows: list[dict]) -> dict[str, dict[str, float]]:
+    columns: dict[str, list[float]] = {}
+    for row in rows:
+        for key, value in row.items():
+            # bool is an int subclass, but flags aren't quantities
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                columns.setdefault(key, []).append(value)
+
+    summary = {}
+    for key, values in columns.items():
+        total = math.fsum(values)
+        mean = total / len(values)
+        summary[key] = {
+            "count": len(values),
+            "sum": total,
+            "mean": mean,
+            "std": math.sqrt(math.fsum((v - mean) ** 2 for v in values) / len(values)),
+            "min": min(values),
+            "max": max(values),
+        }
+    return summary
@@ -1,194 +1,270 @@
-from axon_sdk.primitives import SpikingNetworkModule
-from axon_sdk import PredSimulator
-
-from axon_sdk.networks import (
-    AdderNetwork,
-    SignedMultiplierNormNetwork,
-    SignFlipperNetwork,
-    DivNetwork,
-)
-from ..compilation.compiler import InjectorNetwork
+from axon_sdk.primitives import ExplicitNeuron, SpikingNetworkModule
+from axon_sdk.engine import SimulationEngine
+
 from .power_metrics import estimate_performance, estimate_power_and_energy
+from .cycle_model import HardwareConfig, CycleModelResult, simulate_cycles
+from .calibration import CalibrationDB
+from .results import NeuronUsage, SpikeReport, EnergyLatencyReport, UsageReport
+from .critical_path import CriticalPath, critical_path
+from ..compilation.compiler import OutputReader
 
+from typing import Optional, Union
+
+# Modelled hardware of the energy and latency reports
+CLOCK_SPEED_MHZ = 200
+PREDICTIVE_SEARCH_TIMESTEPS = 5000
+
+
+def benchmark_simulation(
+    sim: SimulationEngine, config: Optional[HardwareConfig] = None
+) -> UsageReport:
+    report = simulation_report(sim, config=config)
 
-def benchmark_simulation(sim: PredSimulator) -> None:
-    if sim.finished is False:
-        raise ValueError("Simulation not executed. Run it before!")
-    
     print("\n")
     print("--------------------------------------------------")
     print("---------- SIMULATION BENCHMARK REPORT -----------")
     print("--------------------------------------------------")
     print("\n")
 
-    report_neuron_usage(sim.net, print_depth=0)
-    report_spike_usage_for_simulation(sim)
-    report_energy_and_latency_for_simulation(sim)
+    report.print(print_depth=0)
+    return report
+
 
+def benchmark_net(
+    net: SpikingNetworkModule, calibration: Optional[CalibrationDB] = None
+) -> UsageReport:
+    report = net_report(net, calibration)
 
-def benchmark_net(net: SpikingNetworkModule) -> None:
     print("IMP: Benchmarks on a net are estimations!")
     print("To benchmark actual runtime behaviour, use 'benchmark_simulation()'")
+    _warn_top_module_neurons(net)
 
-    report_neuron_usage(net)
-    report_spike_estimation_for_net(net)
-    report_energy_and_latency_estimation_for_net(net)
+    report.print(print_depth=1)
+    return report
 
 
-def report_neuron_usage(net: SpikingNetworkModule, print_depth=1):
-    print("--------------- NEURON USAGE REPORT --------------")
-    _print_neurons(net, max_recursion=print_depth)
-    print(f"-> Total: {len(net.neurons)} neurons")
-    print("\n")
+def simulation_report(
+    sim: SimulationEngine,
+    name: Optional[str] = None,
+    config: Optional[HardwareConfig] = None,
+    meta: Optional[dict] = None,
+) -> UsageReport:
+    """
+    Reports of a finished simulation, without printing them.
 
+    The cycle model is included when the simulator was created with
+    `instrument=True`. `meta` is copied into the CSV rows, e.g. the
+    parameters of a sweep.
+    """
+    _check_finished(sim)
+    cycles = None
+    if sim.stats is not None:
+        cycles = simulate_cycles(sim.stats.trace, config)
+    return UsageReport(
+        name if name is not None else sim.net.uid,
+        neuron_usage(sim.net),
+        spike_usage_for_simulation(sim),
+        energy_and_latency_for_simulation(sim),
+        cycles,
+        meta,
+    )
 
-def _print_neurons(net: SpikingNetworkModule, max_recursion=1, indent=0, rec_level=0):
-    """Print the neuron count for the module and its submodules."""
 
-    print(" " * indent + f"{net.uid}: {len(net.neurons)} neurons")
+def net_report(
+    net: SpikingNetworkModule,
+    calibration: Optional[CalibrationDB] = None,
+    name: Optional[str] = None,
+    meta: Optional[dict] = None,
+) -> UsageReport:
+    """
+    Estimated reports of a network, from the calibration entries of its
+    modules, without printing them.
+    """
+    calibration = calibration if calibration is not None else CalibrationDB.default()
+    return UsageReport(
+        name if name is not None else net.uid,
+        neuron_usage(net),
+        spike_estimation_for_net(net, calibration),
+        energy_and_latency_estimation_for_net(net, calibration),
+        meta=meta,
+    )
 
-    if rec_level < max_recursion:
-        if len(net.subnetworks) != 0:
-            print(" " * (indent + 4) + f"own {len(net.top_module_neurons)}")
 
-        for subnet in net.subnetworks:
-            _print_neurons(subnet, indent=indent + 4, rec_level=rec_level + 1)
+def neuron_usage(net: SpikingNetworkModule) -> NeuronUsage:
+    """Neuron count of the module and its submodules."""
+    return NeuronUsage(
+        net.uid,
+        len(net.neurons),
+        len(net.top_module_neurons),
+        [neuron_usage(subnet) for subnet in net.subnetworks],
+    )
 
 
-def _module_to_total_spikes(mod: SpikingNetworkModule) -> int:
-    if isinstance(mod, InjectorNetwork):
-        return 2
-    elif isinstance(mod, SignFlipperNetwork):
-        return 4
-    elif isinstance(mod, SignedMultiplierNormNetwork):
-        return 29
-    elif isinstance(mod, AdderNetwork):
-        return 58
-    elif isinstance(mod, DivNetwork):
-        return 31
-    else:
-        raise ValueError(f"Unknown number of spikes for module {mod}")
+def spike_estimation_for_net(
+    net: SpikingNetworkModule, calibration: Optional[CalibrationDB] = None
+) -> SpikeReport:
+    calibration = calibration if calibration is not None else CalibrationDB.default()
+    per_module = {
+        subnet.uid: entry["spikes"]["mean"] for subnet, entry in calibration.estimate(net)
+    }
+    return SpikeReport(sum(per_module.values()), per_module, estimated=True)
 
 
-def _module_to_spikes(mod: SpikingNetworkModule) -> dict[str, int]:
-    # Maps each module to the count of processed spikes within each module
-    if isinstance(mod, InjectorNetwork):
-        return {"V": 0, "ge": 0, "gf": 0, "gm": 0}
-    elif isinstance(mod, SignFlipperNetwork):
-        return {"V": 2, "ge": 0, "gf": 0, "gm": 0}
-    elif isinstance(mod, SignedMultiplierNormNetwork):
-        return {"V": 42, "ge": 9, "gf": 3, "gm": 4}
-    elif isinstance(mod, AdderNetwork):
-        return {"V": 76, "ge": 16, "gf": 0, "gm": 0}
-    elif isinstance(mod, DivNetwork):
-        return {"V": 48, "ge": 5, "gf": 3, "gm": 4}
-    else:
-        raise ValueError(f"Unknown number of spikes for module {mod}")
+def spike_usage_for_simulation(sim: SimulationEngine) -> SpikeReport:
+    _check_finished(sim)
+    return SpikeReport(sum(len(d) for d in sim.spike_log.values()))
 
 
-def report_spike_estimation_for_net(net: SpikingNetworkModule):
+def energy_and_latency_estimation_for_net(
+    net: SpikingNetworkModule, calibration: Optional[CalibrationDB] = None
+) -> EnergyLatencyReport:
     """
-    To be used with networks produced by the compiler.
-    IMP: Will not be accurate if net has top level neurons
+    Estimation because it does not use runtime info. about number of spikes. Instead, it
+    uses the mean event counts measured when calibrating each module.
+
+    IMP: Modules without an input driver (see `register_input_driver`) are only
+    covered through their calibratable subnetworks.
     """
-    print("--------- SPIKE COUNT REPORT (ESTIMATION) --------")
+    calibration = calibration if calibration is not None else CalibrationDB.default()
 
+    v_spikes = 0
+    ge_spikes = 0
+    gf_spikes = 0
+    gm_spikes = 0
+
+    for _, entry in calibration.estimate(net):
+        events = entry["events"]
+        v_spikes += events["V"]["mean"]
+        ge_spikes += events["ge"]["mean"]
+        gf_spikes += events["gf"]["mean"]
+        # Gate synapses drive the gm updates of the hardware model
+        gm_spikes += events["gate"]["mean"]
+
+    return _energy_and_latency(
+        round(v_spikes), round(ge_spikes), round(gf_spikes), round(gm_spikes), True
+    )
+
+
+def energy_and_latency_for_simulation(sim: SimulationEngine) -> EnergyLatencyReport:
+    _check_finished(sim)
+    counts = sim.processed_syn_per_type
+    return _energy_and_latency(
+        counts["V"], counts["ge"], counts["gf"], counts["gate"], False
+    )
+
+
+def _energy_and_latency(
+    v_spikes: int, ge_spikes: int, gf_spikes: int, gm_spikes: int, estimated: bool
+) -> EnergyLatencyReport:
+
+    perf = estimate_performance(
+        num_v_spike_updates=v_spikes,
+        num_ge_spike_updates=ge_spikes,
+        num_gf_spike_updates=gf_spikes,
+        num_gm_spike_updates=gm_spikes,
+        predictive_search_timesteps=PREDICTIVE_SEARCH_TIMESTEPS,
+        clock_speed_mhz=CLOCK_SPEED_MHZ,
+    )
+    energy = estimate_power_and_energy(
+        perf=perf, clock_speed_mhz=CLOCK_SPEED_MHZ, formatted=False
+    )
+    return EnergyLatencyReport(
+        v_spikes,
+        ge_spikes,
+        gf_spikes,
+        gm_spikes,
+        perf,
+        energy,
+        CLOCK_SPEED_MHZ,
+        estimated,
+    )
+
+
+def _warn_top_module_neurons(net: SpikingNetworkModule) -> None:
     if len(net.top_module_neurons) != 0:
         print("IMP: Spike count estimation might not be accurate")
         print("     Noticed your net has neurons in the top module")
         print("     Spikes in top module neurons are not counted")
         print("     Use estimation with care.")
 
-    spikes_count = 0
-
-    indent = 4
-    for subnet in net.subnetworks:
-        spikes = _module_to_total_spikes(subnet)
-        spikes_count += spikes
-        print(" " * indent + f"{subnet.uid}: {spikes} spikes")
 
-    print(f"-> Total: {spikes_count} spikes")
-    print("\n")
-
-
-def report_spike_usage_for_simulation(sim: PredSimulator):
-    """
-    To be used after a simulation has ben finalized
-    """
+def _check_finished(sim: SimulationEngine) -> None:
     if sim.finished is False:
         raise ValueError("Simulation not executed. Run it before!")
-    print("--------------- SPIKE COUNT REPORT ---------------")
 
-    spikes_count = sum(len(d) for d in sim.spike_log.values())
 
-    print(f"-> Total: {spikes_count} spikes")
-    print("\n")
+# The report_* functions print one report and return it
 
 
-def report_energy_and_latency_estimation_for_net(net: SpikingNetworkModule) -> None:
-    """
-    Estimation because it does not use runtime info. about number of spikes. Instead, it
-    uses precomputed spike counts for each module.
+def report_neuron_usage(net: SpikingNetworkModule, print_depth=1) -> NeuronUsage:
+    usage = neuron_usage(net)
+    usage.print(max_depth=print_depth)
+    return usage
 
-    IMP: Intended to be used with networks produced by the compiler since
-    `_module_to_spikes` map is only available for certain modules.
+
+def report_spike_estimation_for_net(
+    net: SpikingNetworkModule, calibration: Optional[CalibrationDB] = None
+) -> SpikeReport:
+    """
+    Mean spike counts of the modules of `net`, from their calibration entries
+    (see `CalibrationDB`, the default one caches them on disk).
+    IMP: Will not be accurate if net has top level neurons
     """
+    report = spike_estimation_for_net(net, calibration)
+    _warn_top_module_neurons(net)
+    report.print()
+    return report
 
-    v_spikes = 0
-    ge_spikes = 0
-    gf_spikes = 0
-    gm_spikes = 0
 
-    for subnet in net.subnetworks:
-        v_spikes += _module_to_spikes(subnet)["V"]
-        ge_spikes += _module_to_spikes(subnet)["ge"]
-        gf_spikes += _module_to_spikes(subnet)["gf"]
-        gm_spikes += _module_to_spikes(subnet)["gm"]
+def report_spike_usage_for_simulation(sim: SimulationEngine) -> SpikeReport:
+    """
+    To be used after a simulation has ben finalized
+    """
+    report = spike_usage_for_simulation(sim)
+    report.print()
+    return report
 
-    print("------ ENERGY & LATENCY REPORT (ESTIMATION) ------")
-    _report_energy_and_latency(v_spikes, ge_spikes, gf_spikes, gm_spikes)
 
+def report_energy_and_latency_estimation_for_net(
+    net: SpikingNetworkModule, calibration: Optional[CalibrationDB] = None
+) -> EnergyLatencyReport:
+    report = energy_and_latency_estimation_for_net(net, calibration)
+    report.print()
+    return report
 
-def report_energy_and_latency_for_simulation(sim: PredSimulator) -> None:
 
-    v_spikes = sim._processed_synapses_log["V"]
-    ge_spikes = sim._processed_synapses_log["ge"]
-    gf_spikes = sim._processed_synapses_log["gf"]
-    gm_spikes = sim._processed_synapses_log["gm"]
+def report_energy_and_latency_for_simulation(sim: SimulationEngine) -> EnergyLatencyReport:
+    report = energy_and_latency_for_simulation(sim)
+    report.print()
+    return report
 
-    print("------------ ENERGY & LATENCY REPORT -------------")
-    _report_energy_and_latency(v_spikes, ge_spikes, gf_spikes, gm_spikes)
 
+def report_cycle_model_for_simulation(
+    sim: SimulationEngine, config: Optional[HardwareConfig] = None
+) -> CycleModelResult:
+    """
+    Replay the event trace of a simulation on the modelled hardware.
 
-def _report_energy_and_latency(
-    v_spikes: int, ge_spikes: int, gf_spikes: int, gm_spikes: int
-) -> None:
+    Requires a simulator created with `instrument=True`.
+    """
+    _check_finished(sim)
+    if sim.stats is None:
+        raise ValueError("No event trace. Create the simulator with instrument=True")
 
-    perf = estimate_performance(
-        num_v_spike_updates=v_spikes,
-        num_ge_spike_updates=ge_spikes,
-        num_gf_spike_updates=gf_spikes,
-        num_gm_spike_updates=gm_spikes,
-        predictive_search_timesteps=5000,
-        clock_speed_mhz=200,
-    )
+    result = simulate_cycles(sim.stats.trace, config)
+    result.print()
+    return result
 
-    energy_estimat = estimate_power_and_energy(perf=perf, clock_speed_mhz=200)
-
-    print("-------")
-    print(f"Predictive logic report:")
-    print(f"V-type updates: {v_spikes}")
-    print(f"ge-type updates: {ge_spikes}")
-    print(f"gf-type updates: {gf_spikes}")
-    print(f"gm-type updates: {gm_spikes}")
-    print("-------")
-    print(f"Latency per iteration: {perf['time_seconds']} s")
-    print(f"Energy per iteration:  {energy_estimat['E_total']}")
-    print(f"Power:                 {energy_estimat['P_total']}")
-    print("-------")
-    print(f"P_leak:                {energy_estimat['P_leak']}")
-    print(f"P_idle:                {energy_estimat['P_idle']}")
-    print(f"P_dynamic:             {energy_estimat['P_dynamic']}")
-    print(f"I_total:               {energy_estimat['I_total']}")
-    print(f"r_SOP:                 {energy_estimat['r_SOP']}")
-    print("\n")
+
+def report_critical_path(
+    sim: SimulationEngine,
+    target: Union[OutputReader, ExplicitNeuron],
+    depth: Optional[int] = 1,
+) -> CriticalPath:
+    """
+    Latency from the first input spike to the second spike of `target` (the
+    output of a compiled plan), split over the modules of its critical path.
+    """
+    path = critical_path(sim, target, depth=depth)
+    path.print()
+    return path
@@ -0,0 +1,493 @@
+"""
+Differential validation of the simulation engines.
+
+`validate_engines` runs one network and input set through every registered
+engine (see `axon_sdk.engine`) and compares each run to a reference engine,
+by default the exact integration of `timestep-exact`: spike times neuron by
+neuron, within a tolerance of a few steps of either engine that grows along
+the run, and decoded outputs, against the exact value of the computation
+when the case has one. It reports the first divergence and the wall time of
+each engine. `module_cases` and `generated_cases` make a corpus of the
+library's networks and of large compiled expressions.
+"""
+
+from axon_sdk.primitives import (
+    DataEncoder,
+    ExplicitNeuron,
+    SpikingNetworkModule,
+    standalone_copy,
+)
+from axon_sdk.compilation import ExecutionPlan, compile_computation, generators
+from axon_sdk.compilation.compiler import OutputReader
+from axon_sdk.networks import (
+    AdderNetwork,
+    ConstantNetwork,
+    DivNetwork,
+    ExponentialNetwork,
+    InvertingMemoryNetwork,
+    LinearCombinatorNetwork,
+    LogNetwork,
+    MemoryNetwork,
+    MultiplierNetwork,
+    SignedMemoryNetwork,
+    SignedMultiplierNetwork,
+    SignFlipperNetwork,
+    SubtractorNetwork,
+    SynchronizerNetwork,
+)
+from .engine import ENGINES, SimulationEngine, get_engine
+from .simulator import decode_output
+from .usagereport.calibration import driver_for
+
+import copy as copying
+import math
+import random
+import time
+
+from typing import Optional
+
+# Time simulated after the last spike of the reference, when a case doesn't
+# set its duration, relative to the time of that spike
+SIMULATION_MARGIN = 0.1
+
+# Spike times of two engines match within this many steps of each, plus
+# TOLERANCE_DRIFT steps per ms simulated before the spike: the error of the
+# Euler and predictive engines accumulates along a run, and deep compiled
+# plans run long
+TOLERANCE_STEPS = 2.0
+TOLERANCE_DRIFT = 0.5
+
+
+class ValidationCase:
+    """
+    A network, its inputs and the simulated time, run by every engine on a
+    fresh copy of the network.
+
+    Parameters:
+    name (str): Name of the case in reports.
+    net (SpikingNetworkModule): Network to simulate.
+    inputs (list[tuple]): `(neuron, value)` pairs applied as intervals at
+        t=0 and `(neuron, None, t)` single spikes, like the calibration drivers.
+    simulation_time (Optional[float]): Simulated time (ms), by default until
+        shortly after the last spike of an unbounded `PredSimulator` run.
+    encoder (Optional[DataEncoder]): Encoder of the inputs and outputs.
+    reader (Optional[OutputReader]): Output of the network, decoded by every
+        engine.
+    expected (Optional[float]): Exact value of the output; decoded outputs,
+        the one of the reference included, are checked against it rather
+        than against the output of the reference.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        net: SpikingNetworkModule,
+        inputs: list[tuple],
+        simulation_time: Optional[float] = None,
+        encoder: Optional[DataEncoder] = None,
+        reader: Optional[OutputReader] = None,
+        expected: Optional[float] = None,
+    ):
+        self.name = name
+        self.net = net
+        self.inputs = inputs
+        self.simulation_time = simulation_time
+        self.encoder = encoder or getattr(net, "encoder", None) or DataEncoder()
+        self.reader = reader
+        self.expected = expected
+
+    @classmethod
+    def from_plan(
+        cls,
+        name: str,
+        plan: ExecutionPlan,
+        simulation_time: Optional[float] = None,
+        encoder: Optional[DataEncoder] = None,
+        expected: Optional[float] = None,
+    ) -> "ValidationCase":
+        inputs = [
+            (trigger.trigger_neuron, trigger.normalized_value)
+            for trigger in plan.input_triggers
+        ]
+        return cls(
+            name,
+            plan.net,
+            inputs,
+            simulation_time,
+            encoder,
+            plan.output_reader,
+            expected,
+        )
+
+
+class Divergence:
+    """
+    First spike of a run that differs from the reference: the neuron, the
+    time, the spike of each run at that point (None for a missing spike),
+    and the last membrane potential `(t, V)` of the neuron each engine
+    recorded up to that time.
+    """
+
+    def __init__(
+        self,
+        neuron: str,
+        t: float,
+        reference_spike: Optional[float],
+        spike: Optional[float],
+        state: dict[str, Optional[tuple[float, float]]],
+    ):
+        self.neuron = neuron
+        self.t = t
+        self.reference_spike = reference_spike
+        self.spike = spike
+        self.state = state
+
+    def describe(self) -> str:
+        def fmt(t):
+            return "none" if t is None else f"{t:.6g}"
+
+        states = ", ".join(
+            f"{name} V={'?' if state is None else f'{state[1]:.6g} at t={state[0]:.6g}'}"
+            for name, state in self.state.items()
+        )
+        return (
+            f"neuron {self.neuron} at t={self.t:.6g}: spike {fmt(self.spike)} "
+            f"vs reference {fmt(self.reference_spike)} ({states})"
+        )
+
+
+class EngineRun:
+    """
+    Outcome of one engine on a case: wall time of `simulate`, number of
+    spikes, decoded output (nan if malformed, None without output) and first
+    divergence from the reference.
+    """
+
+    def __init__(
+        self,
+        engine: str,
+        dt: float,
+        wall_time: float,
+        spikes: int,
+        decoded: Optional[float],
+        divergence: Optional[Divergence] = None,
+        output_error: Optional[float] = None,
+    ):
+        self.engine = engine
+        self.dt = dt
+        self.wall_time = wall_time
+        self.spikes = spikes
+        self.decoded = decoded
+        self.divergence = divergence
+        self.output_error = output_error
+
+
+class ValidationReport:
+    """
+    Runs of every engine on a case; `passed` when no run diverges from the
+    reference and every decoded output is within tolerance of the expected
+    value, or of the output of the reference without one.
+    """
+
+    def __init__(
+        self,
+        case: str,
+        reference: str,
+        runs: list[EngineRun],
+        output_tolerance: Optional[float],
+        expected: Optional[float] = None,
+    ):
+        self.case = case
+        self.reference = reference
+        self.runs = runs
+        self.output_tolerance = output_tolerance
+        self.expected = expected
+
+    def run_of(self, engine: str) -> EngineRun:
+        return next(run for run in self.runs if run.engine == engine)
+
+    def failures(self) -> list[EngineRun]:
+        return [
+            run
+            for run in self.runs
+            if run.divergence is not None or self._output_off(run)
+        ]
+
+    def _output_off(self, run: EngineRun) -> bool:
+        """
+        Whether the decoded output of `run` is off by more than the tolerance,
+        only checked for cases with an output.
+        """
+        if self.output_tolerance is None or run.output_error is None:
+            return False
+        return not run.output_error <= self.output_tolerance
+
+    @property
+    def passed(self) -> bool:
+        return not self.failures()
+
+    def print(self) -> None:
+        status = "passed" if self.passed else "FAILED"
+        expected = "" if self.expected is None else f", expected {self.expected:.6g}"
+        print(f"{self.case}: {status} (reference {self.reference}{expected})")
+        reference_time = self.run_of(self.reference).wall_time
+        for run in self.runs:
+            speedup = reference_time / run.wall_time if run.wall_time > 0 else math.inf
+            decoded = "" if run.decoded is None else f"  output {run.decoded:.6g}"
+            print(
+                f"  {run.engine:<18} dt={run.dt:<6g} {run.wall_time:8.4f} s "
+                f"({speedup:5.2f}x)  {run.spikes} spikes{decoded}"
+            )
+            if run.divergence is not None:
+                print(f"    first divergence: {run.divergence.describe()}")
+            if self._output_off(run):
+                print(
+                    f"    output off by {run.output_error:.3g} "
+                    f"(tolerance {self.output_tolerance:.3g})"
+                )
+
+
+def _run(
+    engine: str,
+    case: ValidationCase,
+    dt: float,
+    simulation_time: Optional[float],
+    logged: Optional[int] = None,
+) -> tuple[SimulationEngine, list[ExplicitNeuron], float]:
+    """
+    Run `engine` on a fresh copy of the network of `case`, with the state
+    logs of neuron number `logged` enabled; returns the simulation, the
+    copied neurons in the order of `case.net.neurons`, and its wall time.
+    """
+    net, copies = standalone_copy(case.net)
+    neurons = [copies[neuron] for neuron in case.net.neurons]
+    if logged is not None:
+        neurons[logged].enable_state_logs()
+    sim = get_engine(engine)(net, case.encoder, dt=dt)
+    for neuron, value, *t in case.inputs:
+        if value is None:
+            sim.apply_input_spike(copies[neuron], t=t[0])
+        else:
+            sim.apply_input_value(value, copies[neuron], t0=0)
+    start = time.perf_counter()
+    sim.simulate(simulation_time)
+    return sim, neurons, time.perf_counter() - start
+
+
+def _decode(sim: SimulationEngine, case: ValidationCase, neurons: list) -> Optional[float]:
+    if case.reader is None:
+        return None
+    index = {neuron: i for i, neuron in enumerate(case.net.neurons)}
+    reader = copying.copy(case.reader)
+    reader.read_neuron_plus = neurons[index[case.reader.read_neuron_plus]]
+    reader.read_neuron_minus = neurons[index[case.reader.read_neuron_minus]]
+    try:
+        value = decode_output(sim, reader)
+    except ValueError:
+        return math.nan
+    return math.nan if value is None else value
+
+
+def _first_divergence(
+    reference: list[list[float]],
+    spikes: list[list[float]],
+    tolerance: float,
+    drift: float = 0.0,
+) -> Optional[tuple[int, float, Optional[float], Optional[float]]]:
+    """
+    Earliest spike of either run without a match in the other, as
+    `(neuron number, time, reference spike, spike)`. Spikes match within
+    `tolerance + drift * t_ref`.
+    """
+    first = None
+    for i, (expected, actual) in enumerate(zip(reference, spikes)):
+        for k in range(max(len(expected), len(actual))):
+            t_ref = expected[k] if k < len(expected) else None
+            t = actual[k] if k < len(actual) else None
+            if (
+                t_ref is not None
+                and t is not None
+                and abs(t - t_ref) <= tolerance + drift * t_ref
+            ):
+                continue
+            t_first = min(x for x in (t_ref, t) if x is not None)
+            if first is None or t_first < first[1]:
+                first = (i, t_first, t_ref, t)
+            break
+    return first
+
+
+def _potential_before(
+    sim: SimulationEngine, neuron: ExplicitNeuron, t: float
+) -> Optional[tuple[float, float]]:
+    """
+    Last `(t, V)` of `neuron` recorded before `t`, from its state logs and
+    the voltage log of a time-stepped run.
+    """
+    samples = [(t_sample, V) for V, t_sample in neuron.log_V or []]
+    timesteps = getattr(sim, "timesteps", [])
+    samples += [(timesteps[step], V) for V, step in sim.voltage_log[neuron.uid]]
+    before = sorted(sample for sample in samples if sample[0] < t)
+    return before[-1] if before else None
+
+
+def validate_engines(
+    case: ValidationCase,
+    engines: Optional[list[str]] = None,
+    reference: str = "timestep-exact",
+    dt: float = 0.01,
+    tolerance_steps: float = TOLERANCE_STEPS,
+    tolerance_drift: float = TOLERANCE_DRIFT,
+    output_tolerance: Optional[float] = None,
+) -> ValidationReport:
+    """
+    Run `case` through `engines` (all registered ones by default) and compare
+    each run to the one of `reference`.
+
+    Spike times match when they differ by at most `tolerance_steps` steps of
+    each of the two engines, plus `tolerance_drift` steps per ms simulated
+    before the reference spike. Decoded outputs match the expected value of
+    the case (or the output of the reference without one) when they differ
+    by at most `output_tolerance`, by default the value of an interval error
+    of `tolerance_steps` steps. On a divergence, both engines are run again
+    with the state logs of the diverging neuron, to report its membrane
+    potential just before.
+
+    Parameters:
+    case (ValidationCase): Network, inputs and simulated time.
+    engines (Optional[list[str]]): Names of the engines to compare.
+    reference (str): Name of the reference engine.
+    dt (float): Step of every engine (the prediction grid of predictive ones).
+    tolerance_steps (float): Tolerance on spike times, in steps.
+    tolerance_drift (float): Growth of that tolerance, in steps per ms.
+    output_tolerance (Optional[float]): Tolerance on decoded outputs.
+    """
+    engines = list(ENGINES) if engines is None else list(engines)
+    if reference not in engines:
+        engines.insert(0, reference)
+
+    simulation_time = case.simulation_time
+    if simulation_time is None:
+        sim, _, _ = _run("predictive", case, dt, None)
+        end = max((t for times in sim.spike_log.values() for t in times), default=0.0)
+        simulation_time = end * (1 + SIMULATION_MARGIN) + 10 * dt
+
+    results = {}
+    for engine in engines:
+        sim, neurons, wall_time = _run(engine, case, dt, simulation_time)
+        spikes = [sim.spikes_of(neuron) for neuron in neurons]
+        results[engine] = (sim, neurons, wall_time, spikes)
+
+    ref_sim, _, _, ref_spikes = results[reference]
+    tolerance = tolerance_steps * 2 * dt + 1e-9
+    drift = tolerance_drift * 2 * dt
+    if output_tolerance is None and case.reader is not None:
+        # Both output spikes may be off by the tolerance
+        output_tolerance = case.reader.normalization * 2 * tolerance / case.encoder.Tcod
+    target = case.expected
+    if target is None:
+        target = _decode(ref_sim, case, results[reference][1])
+
+    runs = []
+    for engine, (sim, neurons, wall_time, spikes) in results.items():
+        divergence = None
+        found = _first_divergence(ref_spikes, spikes, tolerance, drift)
+        if engine != reference and found is not None:
+            i, t, t_ref, t_spike = found
+            state = {}
+            for name in (reference, engine):
+                logged_sim, logged_neurons, _ = _run(name, case, dt, simulation_time, i)
+                state[name] = _potential_before(logged_sim, logged_neurons[i], t)
+            divergence = Divergence(case.net.neurons[i].uid, t, t_ref, t_spike, state)
+
+        decoded = _decode(sim, case, neurons)
+        output_error = None
+        checked = engine != reference or case.expected is not None
+        if decoded is not None and target is not None and checked:
+            output_error = abs(decoded - target)
+            if math.isnan(decoded) and math.isnan(target):
+                output_error = 0.0
+        runs.append(
+            EngineRun(
+                engine,
+                sim.dt,
+                wall_time,
+                sum(len(times) for times in spikes),
+                decoded,
+                divergence,
+                output_error,
+            )
+        )
+    return ValidationReport(case.name, reference, runs, output_tolerance, case.expected)
+
+
+def validate_corpus(
+    cases: list[ValidationCase], print_reports: bool = True, **kwargs
+) -> list[ValidationReport]:
+    """
+    `validate_engines` on every case, with the same arguments.
+    """
+    reports = []
+    for case in cases:
+        report = validate_engines(case, **kwargs)
+        if print_reports:
+            report.print()
+        reports.append(report)
+    return reports
+
+
+def module_cases(seed: int = 0, simulation_time: float = 500.0) -> list[ValidationCase]:
+    """
+    The networks of the library exercised by the test modules, with inputs
+    drawn by their calibration drivers.
+    """
+    encoder = DataEncoder()
+    modules = [
+        MultiplierNetwork(encoder),
+        SignedMultiplierNetwork(encoder),
+        AdderNetwork(encoder),
+        SubtractorNetwork(encoder),
+        LinearCombinatorNetwork(encoder, 3, [0.5, -0.25, 0.75]),
+        DivNetwork(encoder),
+        ExponentialNetwork(encoder),
+        LogNetwork(encoder),
+        MemoryNetwork(encoder),
+        InvertingMemoryNetwork(encoder),
+        SignedMemoryNetwork(encoder),
+        ConstantNetwork(encoder, 0.4),
+        SynchronizerNetwork(encoder, 3),
+        SignFlipperNetwork(encoder),
+    ]
+    rng = random.Random(seed)
+    cases = []
+    for mod in modules:
+        driver = driver_for(mod)
+        assert driver is not None
+        cases.append(
+            ValidationCase(
+                type(mod).__name__, mod, driver(mod, rng), simulation_time, encoder
+            )
+        )
+    return cases
+
+
+def generated_cases(scale: int = 1, seed: int = 0) -> list[ValidationCase]:
+    """
+    Compiled expressions of the generators, from tens to thousands of
+    neurons as `scale` grows, with their exact values.
+    """
+    expressions = [
+        ("dot_product", generators.dot_product(n=8 * scale, seed=seed)),
+        ("polynomial", generators.polynomial(degree=3 * scale, seed=seed)),
+        ("fir_filter", generators.fir_filter(taps=4 * scale, outputs=1, seed=seed)),
+        (
+            "random_expression",
+            generators.random_expression(num_ops=50 * scale, width=4, seed=seed),
+        ),
+    ]
+    return [
+        ValidationCase.from_plan(
+            name, compile_computation(root, max_range=100), expected=expected
+        )
+        for name, (root, expected) in expressions
+    ]
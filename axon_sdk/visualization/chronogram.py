@@ -1,6 +1,16 @@
 import matplotlib.pyplot as plt
 from matplotlib.pyplot import cm
 
+import numpy as np
+
+from typing import Optional, Sequence
+
+# Default number of min/max bins per trace, about the width of a plot in pixels
+MAX_POINTS = 2000
+
+# Rows of a chronogram above which `plot_chronogram` asks for a subset
+MAX_ROWS = 64
+
 
 def build_array(length: int, entry_points: list[tuple[float, float]]) -> list[float]:
     """
@@ -9,40 +19,164 @@ def build_array(length: int, entry_points: list[tuple[float, float]]) -> list[fl
     length = 10
     -> output = [0.0, 4.0, 4.0, 0.0, 0.0, 0.0, 5.0, 5.0, 5.0, 5.0]
     """
-    entry_points_sorted = sorted(entry_points, key=lambda pair: pair[1])
-    entry_points_dict = {t[1]: t[0] for t in entry_points_sorted}
+    values, indices = _entry_arrays(entry_points)
+    return step_hold(values, indices, length).tolist()
+
+
+def _entry_arrays(entry_points: Sequence) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Values and step indices of a sparse `(value, index)` log, sorted by index.
+    """
+    if len(entry_points) == 0:
+        return np.zeros(0), np.zeros(0, dtype=np.int64)
+    entries = np.asarray(entry_points, dtype=float).reshape(-1, 2)
+    # Stable: of several values at the same step, the last one is kept
+    order = np.argsort(entries[:, 1], kind="stable")
+    return entries[order, 0], entries[order, 1].astype(np.int64)
+
 
-    result = [0.0] * length
-    last_valid_value = 0.0
-    for i in range(length):
-        if (val := entry_points_dict.get(i, None)) is not None:
-            last_valid_value = val
+def step_hold(values: np.ndarray, indices: np.ndarray, length: int) -> np.ndarray:
+    """
+    Expand a signal set to `values[k]` at step `indices[k]` (sorted) and held
+    until the next change, starting from 0, to `length` steps.
+    """
+    return _held(values, indices, np.arange(length))
 
-        result[i] = last_valid_value
 
-    return result
+def _held(values: np.ndarray, indices: np.ndarray, steps: np.ndarray) -> np.ndarray:
+    # Value of the step-hold signal at each of `steps`
+    if len(values) == 0:
+        return np.zeros(len(steps))
+    last = np.searchsorted(indices, steps, side="right") - 1
+    return np.where(last >= 0, values[np.maximum(last, 0)], 0.0)
+
+
+def decimate_step(
+    values: np.ndarray, indices: np.ndarray, length: int, num_bins: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Min/max envelope of a step-hold signal (see `step_hold`) over `num_bins`
+    bins of steps, computed from the changes only.
+
+    Returns the first step of each bin and the min and max of the signal
+    over the bin, so that the envelope drawn at any resolution up to
+    `num_bins` shows every excursion of the signal.
+    """
+    num_bins = max(1, min(num_bins, length))
+    starts = np.linspace(0, length, num_bins, endpoint=False).astype(np.int64)
+    starts = np.unique(starts)
+    # Value held when entering each bin
+    held = _held(values, indices, starts)
+    low, high = held.copy(), held.copy()
+    # Values set inside each bin
+    inside = (indices >= 0) & (indices < length)
+    bins = np.searchsorted(starts, indices[inside], side="right") - 1
+    np.minimum.at(low, bins, values[inside])
+    np.maximum.at(high, bins, values[inside])
+    return starts, low, high
+
+
+def _envelope(
+    timesteps: np.ndarray, v_log: Sequence, max_points: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Points of the min/max envelope of a voltage log, as one polyline.
+    """
+    length = len(timesteps)
+    if len(v_log) == length and (length == 0 or not isinstance(v_log[0], tuple)):
+        # Dense log, one value per step
+        values, indices = np.asarray(v_log, dtype=float), np.arange(length)
+    else:
+        values, indices = _entry_arrays(v_log)
+    starts, low, high = decimate_step(values, indices, length, max_points)
+    x = np.repeat(timesteps[starts], 2)
+    y = np.empty(2 * len(starts))
+    y[0::2], y[1::2] = low, high
+    return x, y
+
+
+def module_groups(net, depth: Optional[int] = 1) -> dict[str, list[str]]:
+    """
+    Neuron uids of `net` grouped by the uid of their module at `depth`
+    (None for the innermost modules), for the `groups` of the plots.
+    """
+    from axon_sdk.instrumentation import module_uids_of
+
+    neurons = net.neurons
+    groups: dict[str, list[str]] = {}
+    for neuron, module_uid in zip(neurons, module_uids_of(net, neurons, depth)):
+        groups.setdefault(module_uid, []).append(neuron.uid)
+    return groups
+
+
+def _rows(
+    uids: Sequence[str],
+    neurons: Optional[Sequence[str]],
+    groups: Optional[dict[str, list[str]]],
+) -> list[tuple[str, list[str]]]:
+    """
+    (label, neuron uids) of each row, restricted to `neurons` if given.
+    """
+    selected = set(neurons) if neurons is not None else None
+    if groups is None:
+        uids = neurons if neurons is not None else uids
+        return [(uid, [uid]) for uid in uids]
+    rows = []
+    for label, members in groups.items():
+        if selected is not None:
+            members = [uid for uid in members if uid in selected]
+        if members:
+            rows.append((label, members))
+    return rows
 
 
 def plot_chronogram(
     timesteps: list[float],
     voltage_log: dict[str, list[tuple]],
     spike_log: dict[str, list[float]],
+    neurons: Optional[Sequence[str]] = None,
+    groups: Optional[dict[str, list[str]]] = None,
+    max_points: int = MAX_POINTS,
+    show: bool = True,
 ):
+    """
+    Voltage traces and spikes, one row per neuron or per group of neurons.
+
+    Traces are drawn as their min/max envelope over `max_points` bins, so
+    the cost doesn't depend on the length of the run.
+
+    Parameters:
+        neurons: uids of the neurons to draw, defaults to all
+        groups: rows of several neurons each, e.g. `module_groups(net)`
+        show: open the plot window; the figure is returned either way
+    """
     print("Launching chronogram visualization...")
     print("=========================================")
-    n = len(voltage_log.keys())
-    _, ax = plt.subplots(nrows=n, ncols=1, sharex=True, figsize=(10, 5))
-    values = [i / (n - 1) for i in range(n)]  # linearly spaced values between 0 and 1
-    colors = iter(cm.rainbow(values))
+    rows = _rows(list(voltage_log.keys()), neurons, groups)
+    n = len(rows)
+    if n > MAX_ROWS:
+        raise ValueError(
+            f"{n} rows is too many for a chronogram; select `neurons`, group "
+            "them by module with `groups`, or use `plot_raster`"
+        )
+    timesteps = np.asarray(timesteps, dtype=float)
+    fig, ax = plt.subplots(
+        nrows=max(n, 1),
+        ncols=1,
+        sharex=True,
+        figsize=(10, max(5, 0.4 * n)),
+        squeeze=False,
+    )
+    ax = ax[:, 0]
 
-    for i, item in enumerate(voltage_log.keys()):
-        c = next(colors)
-        v_log = voltage_log[item]
-        if len(timesteps) != len(v_log):
-            v_log = build_array(len(timesteps), v_log)
+    for i, (label, members) in enumerate(rows):
+        if len(members) > 1:
+            colors = cm.rainbow(np.linspace(0, 1, len(members)))
+        else:
+            colors = ["#2A868C"]
 
         # Neuron names
-        ax[i].set_ylabel(item, rotation=0, labelpad=30)
+        ax[i].set_ylabel(label, rotation=0, labelpad=30)
         # Voltage limits
         ax[i].set_ylim(-12, 12)
         ax[i].axhline(0, color="lightgray", linestyle="--")
@@ -54,12 +188,90 @@ def plot_chronogram(
         ax[i].spines["bottom"].set_visible(False)
         ax[i].spines["left"].set_visible(False)
 
-        ax[i].plot(timesteps, v_log, c="#2A868C")
-
-        if item in spike_log:
-            for spike in spike_log[item]:
-                ax[i].scatter(spike, 0, s=30, c="#2A868C")
+        for uid, c in zip(members, colors):
+            x, y = _envelope(timesteps, voltage_log.get(uid, []), max_points)
+            ax[i].plot(x, y, c=c, linewidth=0.8)
+            spikes = spike_log.get(uid, [])
+            if len(spikes):
+                ax[i].scatter(spikes, np.zeros(len(spikes)), s=30, color=c)
 
-    plt.legend()
-    plt.show()
+    if show:
+        plt.show()
     print("=========================================")
+    return fig
+
+
+def plot_raster(
+    spike_log: dict[str, list[float]],
+    neurons: Optional[Sequence[str]] = None,
+    groups: Optional[dict[str, list[str]]] = None,
+    ax=None,
+    show: bool = True,
+):
+    """
+    Spike raster of the whole network: one line per neuron, one tick per
+    spike, drawn with a single scatter call.
+
+    With `groups`, neurons are ordered and colored by group, and the groups
+    are labelled on the y axis.
+    """
+    rows = _rows(list(spike_log.keys()), neurons, groups)
+    uids = [uid for _, members in rows for uid in members]
+    counts = np.array([len(spike_log.get(uid, ())) for uid in uids], dtype=np.int64)
+    times = np.fromiter(
+        (t for uid in uids for t in spike_log.get(uid, ())), dtype=float, count=counts.sum()
+    )
+    lines = np.repeat(np.arange(len(uids)), counts)
+
+    if ax is None:
+        fig, ax = plt.subplots(figsize=(10, 5))
+    else:
+        fig = ax.figure
+
+    if groups is not None:
+        group_of_line = np.repeat(
+            np.arange(len(rows)), [len(members) for _, members in rows]
+        )
+        colors = cm.rainbow(np.linspace(0, 1, max(len(rows), 1)))
+        ax.scatter(times, lines, c=colors[group_of_line[lines]], marker="|", s=20)
+        bounds = np.cumsum([0] + [len(members) for _, members in rows])
+        ax.set_yticks((bounds[:-1] + bounds[1:] - 1) / 2)
+        ax.set_yticklabels([label for label, _ in rows])
+        for bound in bounds[1:-1]:
+            ax.axhline(bound - 0.5, color="lightgray", linewidth=0.5)
+    else:
+        ax.scatter(times, lines, c="#2A868C", marker="|", s=20)
+        if len(uids) <= MAX_ROWS:
+            ax.set_yticks(np.arange(len(uids)))
+            ax.set_yticklabels(uids)
+        else:
+            ax.set_ylabel("neuron")
+
+    ax.set_ylim(len(uids) - 0.5, -0.5)
+    ax.set_xlabel("time (ms)")
+    ax.spines["top"].set_visible(False)
+    ax.spines["right"].set_visible(False)
+
+    if show:
+        plt.show()
+    return fig
+
+
+def plot_run(
+    net,
+    timesteps: list[float],
+    voltage_log: dict[str, list[tuple]],
+    spike_log: dict[str, list[float]],
+    show: bool = True,
+):
+    """
+    Chronogram of a simulation, grouped by module when the network has too
+    many neurons for one row each, or a raster if even the modules are too
+    many.
+    """
+    if len(voltage_log) <= MAX_ROWS:
+        return plot_chronogram(timesteps, voltage_log, spike_log, show=show)
+    groups = module_groups(net)
+    if len(groups) <= MAX_ROWS:
+        return plot_chronogram(timesteps, voltage_log, spike_log, groups=groups, show=show)
+    return plot_raster(spike_log, groups=groups, show=show)
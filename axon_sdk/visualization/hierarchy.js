@@ -0,0 +1,142 @@
+// Hierarchical topology view: modules are collapsed nodes, expanded on click.
+// Every view is laid out by the server and fetched page by page.
+
+const PAGE_SIZE = 1000;
+// Edge colors, indexed like the synapse types
+const SYNAPSE_COLORS = { V: "#000000", ge: "#FF0830", gf: "#006400", gate: "#0E1AFE" };
+
+const expanded = new Set();
+
+async function fetchAll(endpoint) {
+    const query = "expanded=" + encodeURIComponent([...expanded].join(","));
+    let items = [];
+    let offset = 0;
+    let total = Infinity;
+    while (offset < total) {
+        const response = await fetch(`${endpoint}?${query}&offset=${offset}&limit=${PAGE_SIZE}`);
+        const page = await response.json();
+        items = items.concat(page.items);
+        total = page.total;
+        offset += page.limit;
+    }
+    return items;
+}
+
+function edgeColor(edge) {
+    // Color of the most frequent synapse type of a merged edge
+    const types = Object.entries(edge.types).sort((a, b) => b[1] - a[1]);
+    return SYNAPSE_COLORS[types[0][0]] || "#000000";
+}
+
+const svg = d3.select("#graph").append("svg")
+    .attr("width", "100%")
+    .attr("height", "100%");
+svg.append("defs").append("marker")
+    .attr("id", "arrow")
+    .attr("viewBox", "0 -5 10 10")
+    .attr("refX", 10)
+    .attr("markerWidth", 6)
+    .attr("markerHeight", 6)
+    .attr("orient", "auto")
+    .append("path")
+    .attr("d", "M0,-5L10,0L0,5")
+    .attr("fill", "#666");
+const inner = svg.append("g");
+svg.call(d3.zoom()
+    .scaleExtent([0.02, 3])
+    .on("zoom", event => inner.attr("transform", event.transform)));
+
+async function render() {
+    const status = document.getElementById("status");
+    status.textContent = "Loading...";
+    const [nodes, edges, containers] = await Promise.all([
+        fetchAll("/api/view/nodes"),
+        fetchAll("/api/view/edges"),
+        fetchAll("/api/view/containers"),
+    ]);
+    const position = new Map(nodes.map(node => [node.id, node]));
+    inner.selectAll("*").remove();
+
+    // Expanded modules, outermost first; click to collapse
+    inner.append("g").selectAll("g")
+        .data(containers)
+        .join("g")
+        .call(group => group.append("rect")
+            .attr("x", d => d.x0)
+            .attr("y", d => d.y0)
+            .attr("width", d => d.x1 - d.x0)
+            .attr("height", d => d.y1 - d.y0)
+            .style("fill", "rgba(240, 240, 240, 0.6)")
+            .style("stroke", "#333")
+            .style("stroke-width", 2))
+        .call(group => group.append("text")
+            .attr("x", d => (d.x0 + d.x1) / 2)
+            .attr("y", d => d.y0 - 8)
+            .attr("text-anchor", "middle")
+            .style("font-size", "16px")
+            .style("font-weight", "bold")
+            .text(d => d.label))
+        .style("cursor", "pointer")
+        .on("click", (event, d) => {
+            event.stopPropagation();
+            // Expanded submodules are remembered for when it's expanded again
+            expanded.delete(d.id);
+            render();
+        });
+
+    inner.append("g").selectAll("line")
+        .data(edges)
+        .join("line")
+        .attr("x1", d => position.get(d.source).x + 60)
+        .attr("y1", d => position.get(d.source).y)
+        .attr("x2", d => position.get(d.target).x - 60)
+        .attr("y2", d => position.get(d.target).y)
+        .attr("marker-end", "url(#arrow)")
+        .style("stroke", edgeColor)
+        .style("stroke-width", d => Math.min(1 + Math.log2(d.count), 6))
+        .style("stroke-opacity", 0.5)
+        .append("title")
+        .text(d => `${d.source} -> ${d.target}: ` +
+            Object.entries(d.types).map(([type, count]) => `${count} ${type}`).join(", "));
+
+    const node = inner.append("g").selectAll("g")
+        .data(nodes)
+        .join("g")
+        .attr("transform", d => `translate(${d.x}, ${d.y})`);
+    node.append("rect")
+        .attr("x", -60)
+        .attr("y", -25)
+        .attr("width", 120)
+        .attr("height", 50)
+        .attr("rx", d => d.kind === "module" ? 4 : 25)
+        .style("fill", d => d.kind === "module" ? "#DCEFF0" : "#FFFFFF")
+        .style("stroke", "#333")
+        .style("stroke-width", 2);
+    node.append("text")
+        .attr("text-anchor", "middle")
+        .attr("dy", d => d.kind === "module" ? "-0.2em" : "0.35em")
+        .style("font-size", "11px")
+        .text(d => d.label.split("\n")[0]);
+    node.filter(d => d.kind === "module")
+        .style("cursor", "pointer")
+        .on("click", (event, d) => {
+            expanded.add(d.id);
+            render();
+        })
+        .append("text")
+        .attr("text-anchor", "middle")
+        .attr("dy", "1.2em")
+        .style("font-size", "10px")
+        .text(d => `${d.neurons} neurons, ${d.submodules} submodules`);
+    node.append("title").text(d => d.label);
+
+    status.textContent = `${nodes.length} nodes, ${edges.length} edges. ` +
+        "Click a module to expand it, a box to collapse it.";
+}
+
+document.getElementById("collapse-all").addEventListener("click", () => {
+    expanded.clear();
+    render();
+});
+
+render().catch(error => console.error("Error fetching graph data:", error));
@@ -0,0 +1,318 @@
+from axon_sdk.primitives import SpikingNetworkModule
+from axon_sdk.primitives.elements import SYNAPSE_TYPES
+
+from collections import OrderedDict
+
+from typing import Iterable, Optional
+
+# Layout grid (px)
+LAYER_SPACING = 260
+ROW_SPACING = 90
+CONTAINER_PADDING = 40
+
+# Expansion states whose view is kept in memory
+VIEW_CACHE_SIZE = 32
+
+# Default and maximum page sizes of the paged endpoints
+PAGE_SIZE = 500
+MAX_PAGE_SIZE = 5000
+
+
+class TopologyIndex:
+    """
+    Module tree and synapses of a network, for its hierarchical
+    visualization.
+
+    A view shows the network with a set of `expanded` modules: the others
+    are collapsed into one node, and the synapses between collapsed modules
+    and neurons are merged into one edge per pair. The root is always
+    expanded. Views are laid out server-side and cached per expansion set.
+    """
+
+    def __init__(self, net: SpikingNetworkModule):
+        self.net = net
+        self.root = net.uid
+        self.modules: dict[str, SpikingNetworkModule] = {}
+        self.parent: dict[str, Optional[str]] = {net.uid: None}
+        # Modules from the root down to each module, both included
+        self.path: dict[str, tuple[str, ...]] = {net.uid: (net.uid,)}
+        self.num_neurons: dict[str, int] = {}
+
+        order: list[SpikingNetworkModule] = []
+        stack = [net]
+        while stack:
+            mod = stack.pop()
+            self.modules[mod.uid] = mod
+            order.append(mod)
+            for sub in reversed(mod.subnetworks):
+                self.parent[sub.uid] = mod.uid
+                self.path[sub.uid] = self.path[mod.uid] + (sub.uid,)
+                stack.append(sub)
+        for mod in reversed(order):
+            self.num_neurons[mod.uid] = len(mod.top_module_neurons) + sum(
+                self.num_neurons[sub.uid] for sub in mod.subnetworks
+            )
+
+        # Owning module of each neuron and the synapses as parallel lists
+        self.owner: dict[str, str] = {}
+        self.labels: dict[str, str] = {}
+        for mod in order:
+            for neuron in mod.top_module_neurons:
+                self.owner[neuron.uid] = mod.uid
+                info = neuron.additional_info
+                self.labels[neuron.uid] = neuron.uid + (f"\n {info}" if info else "")
+        self.synapses: list[tuple[str, str, int]] = []
+        for mod in order:
+            for neuron in mod.top_module_neurons:
+                synapses = neuron.out_synapses
+                for post, type_code in zip(synapses.post, synapses.types):
+                    if post.uid in self.owner:
+                        self.synapses.append((neuron.uid, post.uid, type_code))
+
+        self._views: OrderedDict[frozenset, dict] = OrderedDict()
+
+    def canonical(self, expanded: Iterable[str]) -> frozenset:
+        """
+        Known modules of `expanded` whose ancestors are all expanded too.
+        """
+        expanded = {uid for uid in expanded if uid in self.modules} | {self.root}
+        return frozenset(
+            uid for uid in expanded if all(a in expanded for a in self.path[uid])
+        )
+
+    def visible_node(self, neuron_uid: str, expanded: frozenset) -> str:
+        """
+        Node standing for a neuron: its outermost collapsed module, or the
+        neuron itself if all its modules are expanded.
+        """
+        for module_uid in self.path[self.owner[neuron_uid]]:
+            if module_uid not in expanded:
+                return module_uid
+        return neuron_uid
+
+    def module_children(self, uid: str) -> list[dict]:
+        """
+        Submodules and own neurons of a module.
+        """
+        mod = self.modules[uid]
+        children = [
+            {
+                "id": sub.uid,
+                "kind": "module",
+                "label": sub.uid,
+                "neurons": self.num_neurons[sub.uid],
+                "submodules": len(sub.subnetworks),
+            }
+            for sub in mod.subnetworks
+        ]
+        children.extend(
+            {"id": n.uid, "kind": "neuron", "label": self.labels[n.uid]}
+            for n in mod.top_module_neurons
+        )
+        return children
+
+    def view(self, expanded: Iterable[str] = ()) -> dict:
+        """
+        Laid out graph with the given modules expanded.
+
+        Returns `nodes` (with positions), `edges` (merged, with a count per
+        synapse type) and `containers`: the boxes of the expanded modules.
+        """
+        key = self.canonical(expanded)
+        if key in self._views:
+            self._views.move_to_end(key)
+            return self._views[key]
+
+        node_of = {uid: self.visible_node(uid, key) for uid in self.owner}
+        nodes: dict[str, dict] = {}
+        for neuron_uid, node in node_of.items():
+            if node in nodes:
+                continue
+            if node == neuron_uid:
+                container = self.owner[neuron_uid]
+                nodes[node] = {
+                    "id": node,
+                    "kind": "neuron",
+                    "label": self.labels[node],
+                    "parent": container,
+                }
+            else:
+                mod = self.modules[node]
+                nodes[node] = {
+                    "id": node,
+                    "kind": "module",
+                    "label": node,
+                    "parent": self.parent[node],
+                    "neurons": self.num_neurons[node],
+                    "submodules": len(mod.subnetworks),
+                }
+
+        merged: dict[tuple[str, str], list[int]] = {}
+        for pre, post, type_code in self.synapses:
+            source, target = node_of[pre], node_of[post]
+            if source == target:
+                continue
+            counts = merged.setdefault((source, target), [0] * len(SYNAPSE_TYPES))
+            counts[type_code] += 1
+        edges = [
+            {
+                "source": source,
+                "target": target,
+                "count": sum(counts),
+                "types": {
+                    name: count for name, count in zip(SYNAPSE_TYPES, counts) if count
+                },
+            }
+            for (source, target), counts in merged.items()
+        ]
+
+        positions = layered_layout(
+            list(nodes), list(merged), group=lambda uid: self._group_key(nodes[uid])
+        )
+        for uid, (x, y) in positions.items():
+            nodes[uid]["x"], nodes[uid]["y"] = x, y
+
+        view = {
+            "expanded": sorted(key),
+            "nodes": list(nodes.values()),
+            "edges": edges,
+            "containers": self._containers(key, nodes),
+        }
+        self._views[key] = view
+        if len(self._views) > VIEW_CACHE_SIZE:
+            self._views.popitem(last=False)
+        return view
+
+    def _group_key(self, node: dict) -> tuple[str, ...]:
+        # Nodes of the same expanded module are kept next to each other
+        return self.path[node["parent"]] if node["parent"] is not None else ()
+
+    def _containers(self, expanded: frozenset, nodes: dict[str, dict]) -> list[dict]:
+        boxes: dict[str, list[float]] = {}
+        for node in nodes.values():
+            if node["parent"] is None:
+                continue
+            for depth, uid in enumerate(self.path[node["parent"]]):
+                if uid == self.root:
+                    continue
+                pad = CONTAINER_PADDING * (len(self.path[node["parent"]]) - depth)
+                x0, y0 = node["x"] - pad, node["y"] - pad
+                x1, y1 = node["x"] + pad, node["y"] + pad
+                box = boxes.setdefault(uid, [x0, y0, x1, y1])
+                box[0], box[1] = min(box[0], x0), min(box[1], y0)
+                box[2], box[3] = max(box[2], x1), max(box[3], y1)
+        return [
+            {
+                "id": uid,
+                "label": uid,
+                "parent": self.parent[uid],
+                "depth": len(self.path[uid]) - 1,
+                "x0": box[0],
+                "y0": box[1],
+                "x1": box[2],
+                "y1": box[3],
+            }
+            for uid, box in sorted(boxes.items(), key=lambda item: len(self.path[item[0]]))
+        ]
+
+
+def page(items: list, offset: int = 0, limit: int = PAGE_SIZE) -> dict:
+    """
+    One page of `items`, with the total count for the client to fetch more.
+    """
+    offset = max(offset, 0)
+    limit = min(max(limit, 1), MAX_PAGE_SIZE)
+    return {
+        "offset": offset,
+        "limit": limit,
+        "total": len(items),
+        "items": items[offset : offset + limit],
+    }
+
+
+def layered_layout(
+    nodes: list[str],
+    edges: list[tuple[str, str]],
+    group=None,
+    sweeps: int = 4,
+) -> dict[str, tuple[float, float]]:
+    """
+    Left-to-right layered layout of a directed graph.
+
+    Cycles are broken by ignoring the back edges of a depth-first search;
+    each node is then placed on the layer of its longest path from a source,
+    and the nodes of each layer are ordered by `group` then by the mean
+    position of their neighbours (barycenter heuristic).
+    """
+    succ: dict[str, list[str]] = {n: [] for n in nodes}
+    for source, target in edges:
+        succ[source].append(target)
+
+    # Depth-first search for the back edges, iteratively
+    state: dict[str, int] = {}
+    forward: dict[str, list[str]] = {n: [] for n in nodes}
+    for start in nodes:
+        if start in state:
+            continue
+        state[start] = 1
+        stack = [(start, iter(succ[start]))]
+        while stack:
+            node, children = stack[-1]
+            for child in children:
+                if child not in state:
+                    forward[node].append(child)
+                    state[child] = 1
+                    stack.append((child, iter(succ[child])))
+                    break
+                if state[child] == 2:
+                    forward[node].append(child)
+            else:
+                state[node] = 2
+                stack.pop()
+
+    # Longest path layering, in topological order
+    indegree = {n: 0 for n in nodes}
+    for node in nodes:
+        for child in forward[node]:
+            indegree[child] += 1
+    layer = {n: 0 for n in nodes}
+    ready = [n for n in nodes if indegree[n] == 0]
+    while ready:
+        node = ready.pop()
+        for child in forward[node]:
+            layer[child] = max(layer[child], layer[node] + 1)
+            indegree[child] -= 1
+            if indegree[child] == 0:
+                ready.append(child)
+
+    layers: dict[int, list[str]] = {}
+    for node in nodes:
+        layers.setdefault(layer[node], []).append(node)
+    pred: dict[str, list[str]] = {n: [] for n in nodes}
+    for node in nodes:
+        for child in forward[node]:
+            pred[child].append(node)
+
+    group = group if group is not None else (lambda node: ())
+    rank = {}
+    for members in layers.values():
+        members.sort(key=group)
+        rank.update((node, i) for i, node in enumerate(members))
+    for sweep in range(sweeps):
+        neighbours = pred if sweep % 2 == 0 else succ
+        for index in sorted(layers, reverse=sweep % 2 == 1):
+            members = layers[index]
+
+            def barycenter(node):
+                linked = [rank[n] for n in neighbours[node] if n in rank]
+                return sum(linked) / len(linked) if linked else rank[node]
+
+            members.sort(key=lambda node: (group(node), barycenter(node)))
+            rank.update((node, i) for i, node in enumerate(members))
+
+    positions = {}
+    for index, members in layers.items():
+        offset = (len(members) - 1) / 2
+        for i, node in enumerate(members):
+            positions[node] = (index * LAYER_SPACING, (i - offset) * ROW_SPACING)
+    return positions
@@ -0,0 +1,105 @@
+// Live view of a running simulation, fed by the /api/stream Server-Sent Events.
+// Top: raster of the latest spikes, one row per neuron, grouped by module.
+// Bottom: spikes per module, in total and in the last batch.
+
+// Simulation time shown in the raster
+const WINDOW = 200;
+
+let header = null;
+let rowOf = [];
+let spikes = [];      // [neuron id, t] of the raster window
+let latest = null;
+
+const canvas = document.getElementById("raster");
+const status = document.getElementById("status");
+const totals = new Map();
+
+function onInit(data) {
+    // Sent again on reconnection, with the missed batches only
+    if (header) return;
+    header = data;
+    // Neurons sorted by module, so that each module is a band of rows
+    const order = data.neurons.map((_, id) => id)
+        .sort((a, b) => data.module_of[a] - data.module_of[b]);
+    rowOf = new Array(order.length);
+    order.forEach((id, row) => { rowOf[id] = row; });
+    data.modules.forEach(uid => totals.set(uid, 0));
+}
+
+function onBatch(batch) {
+    latest = batch;
+    spikes = spikes.concat(batch.events).filter(([, t]) => t > batch.t - WINDOW);
+    for (const [uid, count] of Object.entries(batch.activity)) {
+        totals.set(uid, totals.get(uid) + count);
+    }
+    const processed = Object.values(batch.processed).reduce((a, b) => a + b, 0);
+    status.textContent = `t = ${batch.t.toFixed(3)}, ${batch.spikes} spikes, ` +
+        `${processed} synaptic events, ${batch.wall.toFixed(1)} s` +
+        (batch.dropped ? ` (${batch.dropped} spikes not drawn)` : "") +
+        (batch.final ? " - finished" : "");
+}
+
+function drawRaster() {
+    const width = canvas.clientWidth;
+    const height = canvas.clientHeight;
+    canvas.width = width;
+    canvas.height = height;
+    const context = canvas.getContext("2d");
+    context.clearRect(0, 0, width, height);
+    if (!header || !latest) return;
+
+    const start = Math.max(latest.t - WINDOW, 0);
+    const rowHeight = height / Math.max(rowOf.length, 1);
+    context.fillStyle = "#0E1AFE";
+    for (const [id, t] of spikes) {
+        const x = (t - start) / WINDOW * width;
+        context.fillRect(x, rowOf[id] * rowHeight, 2, Math.max(rowHeight, 1));
+    }
+}
+
+function drawActivity() {
+    if (!header || !latest) return;
+    const data = header.modules.map(uid => ({
+        uid: uid,
+        total: totals.get(uid),
+        recent: latest.activity[uid] || 0,
+    }));
+    const max = d3.max(data, d => d.total) || 1;
+    const rows = d3.select("#activity").selectAll("div")
+        .data(data, d => d.uid)
+        .join(enter => {
+            const row = enter.append("div")
+                .style("display", "flex")
+                .style("align-items", "center")
+                .style("font-size", "12px")
+                .style("padding", "1px 20px");
+            row.append("span")
+                .style("width", "30%")
+                .style("overflow", "hidden")
+                .text(d => d.uid);
+            row.append("div")
+                .attr("class", "bar")
+                .style("height", "12px")
+                .style("background", "#DCEFF0")
+                .style("border", "1px solid #333");
+            row.append("span")
+                .attr("class", "count")
+                .style("margin-left", "6px");
+            return row;
+        });
+    rows.select(".bar").style("width", d => `${50 * d.total / max}%`)
+        .style("background", d => d.recent ? "#FF0830" : "#DCEFF0");
+    rows.select(".count").text(d => `${d.total} (+${d.recent})`);
+}
+
+const source = new EventSource("/api/stream");
+source.addEventListener("init", event => onInit(JSON.parse(event.data)));
+source.addEventListener("batch", event => {
+    const batch = JSON.parse(event.data);
+    onBatch(batch);
+    drawRaster();
+    drawActivity();
+    if (batch.final) source.close();
+});
+source.onerror = () => { status.textContent += " (disconnected)"; };
+window.addEventListener("resize", drawRaster);
@@ -1,12 +1,18 @@
 import http.server
 import json
-import socketserver
 import webbrowser
 import socket
 import os
-import time
 import threading
 
+from urllib.parse import urlparse, parse_qs
+from typing import Optional
+
+from .hierarchy import TopologyIndex, page, PAGE_SIZE
+
+# Seconds without batch before a keepalive comment is sent to stream clients
+STREAM_KEEPALIVE = 15.0
+
 
 class Handler(http.server.SimpleHTTPRequestHandler):
     def __init__(self, *args, **kwargs):
@@ -14,18 +20,135 @@ class Handler(http.server.SimpleHTTPRequestHandler):
         super().__init__(*args, directory=script_dir, **kwargs)
 
     def do_GET(self):
-        if self.path == "/graph_data":
-            graph_data = self.server.graph_data
-            self.send_response(200)
-            self.send_header("Content-Type", "application/json")
-            self.end_headers()
-            self.wfile.write(json.dumps(graph_data).encode())
+        url = urlparse(self.path)
+        if url.path == "/graph_data":
+            self._send_json(self.server.graph_data)
+        elif url.path == "/api/stream":
+            self._stream()
+        elif url.path.startswith("/api/"):
+            self._api(url.path, parse_qs(url.query))
         else:
             super().do_GET()
 
+    def _api(self, path: str, query: dict[str, list[str]]) -> None:
+        """
+        Paged endpoints of the hierarchical view:
+
+        /api/root                          uid and size of the network
+        /api/view/nodes?expanded=a,b       laid out nodes of a view
+        /api/view/edges?expanded=a,b       merged edges of a view
+        /api/view/containers?expanded=a,b  boxes of the expanded modules
+        /api/module?uid=a                  submodules and neurons of a module
+
+        All but /api/root take `offset` and `limit`.
+        """
+        topology: Optional[TopologyIndex] = self.server.topology
+        if topology is None:
+            self.send_error(404, "No hierarchical view is being served")
+            return
+        try:
+            offset = int(query.get("offset", ["0"])[0])
+            limit = int(query.get("limit", [str(PAGE_SIZE)])[0])
+        except ValueError:
+            self.send_error(400, "offset and limit must be integers")
+            return
+        expanded = [uid for uid in query.get("expanded", [""])[0].split(",") if uid]
+
+        if path == "/api/root":
+            self._send_json(
+                {
+                    "uid": topology.root,
+                    "neurons": topology.num_neurons[topology.root],
+                    "modules": len(topology.modules),
+                    "synapses": len(topology.synapses),
+                }
+            )
+        elif path in ("/api/view/nodes", "/api/view/edges", "/api/view/containers"):
+            items = topology.view(expanded)[path.rsplit("/", 1)[1]]
+            self._send_json(page(items, offset, limit))
+        elif path == "/api/module":
+            uid = query.get("uid", [topology.root])[0]
+            if uid not in topology.modules:
+                self.send_error(404, f"Unknown module {uid}")
+                return
+            self._send_json(page(topology.module_children(uid), offset, limit))
+        else:
+            self.send_error(404, f"Unknown endpoint {path}")
+
+    def _stream(self) -> None:
+        """
+        Server-Sent Events of the live simulation: an `init` event with the
+        neuron and module names, then one `batch` event per batch until the
+        simulation is over.
+        """
+        stream = self.server.stream
+        if stream is None:
+            self.send_error(404, "No simulation is being streamed")
+            return
+        last_id = self.headers.get("Last-Event-ID", "")
+        after = int(last_id) if last_id.isdigit() else 0
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.close_connection = True
+        try:
+            self._send_event("init", stream.header())
+            while True:
+                batches = stream.wait(after, timeout=STREAM_KEEPALIVE)
+                for batch in batches:
+                    self._send_event("batch", batch, event_id=batch["seq"])
+                    after = batch["seq"]
+                if batches and batches[-1]["final"]:
+                    break
+                if not batches:
+                    if stream.closed:
+                        break
+                    # Comment line, keeps proxies from closing the connection
+                    self.wfile.write(b": keepalive\n\n")
+                    self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def _send_event(self, event: str, data, event_id: Optional[int] = None) -> None:
+        message = f"event: {event}\n"
+        if event_id is not None:
+            message += f"id: {event_id}\n"
+        message += f"data: {json.dumps(data)}\n\n"
+        self.wfile.write(message.encode())
+        self.wfile.flush()
+
+    def _send_json(self, data) -> None:
+        body = json.dumps(data).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Page fetches would flood the console of the simulation
+        pass
+
+
+class TopologyServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
 
-def open_browser(port):
-    webbrowser.open(f"http://localhost:{port}")
+    def __init__(self, port: int, graph_data: Optional[dict], topology=None):
+        super().__init__(("localhost", port), Handler)
+        self.graph_data = graph_data
+        self.topology = topology
+        # `LiveStream` of the running simulation, see `serve_stream`
+        self.stream = None
+
+
+# Server of the session, reused by later visualizations
+_server: Optional[TopologyServer] = None
+
+
+def open_browser(port, page=""):
+    webbrowser.open(f"http://localhost:{port}/{page}")
 
 
 def is_port_available(port):
@@ -45,34 +168,52 @@ def find_available_port(initial_port):
     return port
 
 
-def start_server_on_port(graph_data, port):
-    with socketserver.TCPServer(("", port), Handler) as httpd:
-        print(f"Serving HTTP on localhost port {port}...")
-        httpd.graph_data = graph_data
-        httpd.serve_forever()
-
-
-def start_server(graph_data):
+def start_server(
+    graph_data: Optional[dict],
+    topology: Optional[TopologyIndex] = None,
+    page: str = "",
+    open_page: bool = True,
+) -> int:
     """
-    The server will only stay open for a fixed amount of time, enough to load the visualization.
-    Afterwards, the simulator execution will continue.
-    To achieve so, the server is run on a different thread with a timeout.
+    Serve the visualization in a background thread and return the port.
+
+    The server stays up for the rest of the session, so that the page can be
+    refreshed and the hierarchical view can fetch modules on demand. A later
+    visualization reuses it with the new data; `stop_server()` shuts it down.
     """
+    global _server
     print("Launching topology visualization...")
     print("=========================================")
-    port = find_available_port(initial_port=8000)
-    open_browser(port)
-    server_thread = threading.Thread(
-        target=start_server_on_port, args=(graph_data, port)
-    )
-    server_thread.daemon = (
-        True  # This allows the program to exit even if the thread is running
-    )
-    server_thread.start()
-    time.sleep(1)
-    server_thread.join(timeout=1)
-    print("Stopping server and continuing program execution...")
-    print(
-        "[Refreshing the visualization tab will not work since the server is stopped]"
-    )
+    if _server is None:
+        port = find_available_port(initial_port=8000)
+        _server = TopologyServer(port, graph_data, topology)
+        server_thread = threading.Thread(target=_server.serve_forever, daemon=True)
+        server_thread.start()
+    else:
+        _server.graph_data = graph_data
+        _server.topology = topology
+    port = _server.server_address[1]
+    print(f"Serving HTTP on localhost port {port} until the end of the session")
+    print(f"[Open http://localhost:{port}/{page} to see the visualization again]")
     print("=========================================")
+    if open_page:
+        open_browser(port, page)
+    return port
+
+
+def serve_stream(stream) -> None:
+    """
+    Serve the batches of a `LiveStream` on `/api/stream`, replacing the
+    previous stream. Requires a running server, see `start_server`.
+    """
+    if _server is None:
+        raise RuntimeError("The visualization server is not running")
+    _server.stream = stream
+
+
+def stop_server() -> None:
+    global _server
+    if _server is not None:
+        _server.shutdown()
+        _server.server_close()
+        _server = None
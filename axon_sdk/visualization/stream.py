@@ -0,0 +1,226 @@
+from axon_sdk.primitives import SpikeSink
+from axon_sdk.instrumentation import module_uids_of
+
+from .hierarchy import TopologyIndex
+from .server import start_server, serve_stream
+
+from collections import deque
+import threading
+import time
+
+from typing import Optional
+
+# Wall time between two batches sent to the browser (s)
+STREAM_INTERVAL = 0.25
+# Spike events sent per batch; the others are only counted
+MAX_BATCH_EVENTS = 2000
+# Batches kept for clients connecting late or reconnecting
+STREAM_HISTORY = 64
+
+
+class StreamingSpikeSink(SpikeSink):
+    """
+    Forwards every spike to `sink` and queues it for a `LiveStream`.
+
+    Appending to a deque is the only work added to the simulation loop; the
+    queue is drained by the stream thread.
+    """
+
+    def __init__(self, sink: SpikeSink) -> None:
+        super().__init__()
+        self.sink = sink
+        # Spikes recorded before, such as the input spikes, come first
+        spike_log = sink.as_dict()
+        recorded = sorted(
+            (t, neuron_id)
+            for neuron_id, uid in enumerate(sink.uids)
+            for t in spike_log.get(uid, ())
+        )
+        self.pending: deque[tuple[int, float]] = deque(
+            (neuron_id, t) for t, neuron_id in recorded
+        )
+
+    @property
+    def uids(self) -> list[str]:
+        return self.sink.uids
+
+    def register(self, uid: str) -> int:
+        return self.sink.register(uid)
+
+    def record_id(self, neuron_id: int, t: float) -> None:
+        self.sink.record_id(neuron_id, t)
+        self.pending.append((neuron_id, t))
+
+    def spikes_of(self, uid: str) -> list[float]:
+        return self.sink.spikes_of(uid)
+
+    def as_dict(self) -> dict[str, list[float]]:
+        return self.sink.as_dict()
+
+    def clear(self) -> None:
+        self.sink.clear()
+        self.pending.clear()
+
+    def close(self) -> None:
+        self.sink.close()
+
+    def __len__(self) -> int:
+        return len(self.sink)
+
+
+class LiveStream:
+    """
+    Batches of the spikes of a running simulation, for the live view.
+
+    Every `interval` seconds a background thread drains the queued spikes
+    into one batch: the simulation time reached, the spikes and processed
+    synaptic events so far, the spikes of each module (submodules deeper than
+    `depth` count for their ancestor) and up to `max_events` of the spikes
+    themselves. Clients wait for batches with `wait()`.
+
+    Parameters:
+    sim (SimulationEngine): Simulation to stream; its spike sink is
+        wrapped in a `StreamingSpikeSink` until `close()`.
+    interval (float): Wall time between batches (s).
+    depth (Optional[int]): Module depth of the activity counters.
+    max_events (int): Spike events sent per batch.
+    history (int): Batches kept for late clients.
+    """
+
+    def __init__(
+        self,
+        sim,
+        interval: float = STREAM_INTERVAL,
+        depth: Optional[int] = 1,
+        max_events: int = MAX_BATCH_EVENTS,
+        history: int = STREAM_HISTORY,
+    ):
+        self.sim = sim
+        self.interval = interval
+        self.max_events = max_events
+        self.sink = StreamingSpikeSink(sim.spike_sink)
+        sim.spike_sink = self.sink
+
+        # Module index of each spike sink id
+        neurons = sim.synapse_table.neurons
+        owners = module_uids_of(sim.net, neurons, max_depth=depth)
+        self.modules = sorted(set(owners))
+        module_index = {uid: i for i, uid in enumerate(self.modules)}
+        self.neuron_uids = list(self.sink.uids)
+        self._module_of = [0] * len(self.neuron_uids)
+        for sink_id, owner in zip(sim._sink_ids, owners):
+            self._module_of[sink_id] = module_index[owner]
+
+        self.module_spikes = [0] * len(self.modules)
+        self.spikes = 0
+        self.t = 0.0
+        self.closed = False
+        self._seq = 0
+        self._batches: deque[dict] = deque(maxlen=history)
+        self._changed = threading.Condition()
+        self._stop = threading.Event()
+        self._started = time.perf_counter()
+        # Port of the server, set by `watch`
+        self.port: Optional[int] = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def header(self) -> dict:
+        """
+        Names of the neurons (by spike sink id) and modules of the batches.
+        """
+        return {
+            "neurons": self.neuron_uids,
+            "modules": self.modules,
+            "module_of": self._module_of,
+            "interval": self.interval,
+        }
+
+    def flush(self) -> dict:
+        """
+        Drain the queued spikes into a new batch and publish it.
+        """
+        pending = self.sink.pending
+        module_of = self._module_of
+        counts = [0] * len(self.modules)
+        events = []
+        for _ in range(len(pending)):
+            neuron_id, t = pending.popleft()
+            counts[module_of[neuron_id]] += 1
+            if len(events) < self.max_events:
+                events.append((neuron_id, t))
+            if t > self.t:
+                self.t = t
+        num_spikes = sum(counts)
+        self.spikes += num_spikes
+        for i, count in enumerate(counts):
+            self.module_spikes[i] += count
+
+        with self._changed:
+            self._seq += 1
+            batch = {
+                "seq": self._seq,
+                "wall": time.perf_counter() - self._started,
+                "t": self.t,
+                "spikes": self.spikes,
+                "batch_spikes": num_spikes,
+                "dropped": num_spikes - len(events),
+                "processed": self.sim.processed_syn_per_type,
+                "activity": {
+                    self.modules[i]: count for i, count in enumerate(counts) if count
+                },
+                "events": events,
+                "final": self.closed,
+            }
+            self._batches.append(batch)
+            self._changed.notify_all()
+        return batch
+
+    def wait(self, after: int, timeout: Optional[float] = None) -> list[dict]:
+        """
+        Batches published after sequence number `after`, waiting up to
+        `timeout` seconds for one if there is none yet.
+        """
+        with self._changed:
+            self._changed.wait_for(
+                lambda: self._seq > after or self.closed, timeout=timeout
+            )
+            return [batch for batch in self._batches if batch["seq"] > after]
+
+    def close(self) -> None:
+        """
+        Stop the thread, publish the last batch and restore the spike sink.
+        """
+        if self.closed:
+            return
+        self._stop.set()
+        self._thread.join()
+        self.closed = True
+        self.flush()
+        self.sim.spike_sink = self.sink.sink
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def watch(sim, open_page: bool = True, **kwargs) -> LiveStream:
+    """
+    Stream the spikes of `sim` to the live view while it runs.
+
+    Call before `simulate()` and close the returned `LiveStream` once it
+    returns (or use it as a context manager). Set `VIS=live` to do both
+    around every simulation.
+    """
+    stream = LiveStream(sim, **kwargs)
+    stream.port = start_server(
+        None, TopologyIndex(sim.net), page="live.html", open_page=open_page
+    )
+    serve_stream(stream)
+    return stream
@@ -2,7 +2,13 @@ from axon_sdk.primitives import SpikingNetworkModule
 from axon_sdk.primitives import ExplicitNeuron
 
 from .server import start_server
-from ..primitives.elements import Synapse
+from .hierarchy import TopologyIndex
+from ..primitives.elements import Synapse, synapse_type_code
+
+from typing import Optional, Union
+
+# Networks with more neurons are shown as collapsible modules
+HIERARCHICAL_THRESHOLD = 300
 
 
 def generate_mapping_neuron_to_net(
@@ -84,16 +90,14 @@ def format_nodes(neurons: list[ExplicitNeuron]) -> list[dict[str, str]]:
     return nodes
 
 
-def color_for_synapse(synapse_type: str) -> str:
-    if synapse_type == "V":
-        return "#000000"
-    if synapse_type == "ge":
-        return "#FF0830"
-    if synapse_type == "gf":
-        return "#006400"
-    if synapse_type == "gate":
-        return "#0E1AFE"
-    else:
+# Edge colors, indexed by synapse type code
+SYNAPSE_COLORS = ("#000000", "#FF0830", "#006400", "#0E1AFE")
+
+
+def color_for_synapse(synapse_type: Union[str, int]) -> str:
+    try:
+        return SYNAPSE_COLORS[synapse_type_code(synapse_type)]
+    except ValueError:
         return "#000000"
 
 
@@ -104,7 +108,7 @@ def format_edges(synapses: list[Synapse]) -> list[dict[str, str]]:
         item["source"] = syn.pre_neuron.uid
         item["target"] = syn.post_neuron.uid
         item["label"] = f"({syn.weight:.3f}; {syn.delay:.3f})"
-        item["color"] = color_for_synapse(syn.type)
+        item["color"] = SYNAPSE_COLORS[syn.type_code]
         item["uid"] = syn.uid
         edges.append(item)
     return edges
@@ -136,7 +140,20 @@ def format_groups(groups: list[tuple[ExplicitNeuron, str]]) -> list[dict[str, st
     return formatted_groups
 
 
-def vis_topology(net: SpikingNetworkModule) -> None:
+def vis_topology(net: SpikingNetworkModule, hierarchical: Optional[bool] = None) -> int:
+    """
+    Show the topology of `net` in the browser and return the server port.
+
+    The hierarchical view (default above `HIERARCHICAL_THRESHOLD` neurons)
+    starts with the submodules of `net` collapsed and expands them on click,
+    fetching each view from the server, laid out, page by page. The flat view
+    shows every neuron with a synapse crossing modules at once.
+    """
+    if hierarchical is None:
+        hierarchical = len(net.neurons) > HIERARCHICAL_THRESHOLD
+    if hierarchical:
+        return start_server(None, TopologyIndex(net), page="hierarchy.html")
+
     neurons_to_display, synapses_to_display = get_neurons_and_synapses_to_display(net)
     groups_to_display = get_groups_to_display(net, neurons_to_display)
 
@@ -149,4 +166,4 @@ def vis_topology(net: SpikingNetworkModule) -> None:
     graph_data["edges"] = edges
     graph_data["groups"] = groups
 
-    start_server(graph_data)
+    return start_server(graph_data)
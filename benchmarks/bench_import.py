@@ -0,0 +1,60 @@
+"""
+Cold-start benchmark: time of `import axon_sdk` in a fresh interpreter.
+
+Fails (exit code 1) if the median import time exceeds the budget or if a
+plotting/demo-only dependency is loaded at import time.
+
+Usage:
+    python benchmarks/bench_import.py [--runs 10] [--budget-ms 400]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+# Modules that must only be loaded on first use
+LAZY_MODULES = ("matplotlib", "axon_sdk.visualization.chronogram")
+
+PROBE = f"""
+import sys, time, json
+start = time.perf_counter()
+import axon_sdk
+elapsed = time.perf_counter() - start
+loaded = [m for m in {LAZY_MODULES!r} if m in sys.modules]
+print(json.dumps({{"elapsed": elapsed, "loaded": loaded}}))
+"""
+
+
+def measure(runs: int) -> tuple[list[float], list[str]]:
+    times = []
+    loaded: set[str] = set()
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", PROBE], capture_output=True, text=True, check=True
+        )
+        result = json.loads(out.stdout)
+        times.append(result["elapsed"])
+        loaded.update(result["loaded"])
+    return times, sorted(loaded)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, default=400.0)
+    args = parser.parse_args()
+
+    times, loaded = measure(args.runs)
+    median_ms = statistics.median(times) * 1e3
+    print(f"import axon_sdk: median {median_ms:.1f} ms, min {min(times) * 1e3:.1f} ms")
+
+    ok = True
+    if loaded:
+        print(f"FAIL: loaded at import time: {', '.join(loaded)}")
+        ok = False
+    if median_ms > args.budget_ms:
+        print(f"FAIL: over the cold-start budget of {args.budget_ms:.0f} ms")
+        ok = False
+    sys.exit(0 if ok else 1)
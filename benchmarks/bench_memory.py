@@ -0,0 +1,99 @@
+"""
+Memory benchmark of the network representation.
+
+Compiles an NxN matrix multiplication (8x8 by default) and reports the bytes
+used per neuron, per synapse and per queued event of both simulators.
+
+Usage:
+    python benchmarks/bench_memory.py [N]
+"""
+
+from axon_sdk.compilation import Scalar, compile_computation
+from axon_sdk.primitives import ExplicitNeuron, CancelableEventQueue, SynapseTable
+from axon_sdk.primitives.events import FanoutEventQueue, PredictedSpikeEvent
+
+import random
+import sys
+import tracemalloc
+
+
+def matmul_sum(n: int) -> Scalar:
+    random.seed(0)
+    A = [[Scalar(random.uniform(-1, 1)) for _ in range(n)] for _ in range(n)]
+    B = [[Scalar(random.uniform(-1, 1)) for _ in range(n)] for _ in range(n)]
+    out = Scalar(0.0)
+    for i in range(n):
+        for j in range(n):
+            for k in range(n):
+                out = out + A[i][k] * B[k][j]
+    return out
+
+
+def traced_bytes(build) -> tuple[int, object]:
+    """
+    Bytes still allocated after running `build()`, and its result.
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, result
+
+
+def run(n: int = 8) -> dict[str, float]:
+    root = matmul_sum(n)
+    plan = compile_computation(root, max_range=100)
+    neurons = plan.net.neurons
+    table = SynapseTable.from_neurons(neurons)
+    num_synapses = table.num_synapses
+
+    count = 10_000
+    neuron_bytes, _ = traced_bytes(
+        lambda: [ExplicitNeuron(Vt=10.0, tm=100.0, tf=20.0) for _ in range(count)]
+    )
+
+    def connect_all():
+        pre = ExplicitNeuron(Vt=10.0, tm=100.0, tf=20.0)
+        post = ExplicitNeuron(Vt=10.0, tm=100.0, tf=20.0)
+        for _ in range(count):
+            pre.out_synapses.add(post, "V", 10.0, 1.0)
+        return pre
+
+    synapse_bytes, _ = traced_bytes(connect_all)
+
+    def fill_fanout_queue():
+        queue = FanoutEventQueue()
+        for i in range(count):
+            queue.add_event(float(i), i % len(neurons), 0, 10.0)
+        return queue
+
+    fanout_event_bytes, _ = traced_bytes(fill_fanout_queue)
+
+    def fill_cancelable_queue():
+        queue = CancelableEventQueue()
+        for i in range(count):
+            queue.add_event(PredictedSpikeEvent(t=float(i), neuron=neurons[0]))
+        return queue
+
+    predicted_event_bytes, _ = traced_bytes(fill_cancelable_queue)
+
+    return {
+        "neurons": len(neurons),
+        "synapses": num_synapses,
+        "bytes/neuron (object, no synapses)": neuron_bytes / count,
+        "bytes/synapse (SynapseList)": synapse_bytes / count,
+        "bytes/synapse (CSR table)": sum(
+            a.nbytes for a in table.as_numpy().values()
+        )
+        / max(num_synapses, 1),
+        "bytes/queued event (Simulator)": fanout_event_bytes / count,
+        "bytes/queued event (PredSimulator, predicted spike)": predicted_event_bytes
+        / count,
+    }
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    for name, value in run(n).items():
+        print(f"{name:52s} {value:10.1f}")
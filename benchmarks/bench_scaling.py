@@ -0,0 +1,148 @@
+"""
+Scaling study: compile time, simulation time and memory against network size.
+
+Sweeps the size parameter of a graph generator of
+`axon_sdk.compilation.generators`, compiles every graph and simulates it,
+and writes one JSON row per size. With `--plot`, also draws time and memory
+against the number of neurons.
+
+The time-stepped `Simulator` logs every neuron at every step, so it is only
+run up to `--sim-max-neurons`; `PredSimulator` runs at every size.
+
+Usage:
+    python benchmarks/bench_scaling.py random_expression 64 256 1024 4096
+        [--engines sim,pred] [--memory] [--out scaling.json] [--plot scaling.png]
+"""
+
+from axon_sdk import Simulator, PredSimulator, decode_output
+from axon_sdk.compilation import compile_computation, generators
+from axon_sdk.primitives import DataEncoder
+
+from workloads import graph_depth, TIME_PER_LEVEL
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+
+GENERATORS = {
+    "dot_product": generators.dot_product,
+    "matmul": generators.matmul,
+    "polynomial": generators.polynomial,
+    "fir_filter": generators.fir_filter,
+    "random_expression": generators.random_expression,
+}
+
+ENGINES = {"sim": Simulator, "pred": PredSimulator}
+
+
+def measure(generator: str, size: int, engine: str, memory: bool) -> dict:
+    if memory:
+        tracemalloc.start()
+
+    root, expected = GENERATORS[generator](size)
+    start = time.perf_counter()
+    plan = compile_computation(root, max_range=100)
+    compiled = time.perf_counter()
+
+    sim = ENGINES[engine](plan.net, DataEncoder(), dt=0.01)
+    for trigger in plan.input_triggers:
+        sim.apply_input_value(trigger.normalized_value, trigger.trigger_neuron)
+    built = time.perf_counter()
+
+    if engine == "sim":
+        sim.simulate((graph_depth(root) + 1) * TIME_PER_LEVEL)
+    else:
+        sim.simulate()
+    done = time.perf_counter()
+
+    row = {
+        "generator": generator,
+        "size": size,
+        "engine": engine,
+        "neurons": len(plan.net.neurons),
+        "synapses": sim.synapse_table.num_synapses,
+        "compile_time": compiled - start,
+        "build_time": built - compiled,
+        "wall_time": done - built,
+        "peak_memory": None,
+        "expected": expected,
+        "decoded": None,
+    }
+    if memory:
+        row["peak_memory"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    try:
+        row["decoded"] = decode_output(sim, plan.output_reader)
+    except ValueError:
+        pass
+    return row
+
+
+def plot(rows: list[dict], outfile: str) -> None:
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    fig, (ax_time, ax_mem) = plt.subplots(1, 2, figsize=(11, 4))
+    for engine in ENGINES:
+        selected = [r for r in rows if r["engine"] == engine]
+        if not selected:
+            continue
+        neurons = [r["neurons"] for r in selected]
+        ax_time.loglog(neurons, [r["wall_time"] for r in selected], "o-", label=engine)
+        if selected[0]["peak_memory"] is not None:
+            memory = [r["peak_memory"] / 2**20 for r in selected]
+            ax_mem.loglog(neurons, memory, "o-", label=engine)
+    compile_rows = [r for r in rows if r["engine"] == rows[0]["engine"]]
+    ax_time.loglog(
+        [r["neurons"] for r in compile_rows],
+        [r["compile_time"] for r in compile_rows],
+        "s--",
+        label="compile",
+    )
+    ax_time.set_xlabel("neurons")
+    ax_time.set_ylabel("time (s)")
+    ax_mem.set_xlabel("neurons")
+    ax_mem.set_ylabel("peak memory (MiB)")
+    ax_time.legend()
+    ax_mem.legend()
+    fig.suptitle(rows[0]["generator"])
+    fig.tight_layout()
+    fig.savefig(outfile)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("generator", choices=list(GENERATORS))
+    parser.add_argument("sizes", type=int, nargs="+")
+    parser.add_argument("--engines", default="pred", help="comma-separated: sim,pred")
+    parser.add_argument("--sim-max-neurons", type=int, default=20_000)
+    parser.add_argument("--memory", action="store_true", help="trace peak memory")
+    parser.add_argument("--out", default=None, help="JSON output file")
+    parser.add_argument("--plot", default=None, help="image file of the plots")
+    args = parser.parse_args()
+
+    rows = []
+    for size in args.sizes:
+        for engine in args.engines.split(","):
+            if engine == "sim" and rows and rows[-1]["neurons"] > args.sim_max_neurons:
+                continue
+            row = measure(args.generator, size, engine, args.memory)
+            rows.append(row)
+            print(
+                f"{args.generator} {size:7d} {engine:4s} {row['neurons']:8d} neurons  "
+                f"compile {row['compile_time']:7.2f} s  "
+                f"simulate {row['wall_time']:7.2f} s",
+                file=sys.stderr,
+            )
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(rows, f, indent=2)
+    else:
+        print(json.dumps(rows, indent=2))
+    if args.plot:
+        plot(rows, args.plot)
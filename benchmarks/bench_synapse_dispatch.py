@@ -0,0 +1,72 @@
+"""
+Micro-benchmark of synaptic event dispatch.
+
+Compares the former string-comparison chain ("before") with the integer-code
+dispatch table used by the simulators ("after"), in delivered events per second.
+
+Usage:
+    python benchmarks/bench_synapse_dispatch.py [num_events]
+"""
+
+from axon_sdk.primitives import ExplicitNeuron
+from axon_sdk.primitives.elements import SYNAPSE_TYPES, SYNAPSE_HANDLERS
+
+import random
+import sys
+import time
+
+
+def receive_synaptic_event_by_name(
+    neuron: ExplicitNeuron, synapse_type: str, weight: float
+) -> None:
+    # Dispatch as implemented before synapse type codes were introduced
+    if synapse_type == "V":
+        neuron.V += weight
+    elif synapse_type == "ge":
+        neuron.ge += weight
+    elif synapse_type == "gf":
+        neuron.gf += weight
+    elif synapse_type == "gate":
+        neuron.gate += weight
+    else:
+        raise ValueError("Unknown synapse type.")
+
+
+def events_per_second(deliver, events: list, repeats: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        deliver(events)
+        best = min(best, time.perf_counter() - start)
+    return len(events) / best
+
+
+def run(num_events: int = 1_000_000) -> dict[str, float]:
+    random.seed(0)
+    neuron = ExplicitNeuron(Vt=10.0, tm=100.0, tf=20.0)
+    coded_events = [
+        (random.randrange(len(SYNAPSE_TYPES)), 1e-9) for _ in range(num_events)
+    ]
+    named_events = [(SYNAPSE_TYPES[code], w) for code, w in coded_events]
+
+    def before(events):
+        for synapse_type, weight in events:
+            receive_synaptic_event_by_name(neuron, synapse_type, weight)
+
+    def after_table(events):
+        handlers = SYNAPSE_HANDLERS
+        for code, weight in events:
+            handlers[code](neuron, weight)
+
+    return {
+        "before (string chain)": events_per_second(before, named_events),
+        "after (dispatch table)": events_per_second(after_table, coded_events),
+    }
+
+
+if __name__ == "__main__":
+    num_events = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    results = run(num_events)
+    baseline = results["before (string chain)"]
+    for name, rate in results.items():
+        print(f"{name:24s} {rate / 1e6:6.2f} M events/s  ({rate / baseline:4.2f}x)")
@@ -0,0 +1,112 @@
+"""
+Compare two benchmark result files written by `benchmarks/suite.py`.
+
+Rows are matched by workload, parameters and engine. A metric regresses when
+it is worse than the baseline by more than the threshold (relative); a run
+whose decoded output was correct in the baseline but not anymore is always
+flagged.
+
+Exits with code 1 if any regression was found.
+
+Usage:
+    python benchmarks/compare.py baseline.json current.json [--threshold 0.1]
+"""
+
+import argparse
+import json
+import sys
+
+# Compared metrics, and whether higher values are better
+METRICS = {
+    "compile_time": False,
+    "build_time": False,
+    "wall_time": False,
+    "events_per_second": True,
+    "peak_memory": False,
+}
+
+
+def key_of(row: dict) -> tuple:
+    return row["workload"], json.dumps(row["params"], sort_keys=True), row["engine"]
+
+
+def relative_change(old: float, new: float, higher_is_better: bool) -> float:
+    """
+    Relative change of a metric, positive when it got worse.
+    """
+    change = (new - old) / old
+    return -change if higher_is_better else change
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list[dict]:
+    base_rows = {key_of(row): row for row in baseline["results"]}
+    findings = []
+    for row in current["results"]:
+        base = base_rows.get(key_of(row))
+        if base is None:
+            continue
+        for metric, higher_is_better in METRICS.items():
+            old, new = base.get(metric), row.get(metric)
+            if not old or new is None:
+                continue
+            change = relative_change(old, new, higher_is_better)
+            findings.append(
+                {
+                    "key": key_of(row),
+                    "metric": metric,
+                    "old": old,
+                    "new": new,
+                    "change": change,
+                    "regression": change > threshold,
+                }
+            )
+        if base.get("decoded") is not None and row.get("decoded") is None:
+            findings.append(
+                {
+                    "key": key_of(row),
+                    "metric": "decoded",
+                    "old": base["decoded"],
+                    "new": None,
+                    "change": None,
+                    "regression": True,
+                }
+            )
+    return findings
+
+
+def format_finding(finding: dict) -> str:
+    workload, params, engine = finding["key"]
+    label = f"{workload} {params} {engine}"
+    if finding["change"] is None:
+        return f"{label:44s} {finding['metric']:18s} no output anymore"
+    return (
+        f"{label:44s} {finding['metric']:18s} "
+        f"{finding['old']:12.4g} -> {finding['new']:12.4g} "
+        f"({finding['change'] * 100:+6.1f}% worse)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--threshold", type=float, default=0.1)
+    parser.add_argument("--all", action="store_true", help="print every metric")
+    args = parser.parse_args()
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+
+    findings = compare(baseline, current, args.threshold)
+    regressions = [f for f in findings if f["regression"]]
+    for finding in findings if args.all else regressions:
+        marker = "REGRESSION " if finding["regression"] else "           "
+        print(marker + format_finding(finding))
+
+    print(
+        f"{len(regressions)} regression(s) over {len(findings)} compared metrics "
+        f"(threshold {args.threshold * 100:.0f}%)"
+    )
+    sys.exit(1 if regressions else 0)
@@ -0,0 +1,169 @@
+"""
+Benchmark suite of the compiler and both simulators.
+
+Runs every workload of `workloads.py` on `Simulator` and `PredSimulator` and
+records, per run:
+- compile_time: time of `compile_computation` (compiled workloads only)
+- build_time: construction of the simulator and application of the inputs
+- wall_time: time of `simulate()`
+- events / events_per_second: synaptic events delivered by the simulator
+- peak_memory: peak traced allocation of build + simulation (bytes)
+- error: distance between the decoded output and the exact value
+
+Timings are the best of `--repeat` runs. Results are written as JSON and can
+be compared with `benchmarks/compare.py`.
+
+Usage:
+    python benchmarks/suite.py [--out results.json] [--quick] [--repeat 3]
+                               [--only memory,matmul] [--engines sim,pred]
+"""
+
+from axon_sdk import Simulator, PredSimulator
+
+from workloads import WORKLOADS, QUICK_PARAMS, Case
+
+import argparse
+import datetime
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+ENGINES = {"sim": Simulator, "pred": PredSimulator}
+
+# dt used for both simulators, as in the tests
+DT = 0.01
+
+
+def run_once(case: Case, engine: str) -> tuple[float, float, object]:
+    start = time.perf_counter()
+    sim = ENGINES[engine](case.net, case.encoder, dt=DT)
+    case.apply_inputs(sim)
+    built = time.perf_counter()
+    if engine == "sim":
+        sim.simulate(case.simulation_time)
+    else:
+        sim.simulate()
+    done = time.perf_counter()
+    return built - start, done - built, sim
+
+
+def delivered_events(sim) -> int:
+    if isinstance(sim, PredSimulator):
+        return sum(sim._processed_synapses_log.values())
+    return sum(sim.processed_syn_per_type.values())
+
+
+def peak_memory(case: Case, engine: str) -> int:
+    tracemalloc.start()
+    run_once(case, engine)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def run_workload(factory, params: dict, engine: str, repeat: int) -> dict:
+    build_times, wall_times = [], []
+    compile_time = None
+    for _ in range(repeat):
+        # Simulators mutate the neurons, so every run gets a fresh network
+        case = factory(**params)
+        compile_time = case.compile_time
+        build_time, wall_time, sim = run_once(case, engine)
+        build_times.append(build_time)
+        wall_times.append(wall_time)
+
+    try:
+        decoded = case.decode(sim)
+    except ValueError:
+        # Output neurons in an inconsistent state count as a wrong result
+        decoded = None
+    events = delivered_events(sim)
+    wall_time = min(wall_times)
+    return {
+        "neurons": len(case.net.neurons),
+        "synapses": sim.synapse_table.num_synapses,
+        "compile_time": compile_time,
+        "build_time": min(build_times),
+        "wall_time": wall_time,
+        "events": events,
+        "events_per_second": events / wall_time if wall_time > 0 else None,
+        "peak_memory": peak_memory(factory(**params), engine),
+        "expected": case.expected,
+        "decoded": decoded,
+        "error": abs(decoded - case.expected) if decoded is not None else None,
+    }
+
+
+def git_revision() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def run_suite(
+    only: list[str] | None = None,
+    engines: list[str] | None = None,
+    quick: bool = False,
+    repeat: int = 3,
+) -> dict:
+    results = []
+    for name, (factory, param_sets) in WORKLOADS.items():
+        if only and name not in only:
+            continue
+        if quick:
+            param_sets = QUICK_PARAMS.get(name, param_sets)
+        for params in param_sets:
+            for engine in engines or list(ENGINES):
+                row = {"workload": name, "params": params, "engine": engine}
+                row.update(run_workload(factory, params, engine, repeat))
+                results.append(row)
+                print(
+                    f"{name:18s} {json.dumps(params):14s} {engine:4s} "
+                    f"{row['wall_time'] * 1e3:9.2f} ms  "
+                    f"{row['neurons']:6d} neurons",
+                    file=sys.stderr,
+                )
+    return {
+        "meta": {
+            "date": datetime.datetime.now().isoformat(timespec="seconds"),
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": repeat,
+            "dt": DT,
+        },
+        "results": results,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--out", default=None, help="JSON output file (default: stdout)")
+    parser.add_argument("--quick", action="store_true")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--only", default=None, help="comma-separated workload names")
+    parser.add_argument("--engines", default=None, help="comma-separated: sim,pred")
+    args = parser.parse_args()
+
+    report = run_suite(
+        only=args.only.split(",") if args.only else None,
+        engines=args.engines.split(",") if args.engines else None,
+        quick=args.quick,
+        repeat=args.repeat,
+    )
+    text = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
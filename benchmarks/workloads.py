@@ -0,0 +1,212 @@
+"""
+Parameterized workloads of the benchmark suite.
+
+A workload builds a network ready to be simulated: its inputs, the duration
+needed by the time-stepped `Simulator` and the value it should decode to.
+Compiled workloads also report the time spent in `compile_computation`.
+"""
+
+from axon_sdk.primitives import DataEncoder, ExplicitNeuron, SpikingNetworkModule
+from axon_sdk.networks import (
+    MemoryNetwork,
+    MultiplierNetwork,
+    DivNetwork,
+    LinearCombinatorNetwork,
+)
+from axon_sdk.compilation import Scalar, compile_computation, ExecutionPlan
+from axon_sdk.compilation import generators
+from axon_sdk import decode_output
+
+import random
+import time
+
+from typing import Callable, Optional
+
+# Simulated time needed per level of a compiled graph (ms)
+TIME_PER_LEVEL = 300.0
+
+
+class Case:
+    """
+    A built workload.
+
+    Parameters:
+        net: network to simulate
+        encoder: encoder of the network
+        inputs: `(neuron, value)` pairs applied as intervals at t=0, and
+            `(neuron, None, t)` triples applied as single spikes at `t`
+        simulation_time: duration of a time-stepped run (ms)
+        decode: callable turning a finished simulator into the output value
+        expected: exact value of the computation
+        compile_time: time spent compiling the network, if it was compiled (s)
+    """
+
+    def __init__(
+        self,
+        net: SpikingNetworkModule,
+        encoder: DataEncoder,
+        inputs: list[tuple],
+        simulation_time: float,
+        decode: Callable,
+        expected: float,
+        compile_time: Optional[float] = None,
+    ):
+        self.net = net
+        self.encoder = encoder
+        self.inputs = inputs
+        self.simulation_time = simulation_time
+        self.decode = decode
+        self.expected = expected
+        self.compile_time = compile_time
+
+    def apply_inputs(self, sim) -> None:
+        for neuron, value, *t in self.inputs:
+            if value is None:
+                sim.apply_input_spike(neuron=neuron, t=t[0])
+            else:
+                sim.apply_input_value(value, neuron=neuron, t0=0)
+
+
+def decode_interval_of(neuron: ExplicitNeuron, sign: float = 1.0) -> Callable:
+    def decode(sim) -> Optional[float]:
+        spikes = sim.spike_sink.spikes_of(neuron.uid)
+        if len(spikes) != 2:
+            return None
+        return sign * sim.encoder.decode_interval(spikes[1] - spikes[0])
+
+    return decode
+
+
+def memory(value: float = 0.4) -> Case:
+    encoder = DataEncoder(Tmin=10.0, Tcod=100.0)
+    net = MemoryNetwork(encoder)
+    inputs = [(net.input, value), (net.recall, None, 200.0)]
+    return Case(net, encoder, inputs, 350.0, decode_interval_of(net.output), value)
+
+
+def multiplier(x1: float = 0.5, x2: float = 0.4) -> Case:
+    encoder = DataEncoder(Tmin=10.0, Tcod=100.0)
+    net = MultiplierNetwork(encoder)
+    inputs = [(net.input1, x1), (net.input2, x2)]
+    return Case(net, encoder, inputs, 400.0, decode_interval_of(net.output), x1 * x2)
+
+
+def divider(x1: float = 0.3, x2: float = 0.6) -> Case:
+    encoder = DataEncoder(Tmin=10.0, Tcod=100.0)
+    net = DivNetwork(encoder)
+    inputs = [(net.input1, x1), (net.input2, x2)]
+    return Case(net, encoder, inputs, 300.0, decode_interval_of(net.output), x1 / x2)
+
+
+def linear_combinator(n: int = 8, seed: int = 0) -> Case:
+    rng = random.Random(seed)
+    coeffs = [rng.uniform(-1, 1) for _ in range(n)]
+    values = [rng.uniform(0, 1) / n for _ in range(n)]
+    encoder = DataEncoder(Tmin=10.0, Tcod=100.0)
+    net = LinearCombinatorNetwork(encoder, N=n, coeff=coeffs)
+    inputs = [(net.input_plus[i], v) for i, v in enumerate(values)]
+    expected = sum(c * v for c, v in zip(coeffs, values))
+
+    decode_plus = decode_interval_of(net.output_plus)
+    decode_minus = decode_interval_of(net.output_minus, sign=-1.0)
+
+    def decode(sim) -> Optional[float]:
+        value = decode_plus(sim)
+        return value if value is not None else decode_minus(sim)
+
+    return Case(net, encoder, inputs, 400.0, decode, expected)
+
+
+def graph_depth(root: Scalar) -> int:
+    depth: dict[Scalar, int] = {}
+    stack = [root]
+    while stack:
+        node = stack[-1]
+        pending = [p for p in node.prev if p not in depth]
+        if pending:
+            stack.extend(pending)
+            continue
+        stack.pop()
+        depth[node] = 1 + max((depth[p] for p in node.prev), default=0)
+    return depth[root]
+
+
+def compiled(root: Scalar, expected: float, max_range: float = 100.0) -> Case:
+    start = time.perf_counter()
+    plan: ExecutionPlan = compile_computation(root, max_range=max_range)
+    compile_time = time.perf_counter() - start
+
+    inputs = [(t.trigger_neuron, t.normalized_value) for t in plan.input_triggers]
+    simulation_time = (graph_depth(root) + 1) * TIME_PER_LEVEL
+
+    def decode(sim) -> Optional[float]:
+        return decode_output(sim, plan.output_reader)
+
+    return Case(
+        plan.net,
+        DataEncoder(),
+        inputs,
+        simulation_time,
+        decode,
+        expected,
+        compile_time=compile_time,
+    )
+
+
+def matmul(n: int = 2, seed: int = 0) -> Case:
+    """
+    Sum of the entries of the product of two random NxN matrices.
+    """
+    return compiled(*generators.matmul(n, seed=seed))
+
+
+def dot_product(n: int = 16, seed: int = 0) -> Case:
+    return compiled(*generators.dot_product(n, seed=seed))
+
+
+def polynomial(degree: int = 8, seed: int = 0) -> Case:
+    return compiled(*generators.polynomial(degree, seed=seed))
+
+
+def fir_filter(taps: int = 8, outputs: int = 2, seed: int = 0) -> Case:
+    return compiled(*generators.fir_filter(taps, outputs=outputs, seed=seed))
+
+
+def random_expression(num_ops: int = 64, width: int = 8, seed: int = 0) -> Case:
+    return compiled(*generators.random_expression(num_ops, width=width, seed=seed))
+
+
+def add_chain(length: int = 16, seed: int = 0) -> Case:
+    """
+    Left-leaning chain of `length` additions, the deepest graph per neuron.
+    """
+    rng = random.Random(seed)
+    out = Scalar(rng.uniform(-10, 10))
+    for _ in range(length):
+        out = out + Scalar(rng.uniform(-10, 10))
+    return compiled(out, out.data)
+
+
+# Workload factories and the parameter sets the suite runs them with
+WORKLOADS: dict[str, tuple[Callable[..., Case], list[dict]]] = {
+    "memory": (memory, [{}]),
+    "multiplier": (multiplier, [{}]),
+    "divider": (divider, [{}]),
+    "linear_combinator": (linear_combinator, [{"n": 2}, {"n": 8}, {"n": 32}]),
+    "matmul": (matmul, [{"n": 2}, {"n": 4}]),
+    "dot_product": (dot_product, [{"n": 16}, {"n": 64}]),
+    "polynomial": (polynomial, [{"degree": 8}]),
+    "fir_filter": (fir_filter, [{"taps": 8, "outputs": 4}]),
+    "random_expression": (random_expression, [{"num_ops": 64}, {"num_ops": 256}]),
+    "add_chain": (add_chain, [{"length": 8}, {"length": 32}]),
+}
+
+# Smaller parameter sets for a quick run
+QUICK_PARAMS: dict[str, list[dict]] = {
+    "linear_combinator": [{"n": 4}],
+    "matmul": [{"n": 2}],
+    "dot_product": [{"n": 8}],
+    "fir_filter": [{"taps": 4, "outputs": 2}],
+    "random_expression": [{"num_ops": 32}],
+    "add_chain": [{"length": 8}],
+}
@@ -0,0 +1,118 @@
+import pytest
+
+from axon_sdk.networks import (
+    LinearCombinatorNetwork,
+    LogNetwork,
+    MemoryNetwork,
+    MultiplierNetwork,
+)
+from axon_sdk.compilation import compile_computation, Scalar
+from axon_sdk.primitives import DataEncoder, SpikingNetworkModule
+from axon_sdk.usagereport import (
+    CalibrationDB,
+    benchmark_net,
+    calibrate_module,
+    module_signature,
+    register_input_driver,
+)
+from axon_sdk.usagereport.calibration import INPUT_DRIVERS, standalone_copy
+
+
+@pytest.mark.parametrize(
+    "mod",
+    [
+        LogNetwork(DataEncoder()),
+        MemoryNetwork(DataEncoder()),
+        LinearCombinatorNetwork(DataEncoder(), 3, [0.5, -0.25, 0.25]),
+    ],
+)
+def test_calibrate_module(mod):
+    entry = calibrate_module(mod, samples=4)
+    assert entry["samples"] == 4
+    assert entry["neurons"] == len(mod.neurons)
+    assert set(entry["events"]) == {"V", "ge", "gf", "gate"}
+    for summary in [entry["spikes"], entry["latency"], *entry["events"].values()]:
+        assert summary["min"] <= summary["mean"] <= summary["max"]
+        assert summary["std"] >= 0
+    assert entry["spikes"]["mean"] > 0
+    assert entry["latency"]["mean"] > 0
+
+
+def test_standalone_copy_keeps_internal_synapses():
+    net = SpikingNetworkModule()
+    mul = MultiplierNetwork(DataEncoder())
+    net.add_subnetwork(mul)
+    outside = net.add_neuron(Vt=10.0, tm=100.0, tf=10.0)
+    net.connect_neurons(mul.output, outside, "V", 10.0, 1.0)
+
+    copy, copies = standalone_copy(mul)
+    assert len(copy.neurons) == len(mul.neurons)
+    internal = sum(len(n.out_synapses) for n in mul.neurons) - 1
+    assert sum(len(n.out_synapses) for n in copy.neurons) == internal
+    assert module_signature(copy).split("/")[1] == module_signature(mul).split("/")[1]
+
+
+def test_signature_depends_on_parameters():
+    enc = DataEncoder()
+    a = LinearCombinatorNetwork(enc, 2, [0.5, 0.5])
+    b = LinearCombinatorNetwork(enc, 2, [0.5, 0.5])
+    c = LinearCombinatorNetwork(enc, 2, [0.5, -0.5])
+    d = LinearCombinatorNetwork(enc, 3, [0.5, 0.5, 0.5])
+    assert module_signature(a) == module_signature(b)
+    assert len({module_signature(m) for m in (a, c, d)}) == 3
+
+
+def test_cache_round_trip(tmp_path):
+    path = str(tmp_path / "calibration.json")
+    mod = LogNetwork(DataEncoder())
+
+    db = CalibrationDB(path, samples=2)
+    assert mod not in db
+    entry = db.lookup(mod)
+    assert mod in db
+
+    reloaded = CalibrationDB(path, samples=2)
+    assert len(reloaded) == 1
+    assert reloaded.lookup(LogNetwork(DataEncoder())) == entry
+
+    # Other settings calibrate again, next to the existing entry
+    for other in (
+        CalibrationDB(path, samples=3),
+        CalibrationDB(path, samples=2, seed=1),
+        CalibrationDB(path, samples=2, dt=0.05),
+    ):
+        assert mod not in other
+        assert other.lookup(mod) != entry
+        assert len(other) == 2
+        assert mod in CalibrationDB(path, samples=2)
+
+
+def test_estimate_compiled_net(tmp_path, capsys):
+    x, y = Scalar(2.0), Scalar(3.0)
+    plan = compile_computation(-(x * y + x), max_range=100)
+    db = CalibrationDB(str(tmp_path / "calibration.json"), samples=2)
+
+    covered = db.estimate(plan.net)
+    assert [m.uid for m, _ in covered] == [m.uid for m in plan.net.subnetworks]
+    # Injectors, adder, multiplier and sign flipper
+    assert len(db) == 4
+
+    benchmark_net(plan.net, calibration=db)
+    assert "Total:" in capsys.readouterr().out
+
+
+def test_module_without_driver():
+    class Custom(SpikingNetworkModule):
+        pass
+
+    mod = Custom()
+    mod.add_neuron(Vt=10.0, tm=100.0, tf=10.0)
+    with pytest.raises(ValueError, match="No input driver"):
+        CalibrationDB().estimate(mod)
+
+    register_input_driver(Custom, lambda mod, rng: [(mod.neurons[0], None, 0.0)])
+    try:
+        entry = CalibrationDB().lookup(mod)
+        assert entry["spikes"]["mean"] == 1
+    finally:
+        del INPUT_DRIVERS[Custom]
@@ -0,0 +1,120 @@
+import pytest
+
+from axon_sdk import PredSimulator, Simulator, get_engine
+from axon_sdk.checkpoint import Checkpoint
+from axon_sdk.networks import MemoryNetwork, SignedConstantNetwork
+from axon_sdk.primitives import DataEncoder
+
+ENGINES = ["timestep", "timestep-exact", "timestep-numba", "predictive", "predictive-numba"]
+VALUE = 0.3
+PREFIX = 150
+END = 400
+
+
+def state_of(sim):
+    neurons = sim.synapse_table.neurons
+    return (
+        list(sim.spike_log.values()),
+        list(sim.voltage_log.values()),
+        sim.processed_syn_per_type,
+        [(n.V, n.ge, n.gf, n.gate, n._last_synapse_time, n.log_V) for n in neurons],
+    )
+
+
+def loaded_memory(engine):
+    # Shared prefix: a value loaded into a memory
+    encoder = DataEncoder()
+    net = MemoryNetwork(encoder)
+    net.output.enable_state_logs()
+    sim = get_engine(engine)(net, encoder, dt=0.01)
+    sim.apply_input_value(VALUE, net.input, t0=0)
+    sim.simulate(PREFIX)
+    return net, sim
+
+
+def full_run(engine, recall):
+    encoder = DataEncoder()
+    net = MemoryNetwork(encoder)
+    net.output.enable_state_logs()
+    sim = get_engine(engine)(net, encoder, dt=0.01)
+    sim.apply_input_value(VALUE, net.input, t0=0)
+    sim.apply_input_spike(net.recall, recall)
+    sim.simulate(END)
+    return sim
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_scenarios_from_a_checkpoint_match_full_runs(engine):
+    net, sim = loaded_memory(engine)
+    prefix = sim.checkpoint()
+    assert prefix.time == PREFIX
+
+    for recall in (160, 250, 300):
+        sim.restore(prefix)
+        assert sim.time == PREFIX
+        sim.apply_input_spike(net.recall, recall)
+        sim.simulate(END - PREFIX)
+        assert sim.time == pytest.approx(END)
+        assert state_of(sim) == state_of(full_run(engine, recall))
+        assert len(sim.spikes_of(net.output)) == 2
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_checkpoint_file_on_a_rebuilt_network(engine, tmp_path):
+    _, sim = loaded_memory(engine)
+    path = str(tmp_path / "prefix.npz")
+    sim.checkpoint().save(path)
+
+    # New neuron uids, same structure
+    encoder = DataEncoder()
+    net = MemoryNetwork(encoder)
+    restored = get_engine(engine)(net, encoder, dt=0.01)
+    restored.restore(Checkpoint.load(path))
+    restored.apply_input_spike(net.recall, 200)
+    restored.simulate(END - PREFIX)
+    assert state_of(restored) == state_of(full_run(engine, 200))
+
+
+def test_fork_is_independent():
+    encoder = DataEncoder()
+    net = SignedConstantNetwork(encoder, -0.4)
+    sim = PredSimulator(net, encoder)
+    sim.simulate()
+    fork, copies = sim.fork()
+    assert fork.time == sim.time
+
+    fork.apply_input_spike(copies[net.recall], fork.time + 10)
+    fork.simulate()
+    assert len(fork.spikes_of(copies[net.output_minus])) == 2
+    assert sim.spikes_of(net.output_minus) == []
+
+    sim.apply_input_spike(net.recall, sim.time + 10)
+    sim.simulate()
+    assert list(sim.spike_log.values()) == list(fork.spike_log.values())
+
+
+def test_continued_runs():
+    encoder = DataEncoder()
+    net = MemoryNetwork(encoder)
+    sim = Simulator(net, encoder, dt=0.01)
+    sim.apply_input_value(VALUE, net.input, t0=0)
+    sim.simulate(100)
+    sim.simulate(100)
+    assert len(sim.timesteps) == 20000
+    assert sim.timesteps[-1] == sim.time == pytest.approx(200)
+    with pytest.raises(ValueError, match="before the simulated time"):
+        sim.apply_input_spike(net.recall, 150)
+
+
+def test_restore_checks_compatibility():
+    encoder = DataEncoder()
+    net = MemoryNetwork(encoder)
+    checkpoint = Simulator(net, encoder, dt=0.01).checkpoint()
+
+    with pytest.raises(ValueError, match="not of a PredSimulator"):
+        PredSimulator(net, encoder, dt=0.01).restore(checkpoint)
+    with pytest.raises(ValueError, match="dt=0.01"):
+        Simulator(net, encoder, dt=0.1).restore(checkpoint)
+    other = SignedConstantNetwork(encoder, 0.5)
+    with pytest.raises(ValueError, match="Checkpoint of a network with"):
+        Simulator(other, encoder, dt=0.01).restore(checkpoint)
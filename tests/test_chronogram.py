@@ -0,0 +1,113 @@
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np
+import pytest
+
+from axon_sdk import Simulator
+from axon_sdk.compilation import compile_computation, Scalar
+from axon_sdk.networks import MultiplierNetwork
+from axon_sdk.primitives import DataEncoder
+from axon_sdk.visualization.chronogram import (
+    build_array,
+    decimate_step,
+    module_groups,
+    plot_chronogram,
+    plot_raster,
+    plot_run,
+    step_hold,
+)
+
+
+def reference_build_array(length, entry_points):
+    # The original pure Python expansion
+    entry_points_dict = {t[1]: t[0] for t in sorted(entry_points, key=lambda p: p[1])}
+    result, last = [0.0] * length, 0.0
+    for i in range(length):
+        if (val := entry_points_dict.get(i, None)) is not None:
+            last = val
+        result[i] = last
+    return result
+
+
+def test_build_array():
+    assert build_array(10, [(4.0, 1), (0.0, 3), (5.0, 6)]) == [
+        0.0, 4.0, 4.0, 0.0, 0.0, 0.0, 5.0, 5.0, 5.0, 5.0
+    ]
+    assert build_array(3, []) == [0.0, 0.0, 0.0]
+
+    rng = np.random.default_rng(0)
+    values, indices = rng.normal(size=50), rng.integers(0, 200, 50)
+    entries = [(float(v), int(i)) for v, i in zip(values, indices)]
+    assert build_array(200, entries) == reference_build_array(200, entries)
+
+
+@pytest.mark.parametrize("num_bins", [1, 7, 64, 1000])
+def test_decimate_step_matches_dense_signal(num_bins):
+    rng = np.random.default_rng(1)
+    indices = np.sort(rng.choice(1000, size=80, replace=False))
+    values = rng.normal(size=80)
+    dense = step_hold(values, indices, 1000)
+
+    starts, low, high = decimate_step(values, indices, 1000, num_bins)
+    assert starts[0] == 0 and len(starts) == min(num_bins, 1000)
+    ends = np.append(starts[1:], 1000)
+    for start, end, lo, hi in zip(starts, ends, low, high):
+        assert lo == dense[start:end].min()
+        assert hi == dense[start:end].max()
+
+
+def multiplier_run():
+    encoder = DataEncoder()
+    net = MultiplierNetwork(encoder)
+    sim = Simulator(net, encoder, dt=0.01)
+    sim.apply_input_value(0.5, net.input1, t0=0)
+    sim.apply_input_value(0.4, net.input2, t0=0)
+    sim.simulate(simulation_time=300)
+    return sim
+
+
+def test_plot_chronogram_subsets_and_groups():
+    sim = multiplier_run()
+    fig = plot_chronogram(sim.timesteps, sim.voltage_log, sim.spike_log, show=False)
+    assert len(fig.axes) == len(sim.net.neurons)
+
+    subset = [sim.net.input1.uid, sim.net.output.uid]
+    fig = plot_chronogram(
+        sim.timesteps, sim.voltage_log, sim.spike_log, neurons=subset, show=False
+    )
+    assert [ax.get_ylabel() for ax in fig.axes] == subset
+    # Decimated envelope: two points per bin
+    line = fig.axes[0].get_lines()[-1]
+    assert len(line.get_xdata()) <= 2 * 2000
+
+    groups = module_groups(sim.net, depth=None)
+    fig = plot_chronogram(
+        sim.timesteps, sim.voltage_log, sim.spike_log, groups=groups, show=False
+    )
+    assert len(fig.axes) == len(groups)
+
+
+def test_plot_raster_and_large_runs():
+    x, y = Scalar(2.0), Scalar(3.0)
+    plan = compile_computation(Scalar(0.5) * x + Scalar(0.5) * y, max_range=100)
+    sim = Simulator(plan.net, DataEncoder(), dt=0.01)
+    for trigger in plan.input_triggers:
+        sim.apply_input_value(trigger.normalized_value, trigger.trigger_neuron)
+    sim.simulate(simulation_time=600)
+
+    fig = plot_raster(sim.spike_log, show=False)
+    offsets = fig.axes[0].collections[0].get_offsets()
+    assert len(offsets) == sum(len(t) for t in sim.spike_log.values())
+
+    groups = module_groups(plan.net)
+    fig = plot_raster(sim.spike_log, groups=groups, show=False)
+    assert [t.get_text() for t in fig.axes[0].get_yticklabels()] == list(groups)
+
+    # Too many neurons for one row each: grouped by module
+    assert len(plan.net.neurons) > 64
+    fig = plot_run(plan.net, sim.timesteps, sim.voltage_log, sim.spike_log, show=False)
+    assert len(fig.axes) == len(groups)
+    with pytest.raises(ValueError, match="too many"):
+        plot_chronogram(sim.timesteps, sim.voltage_log, sim.spike_log, show=False)
@@ -0,0 +1,82 @@
+import pytest
+
+from axon_sdk import PredSimulator, Simulator
+from axon_sdk.compilation import compile_computation, Scalar
+from axon_sdk.primitives import DataEncoder, SpikingNetworkModule
+from axon_sdk.usagereport import critical_path, report_critical_path
+
+
+def chain_net():
+    """
+    a -> b -> c in two modules, with an inhibitory synapse d -| c that
+    arrives with the last excitatory event but can't cause the spike of c.
+    """
+    net = SpikingNetworkModule()
+    first = SpikingNetworkModule(module_name="first")
+    second = SpikingNetworkModule(module_name="second")
+    net.add_subnetwork(first)
+    net.add_subnetwork(second)
+    a = first.add_neuron(Vt=10.0, tm=100.0, tf=10.0)
+    b = first.add_neuron(Vt=10.0, tm=100.0, tf=10.0)
+    c = second.add_neuron(Vt=10.0, tm=100.0, tf=10.0)
+    d = second.add_neuron(Vt=10.0, tm=100.0, tf=10.0)
+    net.connect_neurons(a, b, "V", 10.0, 1.0)
+    net.connect_neurons(b, c, "V", 11.0, 2.0)
+    net.connect_neurons(d, c, "V", -1.0, 1.0)
+    return net, first, second, a, b, c, d
+
+
+def test_chain():
+    net, first, second, a, b, c, d = chain_net()
+    sim = PredSimulator(net, DataEncoder())
+    sim.apply_input_spike(a, t=5.0)
+    sim.apply_input_spike(d, t=7.0)
+    sim.simulate()
+
+    path = critical_path(sim, c, spike=0)
+    assert [s.neuron_uid for s in path.steps] == [a.uid, b.uid, c.uid]
+    assert [s.t for s in path.steps] == pytest.approx([5.0, 6.0, 8.0])
+    assert path.steps[0].synapse_type is None
+    assert path.steps[2].arrival == pytest.approx(8.0)
+    assert path.steps[2].synapse_type == "V"
+
+    assert path.start == 5.0
+    assert path.latency == pytest.approx(3.0)
+    assert path.modules == [first.uid, second.uid]
+    assert path.residence() == pytest.approx({first.uid: 1.0, second.uid: 2.0})
+
+    with pytest.raises(ValueError, match="no spike number 1"):
+        critical_path(sim, c, spike=1)
+
+
+@pytest.mark.parametrize("engine", [PredSimulator, Simulator])
+def test_compiled_plan(engine, capsys):
+    x, y, z = Scalar(2.0), Scalar(3.0), Scalar(1.5)
+    plan = compile_computation(-(x * y + z), max_range=100)
+    sim = engine(plan.net, DataEncoder(), dt=0.01)
+    for trigger in plan.input_triggers:
+        sim.apply_input_value(trigger.normalized_value, trigger.trigger_neuron)
+    if engine is Simulator:
+        sim.simulate(simulation_time=1500)
+    else:
+        sim.simulate()
+
+    path = report_critical_path(sim, plan.output_reader)
+    assert "CRITICAL PATH REPORT" in capsys.readouterr().out
+
+    output_spikes = sim.spike_log[plan.output_reader.read_neuron_minus.uid]
+    assert path.end == output_spikes[1]
+    assert path.start == min(t[0] for t in sim.spike_log.values() if t)
+    assert path.input_wait + sum(path.residence().values()) == pytest.approx(
+        path.latency
+    )
+
+    # Through the compiled operations: multiply, add, then negate
+    kinds = [uid.split("_", 1)[1] for uid in path.modules]
+    assert kinds == ["injector_mod", "mul_norm_mod", "adder_mod", "inv_mod"]
+    times = [step.t for step in path.steps]
+    assert times == sorted(times)
+
+    innermost = critical_path(sim, plan.output_reader, depth=None)
+    assert len(innermost.modules) > len(path.modules)
+    assert innermost.latency == path.latency
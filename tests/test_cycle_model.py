@@ -0,0 +1,88 @@
+import pytest
+
+from axon_sdk.networks import MultiplierNetwork
+from axon_sdk.primitives import DataEncoder
+from axon_sdk import PredSimulator
+from axon_sdk.instrumentation import EventTrace
+from axon_sdk.usagereport import HardwareConfig, simulate_cycles
+from axon_sdk.usagereport.power_metrics import estimate_performance
+
+
+def traced_multiplier():
+    encoder = DataEncoder(Tmin=10.0, Tcod=100.0)
+    net = MultiplierNetwork(encoder)
+    sim = PredSimulator(net, encoder, instrument=True)
+    sim.apply_input_value(0.5, neuron=net.input1, t0=0)
+    sim.apply_input_value(0.4, neuron=net.input2, t0=0)
+    sim.simulate()
+    return sim
+
+
+def make_trace(events):
+    trace = EventTrace()
+    for t, neuron, type_code in events:
+        trace.record(t, neuron, type_code)
+    return trace
+
+
+def test_single_core_matches_aggregate_formula():
+    sim = traced_multiplier()
+    counts = sim._processed_synapses_log
+    assert len(sim.stats.trace) == sum(counts.values())
+
+    perf = estimate_performance(
+        counts["V"], counts["ge"], counts["gf"], counts["gate"], 5000, 200
+    )
+    result = simulate_cycles(sim.stats.trace, HardwareConfig(clock_speed_mhz=200))
+    assert result.total_cycles == perf["total_cycles"]
+    assert result.latency_seconds == pytest.approx(perf["time_seconds"])
+
+
+def test_timestamps_bound_parallelism():
+    # Two V events at t=1 on different neurons, one ge event at t=2
+    trace = make_trace([(1.0, 0, 0), (1.0, 1, 0), (2.0, 0, 1)])
+    config = HardwareConfig(num_cores=2, predictive_search_timesteps=8)
+    result = simulate_cycles(trace, config)
+
+    per_update = config.cycles_per_update
+    assert list(result.slot_cycles) == [per_update, 3 * per_update]
+    assert result.total_cycles == 4 * per_update + config.pipeline_cycles
+    assert result.max_parallelism == 2
+    assert list(result.core_busy_cycles) == [4 * per_update, per_update]
+
+
+def test_events_of_a_neuron_stay_on_one_core():
+    trace = make_trace([(1.0, 3, 0), (1.0, 3, 0), (1.0, 4, 0)])
+    for scheduler in ["static", "dynamic"]:
+        result = simulate_cycles(trace, HardwareConfig(num_cores=4, scheduler=scheduler))
+        assert result.slot_cycles[0] == 2 * result.config.cycles_per_update
+
+
+@pytest.mark.parametrize("scheduler", ["static", "dynamic"])
+def test_more_cores(scheduler):
+    trace = traced_multiplier().stats.trace
+    serial = simulate_cycles(trace, HardwareConfig(num_cores=1))
+    for cores in [2, 4, 16]:
+        result = simulate_cycles(trace, HardwareConfig(num_cores=cores, scheduler=scheduler))
+        assert result.total_cycles <= serial.total_cycles
+        assert result.core_busy_cycles.sum() == serial.core_busy_cycles.sum()
+        assert 0 < result.utilization <= 1
+        assert result.stall_cycles >= 0
+
+
+def test_shared_sram_stalls():
+    trace = traced_multiplier().stats.trace
+    private = simulate_cycles(trace, HardwareConfig(num_cores=16, scheduler="dynamic"))
+    shared = simulate_cycles(
+        trace, HardwareConfig(num_cores=16, scheduler="dynamic", sram_ports=1)
+    )
+    assert private.memory_stall_cycles == 0
+    assert shared.memory_stall_cycles > 0
+    assert shared.total_cycles == private.total_cycles + shared.memory_stall_cycles
+
+
+def test_invalid_config():
+    with pytest.raises(ValueError):
+        HardwareConfig(num_cores=0)
+    with pytest.raises(ValueError):
+        HardwareConfig(scheduler="fifo")
@@ -0,0 +1,90 @@
+import pytest
+
+from axon_sdk import Simulator, PredSimulator
+from axon_sdk.compilation import compile_computation, generators, Scalar
+from axon_sdk.dt_selection import DtCache, output_neurons, select_dt
+from axon_sdk.networks import MultiplierNetwork, SignedMultiplierNetwork
+from axon_sdk.primitives import DataEncoder, SpikingNetworkModule
+
+
+def test_output_neurons():
+    encoder = DataEncoder()
+    net = MultiplierNetwork(encoder)
+    assert output_neurons(net) == [net.output]
+    signed = SignedMultiplierNetwork(encoder)
+    assert set(output_neurons(signed)) == {signed.output_plus, signed.output_minus}
+
+
+@pytest.mark.parametrize("engine", [Simulator, PredSimulator])
+def test_select_dt_is_the_coarsest_accurate_step(engine):
+    net = MultiplierNetwork(DataEncoder(Tmin=10.0, Tcod=100.0))
+    selection = select_dt(net, tolerance=2e-3, engine=engine, samples=3)
+
+    assert selection.dt is not None
+    assert selection.max_error <= 2e-3
+    # Every coarser candidate was tried and rejected
+    assert list(selection.errors) == sorted(selection.errors, reverse=True)
+    assert all(error > 2e-3 for dt, error in selection.errors.items() if dt > selection.dt)
+
+
+def test_exact_integration_allows_coarse_steps():
+    plan = compile_computation(
+        Scalar(2.0) * Scalar(3.0) + Scalar(0.5) * Scalar(7.0), max_range=100
+    )
+    selection = select_dt(plan, tolerance=1e-2, integration="exact", samples=3)
+    assert selection.dt == 1.0
+    assert list(selection.errors) == [1.0]
+
+
+def test_reference_is_exact():
+    # A PredSimulator reference is off by about 1e-2 on this plan
+    root, expected = generators.polynomial(degree=2, seed=0)
+    plan = compile_computation(root, max_range=100)
+    selection = select_dt(plan, tolerance=1e-3, integration="exact", samples=1)
+    assert selection.dt == 1.0
+    assert selection.max_error < 1e-6
+
+
+def test_unreachable_tolerance():
+    net = MultiplierNetwork(DataEncoder(Tmin=10.0, Tcod=100.0))
+    selection = select_dt(net, tolerance=1e-9, candidates=(1.0, 0.5), samples=2)
+    assert selection.dt is None and selection.max_error is None
+    assert set(selection.errors) == {1.0, 0.5}
+
+
+def test_cache(tmp_path):
+    path = str(tmp_path / "dt.json")
+    cache = DtCache(path)
+    net = MultiplierNetwork(DataEncoder(Tmin=10.0, Tcod=100.0))
+    selection = select_dt(net, tolerance=2e-3, samples=2, cache=cache)
+    assert len(cache) == 1
+
+    # Same structure, new instance: found in the saved cache
+    reloaded = DtCache(path)
+    other = MultiplierNetwork(DataEncoder(Tmin=10.0, Tcod=100.0))
+    cached = select_dt(other, tolerance=2e-3, samples=2, cache=reloaded)
+    assert cached.as_dict() == selection.as_dict()
+    assert len(reloaded) == 1
+
+    # Other settings, outputs or encoders are searched again
+    select_dt(net, tolerance=2e-3, samples=2, engine=PredSimulator, cache=reloaded)
+    assert len(reloaded) == 2
+    select_dt(net, tolerance=2e-3, samples=2, outputs=[net.input1], cache=reloaded)
+    assert len(reloaded) == 3
+    select_dt(
+        net,
+        tolerance=2e-3,
+        samples=2,
+        encoder=DataEncoder(Tmin=10.0, Tcod=50.0),
+        cache=reloaded,
+    )
+    assert len(reloaded) == 4
+
+
+def test_unsupported_targets():
+    with pytest.raises(ValueError, match="no output neurons"):
+        select_dt(SpikingNetworkModule("empty"))
+    bare = SpikingNetworkModule("bare")
+    neuron = bare.add_neuron(Vt=10.0, tm=100.0, tf=20.0)
+    with pytest.raises(ValueError, match="No input driver"):
+        select_dt(bare, outputs=[neuron])
@@ -0,0 +1,122 @@
+import pytest
+
+from axon_sdk import (
+    PredSimulator,
+    SimulationEngine,
+    Simulator,
+    count_spikes,
+    decode_output,
+    get_engine,
+)
+from axon_sdk.compilation import compile_computation, Scalar
+from axon_sdk.engine import ENGINES
+from axon_sdk.networks import MultiplierNetwork
+from axon_sdk.primitives import DataEncoder
+from axon_sdk.usagereport.usagereport import energy_and_latency_for_simulation
+
+
+def plan():
+    return compile_computation(Scalar(0.5) * Scalar(0.6), max_range=1)
+
+
+def test_registry():
+    assert {"timestep", "timestep-exact", "predictive"} <= set(ENGINES)
+    assert get_engine("timestep").cls is Simulator
+    assert get_engine("predictive").cls is PredSimulator
+    assert get_engine("timestep-exact").options == {"integration": "exact"}
+    with pytest.raises(ValueError, match="Unknown engine 'gpu'"):
+        get_engine("gpu")
+
+
+def test_engines_implement_the_interface():
+    class Incomplete(SimulationEngine):
+        def __init__(self, net, encoder, dt=0.01):
+            super().__init__()
+
+        def simulate(self, simulation_time=None):
+            pass
+
+    with pytest.raises(TypeError, match="abstract methods"):
+        Incomplete(MultiplierNetwork(DataEncoder()), DataEncoder())
+
+
+@pytest.mark.parametrize("name", ["timestep", "timestep-exact", "predictive"])
+def test_plan_through_any_engine(name):
+    compiled = plan()
+    sim = get_engine(name).init_with_plan(compiled, DataEncoder(), dt=0.01)
+    assert isinstance(sim, SimulationEngine)
+    assert not sim.finished
+    with pytest.raises(ValueError, match="not executed"):
+        energy_and_latency_for_simulation(sim)
+
+    sim.simulate(300)
+    assert sim.finished
+    assert decode_output(sim, compiled.output_reader) == pytest.approx(0.3, abs=0.01)
+    assert count_spikes(sim) == sum(len(t) for t in sim.spike_log.values())
+    counts = sim.processed_syn_per_type
+    assert sum(counts.values()) > 0
+    assert energy_and_latency_for_simulation(sim).v_updates == counts["V"]
+
+
+def test_time_stepped_run_needs_a_duration():
+    encoder = DataEncoder()
+    sim = Simulator(MultiplierNetwork(encoder), encoder)
+    with pytest.raises(ValueError, match="simulation_time"):
+        sim.simulate()
+
+
+@pytest.mark.parametrize("engine", [Simulator, PredSimulator])
+def test_input_offsets(engine):
+    encoder = DataEncoder(Tmin=10.0, Tcod=100.0)
+    net = MultiplierNetwork(encoder)
+    sim = engine(net, encoder, dt=0.01)
+    sim.apply_input_value(0.5, neuron=net.input1, t0=20.0)
+    sim.simulate(100)
+    assert sim.spikes_of(net.input1) == pytest.approx([20.0, 80.0])
+
+
+def test_predictive_run_up_to_a_time():
+    encoder = DataEncoder(Tmin=10.0, Tcod=100.0)
+
+    def run(simulation_time):
+        net = MultiplierNetwork(encoder)
+        sim = PredSimulator(net, encoder)
+        sim.apply_input_value(0.5, neuron=net.input1, t0=0)
+        sim.apply_input_value(0.5, neuron=net.input2, t0=0)
+        sim.simulate(simulation_time)
+        return sim
+
+    full = run(None)
+    spike_times = sorted(t for times in full.spike_log.values() for t in times)
+    end = spike_times[len(spike_times) // 2]
+    bounded = run(end)
+    assert sorted(t for times in bounded.spike_log.values() for t in times) == [
+        t for t in spike_times if t <= end
+    ]
+
+
+@pytest.mark.parametrize("name", ["timestep", "timestep-exact", "predictive"])
+def test_reset_runs_again_without_rebuilding(name):
+    encoder = DataEncoder(Tmin=10.0, Tcod=100.0)
+    net = MultiplierNetwork(encoder)
+    sim = get_engine(name)(net, encoder, dt=0.01, instrument=True)
+    table = sim.synapse_table
+
+    def run(val1, val2):
+        sim.apply_input_value(val1, neuron=net.input1, t0=0)
+        sim.apply_input_value(val2, neuron=net.input2, t0=0)
+        sim.simulate(400)
+        return (
+            list(sim.spike_log.values()),
+            list(sim.voltage_log.values()),
+            sim.processed_syn_per_type,
+            sim.stats.events_processed,
+        )
+
+    first = run(0.5, 0.6)
+    sim.reset()
+    assert run(0.9, 0.2) != first
+    sim.reset()
+    assert not sim.finished and sim.time == 0.0 and count_spikes(sim) == 0
+    assert run(0.5, 0.6) == first
+    assert sim.synapse_table is table
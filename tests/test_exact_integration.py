@@ -0,0 +1,82 @@
+import math
+
+import pytest
+
+from axon_sdk import Simulator, decode_output
+from axon_sdk.compilation import compile_computation, Scalar
+from axon_sdk.networks import MultiplierNetwork
+from axon_sdk.primitives import DataEncoder, ExplicitNeuron
+
+
+def test_update_exact_matches_fine_euler():
+    exact = ExplicitNeuron(Vt=10.0, tm=100.0, tf=20.0)
+    euler = ExplicitNeuron(Vt=10.0, tm=100.0, tf=20.0)
+    for neuron in (exact, euler):
+        neuron.ge, neuron.gf, neuron.gate = 0.5, 40.0, 1
+
+    assert exact.update_exact(10.0) is None
+    for _ in range(100000):
+        euler.update_and_spike(1e-4)
+    assert exact.V == pytest.approx(euler.V, rel=1e-4)
+    assert exact.gf == pytest.approx(40.0 * math.exp(-0.5))
+    assert exact.gf == pytest.approx(euler.gf, rel=1e-4)
+
+
+def test_update_exact_interpolates_the_crossing():
+    neuron = ExplicitNeuron(Vt=10.0, tm=100.0, tf=20.0)
+    neuron.ge = 100.0
+    # V = t: crosses at t = 10
+    assert neuron.update_exact(4.0) is None
+    assert neuron.update_exact(8.0) == pytest.approx(6.0, abs=1e-9)
+    assert neuron.V == pytest.approx(10.0)
+
+    neuron.reset()
+    neuron.V = 10.0
+    assert neuron.update_exact(1.0) == 0.0
+
+
+@pytest.mark.parametrize("dt", [0.1, 0.5, 1.0])
+# An input of 1.0 makes an accumulator reach its threshold exactly when it is
+# stopped: its outcome is decided by rounding, as with PredSimulator
+@pytest.mark.parametrize("val1, val2", [(0.5, 0.5), (0.1, 0.99), (0.3, 0.9), (0.12, 0.33)])
+def test_mul_coarse_steps(dt, val1, val2):
+    encoder = DataEncoder(Tmin=10.0, Tcod=100.0)
+    net = MultiplierNetwork(encoder)
+    sim = Simulator(net, encoder, dt=dt, integration="exact")
+    sim.apply_input_value(val1, neuron=net.input1, t0=0)
+    sim.apply_input_value(val2, neuron=net.input2, t0=0)
+    sim.simulate(400)
+
+    spikes = sim.spike_log[net.output.uid]
+    assert len(spikes) == 2
+    decoded_value = encoder.decode_interval(spikes[1] - spikes[0])
+    assert decoded_value == pytest.approx(val1 * val2, abs=1e-6)
+
+
+def test_compiled_expression_coarse_steps():
+    def run(instrument):
+        plan = compile_computation(
+            Scalar(2.0) * Scalar(3.0) + Scalar(0.5) * Scalar(7.0), max_range=100
+        )
+        sim = Simulator.init_with_plan(
+            plan, DataEncoder(), dt=1.0, instrument=instrument, integration="exact"
+        )
+        sim.simulate(600)
+        return sim, decode_output(sim, plan.output_reader)
+
+    sim, value = run(instrument=False)
+    assert value == pytest.approx(9.5, abs=1e-6)
+
+    instrumented, instrumented_value = run(instrument=True)
+    assert instrumented_value == value
+    stats = instrumented.stats
+    assert stats.events_processed == sum(instrumented._processed_counts)
+    assert len(stats.trace) == stats.events_processed
+    assert stats.spikes_emitted > 0
+    assert len(stats.active_set_sizes) == len(instrumented.timesteps)
+
+
+def test_unknown_integration():
+    encoder = DataEncoder()
+    with pytest.raises(ValueError, match="Unknown integration"):
+        Simulator(MultiplierNetwork(encoder), encoder, integration="rk4")
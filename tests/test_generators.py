@@ -0,0 +1,70 @@
+import pytest
+
+from axon_sdk.compilation import Scalar, compile_computation, generators
+from axon_sdk.compilation.scalar import trace
+from axon_sdk.primitives import DataEncoder
+from axon_sdk import PredSimulator, decode_output
+
+GENERATOR_CASES = [
+    (generators.dot_product, {"n": 16}),
+    (generators.matmul, {"n": 3}),
+    (generators.polynomial, {"degree": 6}),
+    (generators.fir_filter, {"taps": 8, "outputs": 3}),
+    (generators.random_expression, {"num_ops": 200, "width": 4}),
+]
+
+
+@pytest.mark.parametrize("generator, kwargs", GENERATOR_CASES)
+def test_expected_value(generator, kwargs):
+    root, expected = generator(**kwargs)
+    assert root.data == pytest.approx(expected, rel=1e-12)
+    generators.check_range(root)
+
+
+@pytest.mark.parametrize("generator, kwargs", GENERATOR_CASES)
+def test_deterministic_per_seed(generator, kwargs):
+    assert generator(**kwargs, seed=3)[1] == generator(**kwargs, seed=3)[1]
+    assert generator(**kwargs, seed=3)[1] != generator(**kwargs, seed=4)[1]
+
+
+def test_sizes():
+    nodes, _ = trace(generators.matmul(3)[0])
+    products = [n for n in nodes if str(n.op) == "*"]
+    loads = [n for n in nodes if str(n.op) == "load"]
+    assert len(products) == 27
+    assert len(loads) == 18
+
+    nodes, _ = trace(generators.fir_filter(taps=5, outputs=4)[0])
+    assert len([n for n in nodes if str(n.op) == "load"]) == 5 + 8
+
+
+def test_check_range():
+    with pytest.raises(ValueError):
+        generators.check_range(Scalar(60.0) + Scalar(50.0))
+    with pytest.raises(ValueError):
+        generators.check_range(Scalar(1.0) + Scalar(-1.0))
+    with pytest.raises(ValueError):
+        generators.check_range(Scalar(0.5) * Scalar(0.5))
+    generators.check_range(Scalar(2.0) * Scalar(0.5))
+
+
+def test_trace_deep_graph():
+    root = Scalar(1.0)
+    for _ in range(5000):
+        root = root + Scalar(1.0)
+    nodes, edges = trace(root)
+    assert len(nodes) == 10001
+    assert len(edges) == 10000
+
+
+def test_compiled_polynomial():
+    root, expected = generators.polynomial(degree=3, seed=1)
+    plan = compile_computation(root, max_range=100)
+
+    sim = PredSimulator(plan.net, DataEncoder(), dt=0.01)
+    for trigger in plan.input_triggers:
+        sim.apply_input_value(trigger.normalized_value, trigger.trigger_neuron)
+    sim.simulate()
+
+    # Compiled multiplications are accurate to about max_range / 100
+    assert decode_output(sim, plan.output_reader) == pytest.approx(expected, abs=3.0)
@@ -0,0 +1,13 @@
+import subprocess
+import sys
+
+
+def test_import_does_not_load_plotting():
+    probe = (
+        "import sys, axon_sdk; "
+        "print('matplotlib' in sys.modules, 'axon_sdk.visualization.chronogram' in sys.modules)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", probe], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.split() == ["False", "False"]
@@ -0,0 +1,50 @@
+import pytest
+
+from axon_sdk.networks import MultiplierNetwork
+from axon_sdk.primitives import DataEncoder
+from axon_sdk import Simulator, PredSimulator
+from axon_sdk.instrumentation import RunStats
+
+
+def run(sim_cls, instrument):
+    encoder = DataEncoder(Tmin=10.0, Tcod=100.0)
+    net = MultiplierNetwork(encoder, module_name="mul")
+    sim = sim_cls(net, encoder, dt=0.01, instrument=instrument)
+    sim.apply_input_value(0.5, neuron=net.input1, t0=0)
+    sim.apply_input_value(0.4, neuron=net.input2, t0=0)
+    if sim_cls is Simulator:
+        sim.simulate(400)
+    else:
+        sim.simulate()
+    return net, sim
+
+
+@pytest.mark.parametrize("sim_cls", [Simulator, PredSimulator])
+def test_disabled_by_default(sim_cls):
+    _, sim = run(sim_cls, instrument=False)
+    assert sim.stats is None
+
+
+@pytest.mark.parametrize("sim_cls", [Simulator, PredSimulator])
+def test_instrumented_run(sim_cls):
+    net, plain = run(sim_cls, instrument=False)
+    net, sim = run(sim_cls, instrument=True)
+
+    # Instrumentation must not change the simulation
+    assert list(sim.spike_log.values()) == list(plain.spike_log.values())
+
+    stats = sim.stats
+    assert isinstance(stats, RunStats)
+    assert stats.events_processed == sum(stats.events_per_neuron) > 0
+    assert stats.spikes_emitted > 0
+    assert stats.queue_high_water > 0
+    assert stats.steps > 0
+    assert stats.wall_time >= sum(stats.phase_time.values()) * 0.5
+
+    report = stats.as_dict()
+    assert report["events_per_module"] == {net.uid: stats.events_processed}
+    assert set(report["phase_time"]) == {"pop", "apply", "update", "propagate"}
+    if sim_cls is PredSimulator:
+        assert report["prediction_calls"] == stats.events_processed
+    else:
+        assert report["prediction_calls"] == 0
@@ -0,0 +1,82 @@
+import math
+
+import numpy as np
+import pytest
+
+pytest.importorskip("jax")
+
+from axon_sdk import Simulator, decode_output
+from axon_sdk.backends.jax_backend import BatchSimulator, _simulate_batch
+from axon_sdk.compilation import compile_computation, Scalar
+from axon_sdk.networks import MultiplierNetwork
+from axon_sdk.primitives import DataEncoder
+
+VALUES = [(0.5, 0.5), (0.1, 0.99), (0.3, 0.9), (0.12, 0.33)]
+
+
+def test_batch_matches_simulator():
+    encoder = DataEncoder(Tmin=10.0, Tcod=100.0)
+    net = MultiplierNetwork(encoder)
+    batch = BatchSimulator(net, encoder, [net.input1, net.input2], dt=0.01)
+    result = batch.simulate(VALUES, 400)
+    assert len(result) == len(VALUES)
+
+    for run, (val1, val2) in enumerate(VALUES):
+        ref_net = MultiplierNetwork(encoder)
+        sim = Simulator(ref_net, encoder, dt=0.01)
+        sim.apply_input_value(val1, neuron=ref_net.input1, t0=0)
+        sim.apply_input_value(val2, neuron=ref_net.input2, t0=0)
+        sim.simulate(400)
+
+        for ref_neuron, neuron in zip(ref_net.neurons, net.neurons):
+            expected = sim.spike_log.get(ref_neuron.uid, [])
+            spikes = result.spikes_of(run, neuron)
+            assert len(spikes) == len(expected)
+            # Delays are rounded to whole steps
+            assert spikes == pytest.approx(expected, abs=0.01 + 1e-9)
+
+
+def test_plan_outputs_and_compilation_cache():
+    def plan():
+        return compile_computation(
+            Scalar(2.0) * Scalar(3.0) + Scalar(0.5) * Scalar(7.0), max_range=100
+        )
+
+    encoder = DataEncoder()
+    compiled = plan()
+    batch = BatchSimulator.init_with_plan(compiled, encoder, dt=0.05)
+    values = [trigger.normalized_value for trigger in compiled.input_triggers]
+    batch.simulate([values, values], 600)
+    compilations = _simulate_batch._cache_size()
+
+    # Same shapes: no new compilation
+    result = batch.simulate([values, values], 600)
+    assert _simulate_batch._cache_size() == compilations
+
+    reference = plan()
+    sim = Simulator.init_with_plan(reference, encoder, dt=0.05)
+    sim.simulate(600)
+    expected = decode_output(sim, reference.output_reader)
+    decoded = result.decode_output(compiled.output_reader)
+    assert decoded == pytest.approx([expected, expected], abs=0.1)
+
+
+def test_missing_outputs_decode_to_nan():
+    encoder = DataEncoder()
+    compiled = compile_computation(Scalar(2.0) * Scalar(3.0), max_range=100)
+    batch = BatchSimulator.init_with_plan(compiled, encoder, dt=0.1)
+    values = [trigger.normalized_value for trigger in compiled.input_triggers]
+    # Too short for the output to fire
+    result = batch.simulate([values], 1.0)
+    assert math.isnan(result.decode_output(compiled.output_reader)[0])
+    assert np.all(np.isinf(result.spike_times[0, :, 2:]))
+
+
+def test_invalid_inputs():
+    encoder = DataEncoder()
+    net = MultiplierNetwork(encoder)
+    with pytest.raises(ValueError, match="at least one input"):
+        BatchSimulator(net, encoder, [])
+    batch = BatchSimulator(net, encoder, [net.input1, net.input2])
+    with pytest.raises(ValueError, match="between 0.0 and 1.0"):
+        batch.simulate([(0.5, 1.5)], 100)
@@ -0,0 +1,88 @@
+import json
+import urllib.request
+
+from axon_sdk import Simulator, PredSimulator
+from axon_sdk.compilation import compile_computation, Scalar
+from axon_sdk.primitives import DataEncoder, DictSpikeSink
+from axon_sdk.visualization.server import stop_server
+from axon_sdk.visualization.stream import StreamingSpikeSink, watch
+
+
+def run(engine, streamed):
+    x, y = Scalar(2.0), Scalar(3.0)
+    plan = compile_computation(Scalar(0.5) * x + Scalar(0.5) * y, max_range=100)
+    if engine is Simulator:
+        sim = Simulator(plan.net, DataEncoder(), dt=0.01)
+    else:
+        sim = PredSimulator(plan.net, DataEncoder(), dt=0.01)
+    for trigger in plan.input_triggers:
+        sim.apply_input_value(trigger.normalized_value, trigger.trigger_neuron)
+
+    stream = watch(sim, open_page=False, interval=0.01, max_events=50) if streamed else None
+    if engine is Simulator:
+        sim.simulate(simulation_time=600)
+    else:
+        sim.simulate()
+    if stream is not None:
+        stream.close()
+    return sim, stream
+
+
+def read_events(port):
+    events = []
+    with urllib.request.urlopen(f"http://localhost:{port}/api/stream") as response:
+        for chunk in response.read().decode().split("\n\n"):
+            lines = dict(line.split(": ", 1) for line in chunk.splitlines() if line[0] != ":")
+            if lines:
+                events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def test_stream_batches_cover_the_run():
+    for engine in (Simulator, PredSimulator):
+        reference, _ = run(engine, streamed=False)
+        sim, stream = run(engine, streamed=True)
+        try:
+            # The run and its spike sink are untouched
+            assert isinstance(sim.spike_sink, DictSpikeSink)
+            # Uids differ between compilations
+            assert list(sim.spike_log.values()) == list(reference.spike_log.values())
+
+            batches = stream.wait(0)
+            assert batches[-1]["final"]
+            assert batches[-1]["spikes"] == len(sim.spike_sink)
+            assert sum(stream.module_spikes) == len(sim.spike_sink)
+            assert batches[-1]["t"] == max(max(t, default=0) for t in sim.spike_log.values())
+            for batch in batches:
+                assert len(batch["events"]) <= 50
+                assert batch["dropped"] + len(batch["events"]) == batch["batch_spikes"]
+                assert sum(batch["activity"].values()) == batch["batch_spikes"]
+            top_level = {sub.uid for sub in sim.net.subnetworks} | {sim.net.uid}
+            assert set(stream.modules) <= top_level
+        finally:
+            stop_server()
+
+
+def test_streaming_sink_clear():
+    inner = DictSpikeSink()
+    inner.record("a", 1.0)
+    sink = StreamingSpikeSink(inner)
+    sink.record("a", 2.0)
+    assert list(sink.pending) == [(0, 1.0), (0, 2.0)]
+
+    sink.clear()
+    assert len(inner) == 0 and not sink.pending
+    assert sink.uids == ["a"]
+
+
+def test_stream_endpoint():
+    sim, stream = run(Simulator, streamed=True)
+    try:
+        events = read_events(stream.port)
+        assert events[0][0] == "init"
+        assert events[0][1]["neurons"] == sim.spike_sink.uids
+        batches = [data for event, data in events[1:]]
+        assert all(event == "batch" for event, _ in events[1:])
+        assert batches[-1]["final"] and batches[-1]["spikes"] == len(sim.spike_sink)
+    finally:
+        stop_server()
@@ -0,0 +1,79 @@
+import warnings
+
+import pytest
+
+from axon_sdk import Simulator, PredSimulator, backends
+from axon_sdk.backends import NUMBA_AVAILABLE, resolve_backend
+from axon_sdk.compilation import compile_computation, Scalar
+from axon_sdk.networks import MultiplierNetwork
+from axon_sdk.primitives import DataEncoder
+
+
+def run(engine, backend, instrument=False, **kwargs):
+    plan = compile_computation(
+        Scalar(2.0) * Scalar(3.0) + Scalar(0.5) * Scalar(7.0), max_range=100
+    )
+    encoder = DataEncoder()
+    if engine is Simulator:
+        sim = Simulator.init_with_plan(plan, encoder, dt=0.05, instrument=instrument)
+    else:
+        sim = PredSimulator(plan.net, encoder, dt=0.01, instrument=instrument)
+        for trigger in plan.input_triggers:
+            sim.apply_input_value(trigger.normalized_value, trigger.trigger_neuron, t0=0)
+    # Without numba the kernels run as plain Python, which still checks them
+    sim.backend = backend
+    sim.simulate(**kwargs)
+    neurons = sim.synapse_table.neurons
+    return sim, [(n.V, n.ge, n.gf, n.gate) for n in neurons]
+
+
+@pytest.mark.parametrize(
+    "engine, kwargs", [(Simulator, {"simulation_time": 300}), (PredSimulator, {})]
+)
+def test_kernels_match_the_python_loops(engine, kwargs):
+    reference, reference_state = run(engine, "python", **kwargs)
+    compiled, compiled_state = run(engine, "numba", **kwargs)
+
+    # uids differ between compilations, but neurons are in the same order
+    assert list(compiled.spike_log.values()) == list(reference.spike_log.values())
+    assert list(compiled.voltage_log.values()) == list(reference.voltage_log.values())
+    assert compiled._processed_counts == reference._processed_counts
+    assert compiled_state == reference_state
+
+
+def test_instrumented_runs_use_the_python_loop():
+    reference, _ = run(Simulator, "python", simulation_time=300)
+    instrumented, _ = run(Simulator, "numba", instrument=True, simulation_time=300)
+    assert list(instrumented.spike_log.values()) == list(reference.spike_log.values())
+    assert instrumented.stats.events_processed == sum(instrumented._processed_counts)
+
+
+def test_state_logs_use_the_python_loop():
+    encoder = DataEncoder()
+    net = MultiplierNetwork(encoder)
+    sim = PredSimulator(net, encoder)
+    sim.backend = "numba"
+    assert sim._compiled_loop_applies()
+    net.output.log_V = []
+    assert not sim._compiled_loop_applies()
+
+
+def test_resolve_backend(monkeypatch):
+    assert resolve_backend("python") == "python"
+    with pytest.raises(ValueError, match="Unknown backend"):
+        resolve_backend("cuda")
+    encoder = DataEncoder()
+    with pytest.raises(ValueError, match="Unknown backend"):
+        Simulator(MultiplierNetwork(encoder), encoder, backend="cuda")
+
+    if NUMBA_AVAILABLE:
+        assert resolve_backend("numba") == "numba"
+
+    # Without numba: falls back to Python, warning once per process
+    monkeypatch.setattr(backends, "NUMBA_AVAILABLE", False)
+    monkeypatch.setattr(backends, "_fallback_warned", False)
+    with pytest.warns(RuntimeWarning, match="numba is not installed"):
+        assert resolve_backend("numba") == "python"
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert resolve_backend("numba") == "python"
@@ -0,0 +1,83 @@
+import pytest
+
+import numpy as np
+
+from axon_sdk.networks import MultiplierNetwork
+from axon_sdk.compilation import compile_computation, generators
+from axon_sdk.primitives import DataEncoder
+from axon_sdk import PredSimulator
+from axon_sdk.instrumentation import module_uids_of
+from axon_sdk.usagereport import HardwareConfig, power_trace, simulate_cycles
+
+
+def instrumented_run(net, inputs):
+    sim = PredSimulator(net, DataEncoder(), instrument=True)
+    for neuron, value in inputs:
+        sim.apply_input_value(value, neuron=neuron, t0=0)
+    sim.simulate()
+    return sim.stats
+
+
+def multiplier_stats():
+    net = MultiplierNetwork(DataEncoder())
+    return instrumented_run(net, [(net.input1, 0.5), (net.input2, 0.4)])
+
+
+def test_energy_matches_aggregate_model():
+    stats = multiplier_stats()
+    config = HardwareConfig(clock_speed_mhz=200)
+    trace = power_trace(stats, num_bins=50, config=config)
+    cycles = simulate_cycles(stats.trace, config)
+
+    static_power = 27e-6 + 178e-6 * 200
+    expected = static_power * cycles.latency_seconds + 12e-12 * cycles.updates
+    assert trace.total_energy == pytest.approx(expected)
+    assert trace.duration == pytest.approx(cycles.latency_seconds)
+    assert trace.average_power == pytest.approx(expected / cycles.latency_seconds)
+
+    assert trace.power.shape == trace.energy.shape == (50,)
+    assert trace.peak_power >= trace.average_power
+    assert np.all(trace.power >= static_power)
+    assert trace.cumulative_energy[-1] == pytest.approx(trace.total_energy)
+
+
+def test_simulation_timebase_and_bin_width():
+    stats = multiplier_stats()
+    trace = power_trace(stats, timebase="simulation", bin_width=0.01)
+    last_event = stats.trace.times[-1] * 1e-3
+    assert trace.bin_edges[-1] == pytest.approx(last_event)
+    assert np.allclose(trace.bin_widths[:-1], 0.01)
+    assert 0 < trace.bin_widths[-1] <= 0.01 + 1e-12
+    assert trace.dynamic_energy.sum() == pytest.approx(
+        power_trace(stats).dynamic_energy.sum()
+    )
+
+
+def test_module_attribution():
+    root, _ = generators.polynomial(degree=2, seed=0)
+    plan = compile_computation(root, max_range=100)
+    stats = instrumented_run(
+        plan.net,
+        [(t.trigger_neuron, t.normalized_value) for t in plan.input_triggers],
+    )
+    innermost = power_trace(stats, num_bins=20)
+
+    # Attribution to the compiled operations
+    neurons = plan.net.neurons
+    trace = power_trace(
+        stats, num_bins=20, module_uids=module_uids_of(plan.net, neurons, max_depth=1)
+    )
+    assert trace.total_energy == pytest.approx(innermost.total_energy)
+    assert len(trace.module_uids) < len(innermost.module_uids)
+
+    per_module = trace.energy_per_module()
+    assert set(per_module) <= {mod.uid for mod in plan.net.subnetworks} | {plan.net.uid}
+    assert sum(per_module.values()) == pytest.approx(trace.dynamic_energy.sum())
+    assert np.allclose(trace.module_energy.sum(axis=0), trace.dynamic_energy)
+    assert trace.as_dict()["energy_per_module"] == per_module
+
+
+def test_invalid_arguments():
+    stats = multiplier_stats()
+    with pytest.raises(ValueError):
+        power_trace(stats, timebase="wall")
@@ -1,5 +1,6 @@
 import pytest
-from axon_sdk.primitives import SpikingNetworkModule, ExplicitNeuron
+from axon_sdk.primitives import SpikingNetworkModule, ExplicitNeuron, SynapseTable
+from axon_sdk.primitives.elements import Synapse, SYNAPSE_TYPES
 
 
 def test_basic_module():
@@ -57,3 +58,95 @@ def test_deeper_module():
 
     assert len(module.neurons) == 3, "module.neurons should contain 3 neurons"
     assert isinstance(module.neurons, list), "module.neurons should be a list"
+
+
+def test_synapse_table():
+    class MockModule(SpikingNetworkModule):
+        def __init__(self):
+            super().__init__()
+            self.n1 = self.add_neuron(Vt=1, tm=1, tf=1, neuron_name="n1")
+            self.n2 = self.add_neuron(Vt=1, tm=1, tf=1, neuron_name="n2")
+            self.n3 = self.add_neuron(Vt=1, tm=1, tf=1, neuron_name="n3")
+            self.connect_neurons(self.n1, self.n2, "V", 1.0, 1.0)
+            self.connect_neurons(self.n1, self.n3, "ge", 0.5, 2.0)
+            self.connect_neurons(self.n3, self.n1, "gate", 1.0, 3.0)
+
+    module = MockModule()
+    table = SynapseTable.from_network(module)
+
+    assert table.num_synapses == 3
+    assert list(table.offsets) == [0, 2, 2, 3]
+    assert list(table.post) == [1, 2, 0]
+    assert [SYNAPSE_TYPES[c] for c in table.types] == ["V", "ge", "gate"]
+    assert list(table.delays) == [1.0, 2.0, 3.0]
+    assert table.fanout(0) == (0, 2)
+    assert table.index_of(module.n3) == 2
+
+
+def test_synapse_list_views():
+    pre = ExplicitNeuron(Vt=1, tm=1, tf=1)
+    post = ExplicitNeuron(Vt=1, tm=1, tf=1)
+    pre.out_synapses.add(post, "gf", 2.0, 1.5)
+    pre.out_synapses.append(Synapse(pre, post, weight=1.0, delay=1.0, synapse_type="V"))
+
+    synapses = list(pre.out_synapses)
+    assert len(pre.out_synapses) == 2
+    assert synapses[0].post_neuron is post
+    assert synapses[0].type == "gf"
+    assert synapses[0] == pre.out_synapses[0]
+    assert synapses[0].uid != synapses[1].uid
+
+    with pytest.raises(ValueError):
+        pre.out_synapses.add(post, "unknown", 1.0, 1.0)
+
+
+def test_synapse_table_rejects_outside_neurons():
+    class MockModule(SpikingNetworkModule):
+        def __init__(self):
+            super().__init__()
+            self.n1 = self.add_neuron(Vt=1, tm=1, tf=1, neuron_name="n1")
+
+    module = MockModule()
+    outsider = ExplicitNeuron(Vt=1, tm=1, tf=1)
+    module.connect_neurons(module.n1, outsider, "V", 1.0, 1.0)
+
+    with pytest.raises(ValueError):
+        SynapseTable.from_network(module)
+
+
+def test_neuron_uid_and_state_logs():
+    neuron = ExplicitNeuron(Vt=1, tm=1, tf=1, neuron_name="n", parent_mod_id=7)
+
+    assert neuron.uid.startswith("(m7,n")
+    assert neuron.uid.endswith(")_n")
+    assert neuron.log_V is None
+    assert not hasattr(neuron, "__dict__")
+
+    neuron.enable_state_logs()
+    neuron.receive_synaptic_event_pred("ge", 0.5, t0=1.0)
+    neuron.receive_synaptic_event_pred("V", 0.1, t0=2.0)
+    assert len(neuron.log_V) == 3
+    assert neuron.log_ge[-1] == (0.5, 2.0)
+
+
+def test_reset_state():
+    class MockModule(SpikingNetworkModule):
+        def __init__(self):
+            super().__init__()
+            self.neuron = self.add_neuron(Vt=1, tm=1, tf=1, Vreset=0.2)
+            self.sub = SpikingNetworkModule()
+            self.sub.logged = self.sub.add_neuron(Vt=1, tm=1, tf=1)
+            self.add_subnetwork(self.sub)
+
+    module = MockModule()
+    module.sub.logged.enable_state_logs()
+    for neuron in module.neurons:
+        neuron.receive_synaptic_event_pred("ge", 0.5, t0=1.0)
+        neuron.receive_synaptic_event_pred("gate", 1, t0=2.0)
+
+    module.reset_state()
+    for neuron in module.neurons:
+        assert (neuron.V, neuron.ge, neuron.gf, neuron.gate) == (neuron.Vreset, 0, 0, 0)
+        assert neuron._last_synapse_time == 0
+    assert module.neuron.log_V is None
+    assert module.sub.logged.log_V == [(0.0, 0)]
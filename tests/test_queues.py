@@ -144,4 +144,17 @@ def test_len_empty_queue():
     queue.remove(ev2)
     queue.remove(ev3)
 
-    assert len(queue) == 0
\ No newline at end of file
+    assert len(queue) == 0
+
+def test_next_time_skips_removed_events():
+    queue = CancelableEventQueue()
+    neu1 = ExplicitNeuron(Vt=1, tm=0.0, tf=0.0)
+    ev1 = SpikeHitEvent(t=1.0, hitNeuron=neu1, synapse_type="V", weight=0.0)
+    ev2 = SpikeHitEvent(t=2.0, hitNeuron=neu1, synapse_type="V", weight=0.0)
+    assert queue.next_time() is None
+    queue.add_event(ev1)
+    queue.add_event(ev2)
+    assert queue.next_time() == 1.0
+    queue.remove(ev1)
+    assert queue.next_time() == 2.0
+    assert queue.pop_with_time() == (2.0, [ev2])
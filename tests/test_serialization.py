@@ -0,0 +1,98 @@
+import pytest
+
+from axon_sdk.primitives import DataEncoder, SpikingNetworkModule
+from axon_sdk.networks import MemoryNetwork, LinearCombinatorNetwork
+from axon_sdk.compilation import Scalar, compile_computation
+from axon_sdk.serialization import (
+    save_network,
+    save_plan,
+    load_image,
+    load_network,
+    load_plan,
+)
+from axon_sdk import Simulator, decode_output
+
+
+def synapse_table(net):
+    return [
+        (syn.pre_neuron.uid, syn.post_neuron.uid, syn.type, syn.weight, syn.delay, syn.uid)
+        for neuron in net.neurons
+        for syn in neuron.out_synapses
+    ]
+
+
+def test_network_roundtrip(tmp_path):
+    encoder = DataEncoder()
+    net = LinearCombinatorNetwork(encoder, N=2, coeff=[0.5, -0.25])
+    path = str(tmp_path / "net.axn")
+    save_network(net, path)
+
+    image = load_image(path)
+    assert image.num_neurons == len(net.neurons)
+    assert image.num_synapses == len(synapse_table(net))
+    assert image.uids == [n.uid for n in net.neurons]
+
+    loaded = load_network(path)
+    assert type(loaded) is LinearCombinatorNetwork
+    assert loaded.uid == net.uid
+    assert [n.uid for n in loaded.neurons] == [n.uid for n in net.neurons]
+    assert [s.uid for s in loaded.subnetworks] == [s.uid for s in net.subnetworks]
+    assert synapse_table(loaded) == synapse_table(net)
+    assert loaded.output_plus.uid == net.output_plus.uid
+    assert loaded.encoder.Tcod == encoder.Tcod
+
+
+def test_loaded_module_simulates(tmp_path):
+    encoder = DataEncoder()
+    path = str(tmp_path / "mem.axn")
+    save_network(MemoryNetwork(encoder), path)
+    net = load_network(path)
+
+    sim = Simulator(net, encoder, dt=0.01)
+    sim.apply_input_value(0.4, neuron=net.input, t0=0)
+    sim.apply_input_spike(neuron=net.recall, t=200)
+    sim.simulate(simulation_time=350)
+
+    spikes = sim.spike_log[net.output.uid]
+    assert encoder.decode_interval(spikes[1] - spikes[0]) == pytest.approx(0.4, abs=1e-2)
+
+
+def test_plan_roundtrip(tmp_path):
+    out = (Scalar(2.0) + Scalar(-3.0)) * Scalar(4.0)
+    plan = compile_computation(out, max_range=100)
+    path = str(tmp_path / "plan.axn")
+    save_plan(plan, path)
+
+    loaded = load_plan(path)
+    assert len(loaded.input_triggers) == len(plan.input_triggers)
+    assert loaded.output_reader.normalization == 100
+
+    outputs = []
+    for p in [plan, loaded]:
+        sim = Simulator.init_with_plan(p, DataEncoder(), dt=0.01)
+        sim.simulate(simulation_time=600)
+        outputs.append(decode_output(sim, p.output_reader))
+
+    assert outputs[0] is not None
+    assert outputs[0] == outputs[1]
+
+
+def test_rejects_foreign_file(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"not a network file")
+    with pytest.raises(ValueError):
+        load_image(str(path))
+
+
+def test_rejects_unencodable_attributes(tmp_path):
+    encoder = DataEncoder()
+    net = MemoryNetwork(encoder)
+    net.calibration = {"gain": 1.0}
+    with pytest.raises(ValueError, match="'calibration' of MemoryNetwork"):
+        save_network(net, str(tmp_path / "net.axn"))
+
+    # Ports must belong to the serialized network
+    top = SpikingNetworkModule()
+    top.port = net.input
+    with pytest.raises(ValueError, match="'port' of SpikingNetworkModule"):
+        save_network(top, str(tmp_path / "top.axn"))
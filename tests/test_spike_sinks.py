@@ -0,0 +1,123 @@
+import json
+import os
+
+import pytest
+
+from axon_sdk.primitives import (
+    DataEncoder,
+    DictSpikeSink,
+    ArraySpikeSink,
+    RingBufferSpikeSink,
+    MemmapSpikeSink,
+    SpikeSink,
+)
+from axon_sdk.networks import MemoryNetwork
+from axon_sdk import Simulator, PredSimulator
+
+
+def fill(sink):
+    sink.register("a")
+    sink.register("b")
+    sink.record("a", 1.0)
+    sink.record("b", 2.0)
+    sink.record("a", 3.0)
+    sink.record("c", 4.0)
+    return sink
+
+
+@pytest.mark.parametrize("make_sink", [DictSpikeSink, ArraySpikeSink])
+def test_in_memory_sinks(make_sink):
+    sink = fill(make_sink())
+
+    assert sink.as_dict() == {"a": [1.0, 3.0], "b": [2.0], "c": [4.0]}
+    assert sink.spikes_of("a") == [1.0, 3.0]
+    assert sink.spikes_of("missing") == []
+    assert len(sink) == 4
+
+
+def test_sinks_implement_the_interface():
+    class Incomplete(SpikeSink):
+        def record_id(self, neuron_id, t):
+            pass
+
+    with pytest.raises(TypeError, match="abstract methods"):
+        Incomplete()
+
+
+def test_ring_buffer_keeps_latest_spikes():
+    sink = fill(RingBufferSpikeSink(capacity=3))
+
+    assert sink.as_dict() == {"a": [3.0], "b": [2.0], "c": [4.0]}
+    assert len(sink) == 3
+    assert sink.dropped == 1
+
+
+def test_memmap_sink_roundtrip(tmp_path):
+    path = str(tmp_path / "spikes.bin")
+    sink = fill(MemmapSpikeSink(path, buffer_size=2))
+    assert len(sink) == 4
+    sink.close()
+
+    reopened = MemmapSpikeSink(path, mode="a")
+    reopened.record("b", 5.0)
+
+    assert reopened.uids == ["a", "b", "c"]
+    assert reopened.as_dict() == {"a": [1.0, 3.0], "b": [2.0, 5.0], "c": [4.0]}
+    assert reopened.spikes_of("b") == [2.0, 5.0]
+    reopened.close()
+
+
+def test_memmap_index_written_on_new_neurons(tmp_path):
+    path = str(tmp_path / "spikes.bin")
+    sink = fill(MemmapSpikeSink(path, buffer_size=2))
+    sink.flush()
+    os.remove(sink.index_path)
+
+    sink.record("a", 5.0)
+    sink.flush()
+    assert sink.as_dict()["a"] == [1.0, 3.0, 5.0]
+    assert not os.path.exists(sink.index_path)
+
+    sink.register("d")
+    sink.close()
+    with open(sink.index_path) as f:
+        assert json.load(f) == ["a", "b", "c", "d"]
+
+
+@pytest.mark.parametrize("kind", ["dict", "array", "ring", "memmap"])
+def test_clear_keeps_registered_neurons(kind, tmp_path):
+    sink = {
+        "dict": DictSpikeSink,
+        "array": ArraySpikeSink,
+        "ring": lambda: RingBufferSpikeSink(capacity=3),
+        "memmap": lambda: MemmapSpikeSink(str(tmp_path / "spikes.bin"), buffer_size=2),
+    }[kind]()
+    fill(sink)
+    sink.clear()
+    assert len(sink) == 0
+    assert sink.uids == ["a", "b", "c"]
+    assert sink.spikes_of("a") == []
+
+    sink.record("b", 5.0)
+    assert sink.as_dict() == {"a": [], "b": [5.0], "c": []}
+    sink.close()
+
+
+@pytest.mark.parametrize("sim_cls, dt", [(Simulator, 0.01), (PredSimulator, 0.01)])
+def test_simulators_with_sink(sim_cls, dt, tmp_path):
+    encoder = DataEncoder(Tmin=10.0, Tcod=100.0)
+
+    logs = []
+    for sink in [None, ArraySpikeSink(), MemmapSpikeSink(str(tmp_path / "s.bin"))]:
+        net = MemoryNetwork(encoder)
+        sim = sim_cls(net, encoder, dt=dt, spike_sink=sink)
+        sim.apply_input_value(0.3, neuron=net.input, t0=0)
+        sim.apply_input_spike(neuron=net.recall, t=200)
+        if sim_cls is Simulator:
+            sim.simulate(simulation_time=350)
+        else:
+            sim.simulate()
+        logs.append(list(sim.spike_log.values()))
+
+    assert logs[0] == logs[1] == logs[2]
+    assert len(logs[0][-1]) == 2
@@ -0,0 +1,95 @@
+import json
+import urllib.request
+
+from axon_sdk.compilation import compile_computation, Scalar
+from axon_sdk.visualization.hierarchy import TopologyIndex, layered_layout, page
+from axon_sdk.visualization.server import start_server, stop_server
+
+
+def compiled_net():
+    x, y = Scalar(2.0), Scalar(3.0)
+    return compile_computation(Scalar(0.5) * x + Scalar(0.5) * y, max_range=100).net
+
+
+def test_collapsed_and_expanded_views():
+    net = compiled_net()
+    topology = TopologyIndex(net)
+    assert topology.num_neurons[net.uid] == len(net.neurons)
+
+    view = topology.view()
+    top = {sub.uid for sub in net.subnetworks}
+    modules = {n["id"] for n in view["nodes"] if n["kind"] == "module"}
+    assert modules == top
+    assert view["containers"] == []
+    # Merged edges account for every synapse between different modules
+    crossing = sum(
+        1
+        for pre, post, _ in topology.synapses
+        if topology.visible_node(pre, frozenset([net.uid]))
+        != topology.visible_node(post, frozenset([net.uid]))
+    )
+    assert sum(edge["count"] for edge in view["edges"]) == crossing
+
+    sub = net.subnetworks[0]
+    expanded = topology.view([sub.uid])
+    ids = {n["id"] for n in expanded["nodes"]}
+    assert sub.uid not in ids
+    assert {child["id"] for child in topology.module_children(sub.uid)} <= ids
+    assert [c["id"] for c in expanded["containers"]][0] == sub.uid
+    for edge in expanded["edges"]:
+        assert edge["source"] in ids and edge["target"] in ids
+        assert edge["count"] == sum(edge["types"].values())
+
+    # Fully expanded: one node per neuron
+    full = topology.view(topology.modules)
+    assert len(full["nodes"]) == len(net.neurons)
+    assert all(n["kind"] == "neuron" for n in full["nodes"])
+
+
+def test_views_are_canonical_and_cached():
+    net = compiled_net()
+    topology = TopologyIndex(net)
+    inner = next(uid for uid, parent in topology.parent.items() if parent not in (None, net.uid))
+    # A module whose parent is collapsed is not expanded
+    assert topology.canonical([inner, "unknown"]) == frozenset([net.uid])
+    assert topology.view([inner]) is topology.view([])
+
+
+def test_layered_layout():
+    positions = layered_layout(["a", "b", "c", "d"], [("a", "b"), ("b", "c"), ("a", "d")])
+    assert positions["a"][0] < positions["b"][0] < positions["c"][0]
+    assert positions["d"][0] == positions["b"][0]
+    assert positions["b"][1] != positions["d"][1]
+
+    # Cycles do not prevent the layering
+    positions = layered_layout(["a", "b", "c"], [("a", "b"), ("b", "c"), ("c", "a")])
+    assert len({x for x, _ in positions.values()}) == 3
+
+
+def test_page():
+    items = list(range(10))
+    assert page(items, 8, 5) == {"offset": 8, "limit": 5, "total": 10, "items": [8, 9]}
+    assert page(items, -3, 0)["items"] == [0]
+
+
+def test_server_endpoints():
+    net = compiled_net()
+    topology = TopologyIndex(net)
+    port = start_server(None, topology, page="hierarchy.html", open_page=False)
+    try:
+        base = f"http://localhost:{port}"
+        with urllib.request.urlopen(f"{base}/api/root") as response:
+            root = json.load(response)
+        assert root["uid"] == net.uid and root["neurons"] == len(net.neurons)
+
+        sub = net.subnetworks[0].uid
+        url = f"{base}/api/view/nodes?expanded={sub}&offset=0&limit=2"
+        with urllib.request.urlopen(url) as response:
+            nodes = json.load(response)
+        assert nodes["total"] == len(topology.view([sub])["nodes"])
+        assert len(nodes["items"]) == 2
+
+        with urllib.request.urlopen(f"{base}/hierarchy.html") as response:
+            assert b"hierarchy.js" in response.read()
+    finally:
+        stop_server()
@@ -0,0 +1,133 @@
+import csv
+import io
+import json
+
+import pytest
+
+from axon_sdk.networks import MultiplierNetwork
+from axon_sdk.compilation import compile_computation, Scalar
+from axon_sdk.primitives import DataEncoder
+from axon_sdk import PredSimulator
+from axon_sdk.usagereport import (
+    CalibrationDB,
+    HardwareConfig,
+    UsageReport,
+    aggregate_reports,
+    benchmark_simulation,
+    net_report,
+    report_energy_and_latency_for_simulation,
+    simulation_report,
+    write_csv,
+    write_json,
+)
+from axon_sdk.usagereport.power_metrics import (
+    estimate_performance,
+    estimate_power_and_energy,
+)
+
+
+def multiplier_run(a, b, instrument=False):
+    encoder = DataEncoder()
+    net = MultiplierNetwork(encoder)
+    sim = PredSimulator(net, encoder, instrument=instrument)
+    sim.apply_input_value(a, neuron=net.input1, t0=0)
+    sim.apply_input_value(b, neuron=net.input2, t0=0)
+    sim.simulate()
+    return sim
+
+
+def test_raw_power_and_energy():
+    perf = estimate_performance(100, 10, 5, 2, 5000, 200)
+    raw = estimate_power_and_energy(perf, 200, formatted=False)
+    formatted = estimate_power_and_energy(perf, 200)
+    assert set(raw) == set(formatted)
+    assert all(isinstance(v, float) for v in raw.values())
+    assert raw["P_total"] == pytest.approx(raw["P_leak"] + raw["P_idle"] + raw["P_dynamic"])
+    assert raw["E_total"] == pytest.approx(raw["P_total"] * perf["time_seconds"])
+    assert formatted["P_leak"] == "27.000 μW"
+
+
+def test_simulation_report_fields():
+    sim = multiplier_run(0.5, 0.4, instrument=True)
+    report = simulation_report(sim, config=HardwareConfig(num_cores=2))
+
+    counts = sim._processed_synapses_log
+    assert not report.estimated
+    assert report.neuron_usage.neurons == len(sim.net.neurons)
+    assert report.spikes.total == sum(len(s) for s in sim.spike_log.values())
+    assert report.energy.v_updates == counts["V"]
+    assert report.energy.gm_updates == counts["gate"]
+    assert report.cycles.config.num_cores == 2
+
+    data = json.loads(report.to_json())
+    assert data["energy"]["E_total"] == report.energy.E_total
+    assert data["cycles"]["num_cores"] == 2
+
+    row = report.as_row()
+    assert row["E_total"] == report.energy.E_total
+    assert row["cycles_total_cycles"] == report.cycles.total_cycles
+
+
+def test_printers_return_reports(capsys):
+    sim = multiplier_run(0.5, 0.4)
+    energy = report_energy_and_latency_for_simulation(sim)
+    assert "Latency per iteration" in capsys.readouterr().out
+    assert energy.latency_seconds > 0
+
+    report = benchmark_simulation(sim)
+    assert isinstance(report, UsageReport)
+    assert report.cycles is None
+    assert "SIMULATION BENCHMARK REPORT" in capsys.readouterr().out
+
+
+def test_unfinished_simulation():
+    net = MultiplierNetwork(DataEncoder())
+    sim = PredSimulator(net, DataEncoder())
+    with pytest.raises(ValueError):
+        simulation_report(sim)
+
+
+def test_net_report_is_estimated(tmp_path):
+    x, y = Scalar(2.0), Scalar(3.0)
+    plan = compile_computation(x * y + x, max_range=100)
+    db = CalibrationDB(str(tmp_path / "calibration.json"), samples=2)
+
+    report = net_report(plan.net, db, name="xy_plus_x")
+    assert report.estimated
+    assert report.name == "xy_plus_x"
+    assert set(report.spikes.per_module) == {m.uid for m in plan.net.subnetworks}
+    assert report.spikes.total == pytest.approx(sum(report.spikes.per_module.values()))
+
+
+def test_batch_export_and_aggregation(tmp_path):
+    values = [0.2, 0.5, 0.9]
+    reports = [
+        simulation_report(multiplier_run(v, 0.5), meta={"a": v, "group": i % 2})
+        for i, v in enumerate(values)
+    ]
+
+    summary = aggregate_reports(reports)
+    energies = [r.energy.E_total for r in reports]
+    assert summary["E_total"]["count"] == 3
+    assert summary["E_total"]["mean"] == pytest.approx(sum(energies) / 3)
+    assert summary["E_total"]["max"] == max(energies)
+    assert summary["a"]["sum"] == pytest.approx(sum(values))
+    # Flags and names aren't aggregated
+    assert "estimated" not in summary and "name" not in summary
+
+    grouped = aggregate_reports(reports, by="group")
+    assert grouped[0]["E_total"]["count"] == 2
+    assert grouped[1]["E_total"]["count"] == 1
+
+    buffer = io.StringIO()
+    write_csv(reports, buffer)
+    rows = list(csv.DictReader(io.StringIO(buffer.getvalue())))
+    assert len(rows) == 3
+    assert float(rows[1]["E_total"]) == pytest.approx(energies[1])
+    assert float(rows[2]["a"]) == 0.9
+
+    path = str(tmp_path / "reports.json")
+    write_json(reports, path)
+    with open(path) as f:
+        data = json.load(f)
+    assert [d["meta"]["a"] for d in data] == values
@@ -0,0 +1,112 @@
+import math
+
+import pytest
+
+from axon_sdk import Simulator
+from axon_sdk.compilation import compile_computation, Scalar
+from axon_sdk.engine import ENGINES, EngineSpec
+from axon_sdk.networks import MultiplierNetwork
+from axon_sdk.primitives import DataEncoder
+from axon_sdk.validation import (
+    ValidationCase,
+    generated_cases,
+    module_cases,
+    validate_corpus,
+    validate_engines,
+)
+
+LATENESS = 1.0
+
+
+class LateSimulator(Simulator):
+    # Input spikes arrive late: every run diverges from its first input spike
+    def apply_input_spike(self, neuron, t):
+        super().apply_input_spike(neuron, t + LATENESS)
+
+
+def multiplier_case():
+    encoder = DataEncoder()
+    net = MultiplierNetwork(encoder)
+    inputs = [(net.input1, 0.4), (net.input2, 0.7)]
+    return ValidationCase("multiplier", net, inputs, 400, encoder)
+
+
+def test_equivalent_engines_pass(capsys):
+    report = validate_engines(
+        multiplier_case(), engines=["timestep", "timestep-numba"], reference="timestep"
+    )
+    assert report.passed
+    assert [run.engine for run in report.runs] == ["timestep", "timestep-numba"]
+    assert all(run.divergence is None and run.spikes > 0 for run in report.runs)
+    assert report.run_of("timestep").spikes == report.run_of("timestep-numba").spikes
+
+    report.print()
+    out = capsys.readouterr().out
+    assert "multiplier: passed (reference timestep)" in out
+    assert " s (" in out
+
+
+def test_first_divergence(monkeypatch):
+    monkeypatch.setitem(ENGINES, "late", EngineSpec("late", LateSimulator, {}))
+    case = multiplier_case()
+    report = validate_engines(case, engines=["late"], reference="timestep")
+    assert not report.passed
+    # The reference is run too, first
+    assert [run.engine for run in report.runs] == ["timestep", "late"]
+    assert report.failures() == [report.run_of("late")]
+
+    divergence = report.run_of("late").divergence
+    t_input = case.encoder.encode_value(0.4)[0]
+    assert divergence.neuron == case.net.input1.uid
+    assert divergence.t == pytest.approx(t_input)
+    assert divergence.reference_spike == pytest.approx(t_input)
+    assert divergence.spike == pytest.approx(t_input + LATENESS)
+    assert set(divergence.state) == {"timestep", "late"}
+    assert "neuron " + case.net.input1.uid in divergence.describe()
+
+
+def test_plan_outputs_and_default_duration():
+    plan = compile_computation(Scalar(2.0) * Scalar(3.0), max_range=100)
+    case = ValidationCase.from_plan("product", plan)
+    report = validate_engines(
+        case, engines=["predictive", "predictive-numba"], reference="predictive"
+    )
+    assert report.passed
+    numba_run = report.run_of("predictive-numba")
+    assert numba_run.decoded == pytest.approx(6.0, abs=0.1)
+    assert numba_run.output_error == 0.0
+    assert report.output_tolerance > 0
+
+
+def test_corpus():
+    cases = module_cases(seed=1)
+    assert len({case.name for case in cases}) == len(cases)
+    assert all(case.inputs for case in cases)
+
+    reports = validate_corpus(
+        cases[:2], print_reports=False, engines=["timestep-numba"], dt=0.05
+    )
+    assert [report.case for report in reports] == [case.name for case in cases[:2]]
+    assert all(report.passed for report in reports)
+    assert all(math.isfinite(run.wall_time) for report in reports for run in report.runs)
+
+
+def test_generated_case_against_its_exact_value():
+    case = next(case for case in generated_cases() if case.name == "polynomial")
+    report = validate_engines(case, engines=["timestep-exact", "predictive"])
+    assert report.reference == "timestep-exact"
+    exact, predictive = report.runs
+
+    # Exact integration reproduces the value of the expression
+    assert exact.decoded == pytest.approx(case.expected, abs=1e-6)
+    assert exact.output_error <= report.output_tolerance
+    # The predictive engine drifts along the plan without diverging, but its
+    # output is off at this step
+    assert predictive.divergence is None
+    assert report.failures() == [predictive]
+    assert abs(predictive.decoded - case.expected) == predictive.output_error
+
+    relaxed = validate_engines(
+        case, engines=["timestep-exact", "predictive"], output_tolerance=1.0
+    )
+    assert relaxed.passed